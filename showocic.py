@@ -46,6 +46,19 @@ import datetime
 import time
 import os
 import platform
+import threading
+import copy
+import io
+import random
+import asyncio
+import concurrent.futures
+
+# aiohttp is optional, required for -async only
+try:
+    import aiohttp
+    import yarl
+except ImportError:
+    aiohttp = None
 
 version = "21.07.13"
 oci_compatible_version = "2.40.0"
@@ -80,6 +93,48 @@ class ShowOCIFlags(object):
     use_instance_principals = False
     use_delegation_token = False
 
+    # number of regions to load in parallel
+    threads_regions = 1
+
+    # number of compartment list calls to run in parallel
+    threads_compartments = 1
+
+    # number of region loaders to run in parallel
+    threads_loaders = 1
+
+    # number of concurrent asyncio get calls, 0 = synchronous calls
+    async_calls = 0
+
+    # connections pool size of the SDK clients, 0 = by the parallel threads
+    connections = 0
+
+    # file to persist the images cache across runs
+    image_cache_file = ""
+
+    # file to persist the shapes catalog across runs
+    shape_cache_file = ""
+
+    # list db homes once per compartment instead of per db system
+    db_bulk = False
+
+    # list private and public ips once per subnet and compartment instead of per vnic
+    ip_bulk = False
+
+    # file to persist the compartments seen empty per resource across runs
+    empty_cache_file = ""
+
+    # hours to skip a compartment seen empty before listing it again
+    empty_cache_hours = 24
+
+    # percent of the compartments seen empty listed again on every run to re-verify them
+    empty_cache_sample = 10
+
+    # discover the compartments of the resources by resource search
+    search = False
+
+    # resource search endpoint, i.e. local stand-in for testing
+    search_endpoint = ""
+
     # pyton and host info
     machine = platform.node() + " (" + platform.machine() + ")"
     python = platform.python_version()
@@ -102,6 +157,17 @@ class ShowOCIFlags(object):
                 self.read_database
                 )
 
+    ############################################
+    # check if the API calls run concurrently
+    ############################################
+    def is_concurrent_calls(self):
+        return (self.threads_regions > 1 or
+                self.threads_compartments > 1 or
+                self.threads_loaders > 1 or
+                self.async_calls > 0 or
+                self.connections > 0
+                )
+
     ############################################
     # check if to load basic network (vcn+subnets)
     ############################################
@@ -111,6 +177,379 @@ class ShowOCIFlags(object):
                 self.read_database)
 
 
+###########################################################################################################
+# class ShowOCIThreadOutput
+# replace sys.stdout while regions or loaders run in parallel
+# each thread print to its own buffer which is flushed at once
+# when the region or loader completed, other threads print directly
+###########################################################################################################
+class ShowOCIThreadOutput(object):
+
+    ############################################
+    # Init
+    ############################################
+    def __init__(self, stdout):
+        self.stdout = stdout
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    ############################################
+    # install as sys.stdout
+    ############################################
+    @classmethod
+    def install(cls):
+        output = cls(sys.stdout)
+        sys.stdout = output
+        return output
+
+    ############################################
+    # restore the original sys.stdout
+    ############################################
+    def uninstall(self):
+        sys.stdout = self.stdout
+
+    ############################################
+    # start buffering for the current thread
+    ############################################
+    def start_buffer(self):
+        self.local.buffer = io.StringIO()
+
+    ############################################
+    # end buffering and return the buffered text
+    ############################################
+    def end_buffer(self):
+        buffer = getattr(self.local, 'buffer', None)
+        self.local.buffer = None
+        return "" if buffer is None else buffer.getvalue()
+
+    ############################################
+    # flush the buffer of the current thread
+    ############################################
+    def flush_buffer(self):
+        text = self.end_buffer()
+        with self.lock:
+            self.stdout.write(text)
+            self.stdout.flush()
+
+    ############################################
+    # write to buffer or to stdout
+    ############################################
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        if buffer is not None:
+            return buffer.write(text)
+        with self.lock:
+            return self.stdout.write(text)
+
+    ############################################
+    # flush
+    ############################################
+    def flush(self):
+        if getattr(self.local, 'buffer', None) is None:
+            self.stdout.flush()
+
+
+###########################################################################################################
+# class ShowOCIAsyncCalls
+# send OCI SDK get calls concurrently on asyncio event loop using aiohttp
+# the SDK client prepares the request (endpoint, path, headers and response type),
+# the request is signed by the client signer and the response deserialized by the client
+# so the data returned is the same as the synchronous call
+###########################################################################################################
+class ShowOCIAsyncCalls(object):
+
+    # retry on throttling and server errors
+    retry_status = [429, 500, 502, 503, 504]
+    retry_attempts = 3
+
+    ############################################
+    # request captured from the SDK client
+    ############################################
+    class CapturedRequest(Exception):
+        def __init__(self, request):
+            super(ShowOCIAsyncCalls.CapturedRequest, self).__init__("captured request")
+            self.request = request
+
+    ############################################
+    # Init
+    ############################################
+    def __init__(self, concurrency, proxy="", throttle=None):
+        self.concurrency = concurrency
+        self.throttle = throttle
+        self.released = None
+        self.proxy = None
+        if proxy:
+            self.proxy = proxy if "://" in proxy else "http://" + proxy
+
+    ############################################
+    # run the get function for all ids
+    # return dict of id -> future with the data
+    ############################################
+    def run(self, function, ids, **kwargs):
+
+        results = {}
+        requests = {}
+
+        # capture the requests by SDK client copy which does not send them
+        base_client = function.__self__.base_client
+        capture_function = getattr(self.__capture_client(function.__self__), function.__name__)
+        for item_id in ids:
+            results[item_id] = concurrent.futures.Future()
+            try:
+                response = capture_function(item_id, **kwargs)
+                results[item_id].set_result(response.data)
+            except ShowOCIAsyncCalls.CapturedRequest as e:
+                requests[item_id] = e.request
+            except Exception as e:
+                results[item_id].set_exception(e)
+
+        # send the requests
+        if requests:
+            responses = asyncio.run(self.__send_all(base_client, requests))
+            for item_id, response in zip(requests, responses):
+                if isinstance(response, Exception):
+                    results[item_id].set_exception(response)
+                else:
+                    results[item_id].set_result(response.data)
+
+        return results
+
+    ############################################
+    # copy of the client which capture the request
+    ############################################
+    def __capture_client(self, client):
+
+        def capture_request(request, *args, **kwargs):
+            raise ShowOCIAsyncCalls.CapturedRequest(request)
+
+        capture = copy.copy(client)
+        capture.base_client = copy.copy(client.base_client)
+        capture.base_client.request = capture_request
+        return capture
+
+    ############################################
+    # send all the requests, return the responses or exceptions in order
+    ############################################
+    async def __send_all(self, base_client, requests):
+
+        # the throttle releases of all the threads wake up the requests waiting for in-flight slot
+        loop = asyncio.get_running_loop()
+        self.released = loop.create_future()
+
+        def listener():
+            loop.call_soon_threadsafe(self.__set_released)
+
+        if self.throttle:
+            self.throttle.add_listener(listener)
+
+        try:
+            timeout = base_client.timeout if isinstance(base_client.timeout, tuple) else (base_client.timeout, base_client.timeout)
+            connector = aiohttp.TCPConnector(limit=self.concurrency)
+            async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])) as session:
+                return await asyncio.gather(*[self.__send(session, base_client, request) for request in requests.values()], return_exceptions=True)
+
+        finally:
+            if self.throttle:
+                self.throttle.remove_listener(listener)
+
+    ############################################
+    # wake up the requests waiting for release, run on the event loop
+    ############################################
+    def __set_released(self):
+        released, self.released = self.released, asyncio.get_running_loop().create_future()
+        if not released.done():
+            released.set_result(True)
+
+    ############################################
+    # sign and send single request
+    ############################################
+    async def __send(self, session, base_client, request):
+
+        signer = base_client.signer if request.enforce_content_headers else base_client.signer.without_content_headers
+
+        for attempt in range(self.retry_attempts):
+
+            # sign the request, signed on every attempt for the date header
+            prepared = oci._vendor.requests.Request(
+                request.method,
+                request.url,
+                params=request.query_params,
+                headers=request.header_params,
+                data=request.body
+            ).prepare()
+            signer(prepared)
+
+            # wait for in-flight slot of the endpoint, the released future
+            # is taken before acquire so a release in between is not missed
+            start_time = None
+            while self.throttle and start_time is None:
+                released = self.released
+                start_time = self.throttle.acquire(base_client.endpoint, wait=False)
+                if start_time is None:
+                    await released
+
+            status = None
+            try:
+                async with session.request(prepared.method, yarl.URL(prepared.url, encoded=True), headers=dict(prepared.headers), data=prepared.body, proxy=self.proxy) as response:
+                    status = response.status
+                    headers = dict(response.headers)
+                    content = await response.read()
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise oci.exceptions.RequestException(str(e) + " - Request Endpoint: " + request.method + " " + request.url)
+
+            finally:
+                if self.throttle:
+                    self.throttle.release(base_client.endpoint, start_time, status == 429)
+
+            if status in self.retry_status and attempt < self.retry_attempts - 1:
+                await asyncio.sleep(2 ** attempt + random.random())
+                continue
+
+            break
+
+        # raise service error like the SDK client
+        if not 200 <= status <= 299:
+            error = base_client.deserialize_response_data(content, 'object')
+            code = error.get('code') if isinstance(error, dict) else None
+            message = error.get('message') if isinstance(error, dict) else error
+            raise oci.exceptions.ServiceError(status, code, headers, message, original_request=request)
+
+        data = base_client.deserialize_response_data(content, request.response_type) if request.response_type else None
+        return oci.response.Response(status, headers, data, request)
+
+
+###########################################################################################################
+# class ShowOCIThrottle
+# adaptive concurrency (AIMD) per service endpoint for all the API calls
+# the in-flight limit is increased additively while calls succeed at the limit
+# and decreased multiplicatively on TooManyRequests (429) responses
+###########################################################################################################
+class ShowOCIThrottle(object):
+
+    initial_limit = 4
+    increase = 1.0
+    decrease = 0.5
+
+    ############################################
+    # Init
+    ############################################
+    def __init__(self, max_limit):
+        self.max_limit = max(1, max_limit)
+        self.condition = threading.Condition()
+        self.start_time = time.time()
+        self.endpoints = {}
+        self.listeners = []
+
+    ############################################
+    # endpoint state, must be called with the condition
+    ############################################
+    def __get_endpoint(self, endpoint):
+        if endpoint not in self.endpoints:
+            limit = float(min(self.initial_limit, self.max_limit))
+            self.endpoints[endpoint] = {
+                'limit': limit,
+                'inflight': 0,
+                'max_inflight': 0,
+                'calls': 0,
+                'throttled': 0,
+                'decreased': 0.0,
+                'history': [(0.0, int(limit))]
+            }
+        return self.endpoints[endpoint]
+
+    ############################################
+    # acquire in-flight slot, return the start time
+    # if wait is False return None when no slot
+    ############################################
+    def acquire(self, endpoint, wait=True):
+        with self.condition:
+            state = self.__get_endpoint(endpoint)
+            while state['inflight'] >= int(state['limit']):
+                if not wait:
+                    return None
+                self.condition.wait()
+
+            state['inflight'] += 1
+            state['calls'] += 1
+            state['max_inflight'] = max(state['max_inflight'], state['inflight'])
+            return time.time()
+
+    ############################################
+    # release in-flight slot and adjust the limit
+    ############################################
+    def release(self, endpoint, start_time, throttled=False):
+        with self.condition:
+            state = self.__get_endpoint(endpoint)
+            saturated = state['inflight'] >= int(state['limit'])
+            state['inflight'] -= 1
+
+            if throttled:
+                # decrease once per window, calls started before the last decrease are ignored
+                state['throttled'] += 1
+                if start_time >= state['decreased']:
+                    state['limit'] = max(1.0, state['limit'] * self.decrease)
+                    state['decreased'] = time.time()
+
+            elif saturated:
+                state['limit'] = min(float(self.max_limit), state['limit'] + self.increase / state['limit'])
+
+            if int(state['limit']) != state['history'][-1][1]:
+                state['history'].append((time.time() - self.start_time, int(state['limit'])))
+
+            self.condition.notify_all()
+            for listener in self.listeners:
+                listener()
+
+    ############################################
+    # add or remove listener called on every release
+    ############################################
+    def add_listener(self, listener):
+        with self.condition:
+            self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        with self.condition:
+            self.listeners.remove(listener)
+
+    ############################################
+    # wrap the SDK base client request
+    ############################################
+    def wrap(self, endpoint, request_function):
+
+        def request(*args, **kwargs):
+            start_time = self.acquire(endpoint)
+            throttled = False
+            try:
+                return request_function(*args, **kwargs)
+            except oci.exceptions.ServiceError as e:
+                throttled = e.status == 429
+                raise
+            finally:
+                self.release(endpoint, start_time, throttled)
+
+        return request
+
+    ############################################
+    # report of the concurrency per endpoint
+    ############################################
+    def report(self, max_points=12):
+
+        lines = []
+        with self.condition:
+            for endpoint in sorted(self.endpoints):
+                state = self.endpoints[endpoint]
+                history = state['history']
+                if len(history) > max_points:
+                    step = (len(history) - 1) / float(max_points - 1)
+                    history = [history[int(round(i * step))] for i in range(max_points)]
+
+                lines.append(endpoint.split("://")[-1])
+                lines.append("   Calls = " + str(state['calls']) + ", TooManyRequests = " + str(state['throttled']) + ", Max In-Flight = " + str(state['max_inflight']))
+                lines.append("   Limit = " + ", ".join(["%.1fs:%d" % (elapsed, limit) for elapsed, limit in history]))
+        return lines
+
+
 ###########################################################################################################
 # class ShowOCIService
 ###########################################################################################################
@@ -253,6 +692,28 @@ class ShowOCIService(object):
         {'shape': 'VM.Standard2.24', 'cpu': 24, 'memory': 320, 'storage': 0}
     ]
 
+    # shapes catalog file cache expiry in seconds
+    shapes_cache_ttl = 86400
+
+    # seconds to use the static shapes before loading a failed shapes catalog again
+    shapes_retry = 60
+
+    # compartment resources kept in the empty compartments cache
+    empty_cache_resources = [C_NETWORK_CPE, C_NETWORK_VC, C_NETWORK_IPS, C_DATABASE_EXADATA, C_DATABASE_DBSYSTEMS,
+                             C_DATABASE_ADB_D_INFRA, C_DATABASE_ADB_DATABASE, C_DATABASE_SOFTWARE_IMAGES]
+
+    # resource search types of the compartment resources, attachments are in the instance compartment
+    search_resource_types = {
+        C_NETWORK_VCN: 'Vcn', C_NETWORK_SUBNET: 'Subnet', C_NETWORK_VLAN: 'Vlan', C_NETWORK_IGW: 'InternetGateway',
+        C_NETWORK_LPG: 'LocalPeeringGateway', C_NETWORK_RPC: 'RemotePeeringConnection', C_NETWORK_ROUTE: 'RouteTable',
+        C_NETWORK_DHCP: 'DHCPOptions', C_NETWORK_SLIST: 'SecurityList', C_NETWORK_NSG: 'NetworkSecurityGroup',
+        C_NETWORK_SGW: 'ServiceGateway', C_NETWORK_NAT: 'NatGateway', C_NETWORK_DRG: 'Drg', C_NETWORK_CPE: 'Cpe',
+        C_NETWORK_VC: 'VirtualCircuit', C_NETWORK_IPS: 'IPSecConnection',
+        C_COMPUTE_INST: 'Instance', C_COMPUTE_VOLUME_ATTACH: 'Instance', C_COMPUTE_VNIC_ATTACH: 'Instance',
+        C_BLOCK_BOOT: 'BootVolume', C_BLOCK_VOL: 'Volume', C_BLOCK_VOLGRP: 'VolumeGroup',
+        C_DATABASE_EXADATA: 'CloudExadataInfrastructure', C_DATABASE_DBSYSTEMS: 'DbSystem', C_DATABASE_ADB_DATABASE: 'AutonomousDatabase'
+    }
+
     ##########################################################################
     # Local Variables
     # data - hold the data data
@@ -280,6 +741,88 @@ class ShowOCIService(object):
         # assign the flags variable
         self.flags = flags
 
+        # lock for shared counters and data keys, region context per thread
+        self.lock = threading.Lock()
+        self.region_context = threading.local()
+
+        # thread pool for the compartments list calls, created on first use
+        self.compartments_pool = None
+
+        # thread pool for the subtree calls of listed items, created on first use
+        self.subtrees_pool = None
+
+        # thread pool for the get calls by ids, created on first use
+        self.get_calls_pool = None
+
+        # thread output, installed when loading in parallel
+        self.output = None
+
+        # SDK clients pool by service and region
+        self.clients = {}
+
+        # adaptive concurrency per endpoint for all the API calls
+        # capped by the connections pool, or by the asyncio calls if larger
+        self.throttle = ShowOCIThrottle(max(self.__get_connections(), self.flags.async_calls))
+
+        # images cache by image id and the regions seeded with platform images
+        self.images_cache = {}
+        self.images_cache_regions = set()
+
+        # vnic ips index by region, future of the bulk private and public ips
+        self.vnic_ips = {}
+
+        # volume backup policy names by policy id and the preload future per region
+        self.backup_policies = {}
+        self.backup_policies_regions = {}
+
+        # search indexes by module, section and fields
+        # and the version of each module section, bumped when the section is written
+        self.search_indexes = {}
+        self.data_versions = {}
+
+        # partitioned view of the data, region -> compartment -> module -> section -> items
+        self.data_partitions = {}
+
+        # shapes catalog by region (future of shape -> details), the static shapes
+        # by name as fallback and the shapes catalog file cache by region
+        self.shapes = {}
+        self.shapes_index = {shape['shape']: shape for shape in self.shapes_array}
+        self.shapes_cache = {}
+        self.shapes_failed = {}
+
+        # network security group names by id, added per region after the nsgs load
+        self.nsg_names = {}
+
+        # availability domains by region, added per region after the ads load
+        self.availability_domains = {}
+
+        # compartments seen empty, region -> resource -> compartment id -> time seen empty
+        # and the compartment resources skipped or re-verified by sample in this run
+        self.empty_cache = {}
+        self.empty_cache_skipped = set()
+        self.empty_cache_verified = set()
+
+        # compartments of the resources found by resource search, region -> resource type -> compartment ids
+        self.search_compartments = {}
+
+        # private ips by id, future per id shared by routes, scan ips and vips
+        self.private_ips = {}
+
+        # db homes per region and compartment, future of parent id -> list
+        self.database_bulk = {}
+
+        # maintenance runs by id, future per id
+        self.maintenance_runs = {}
+
+        # compartments indexes by id, by path and by parent compartment id
+        self.compartments_ids = {}
+        self.compartments_paths = {}
+        self.compartments_children = {}
+
+        # signer per region, created by the signer factory of the authentication
+        self.signer_factory = None
+        self.region_signers = {}
+
         # if intance pricipals - generate signer from token or config
         if flags.use_instance_principals:
             self.generate_signer_from_instance_principals()
@@ -300,7 +843,7 @@ class ShowOCIService(object):
         try:
             # create signer from config for authentication
             self.config = oci.config.from_file(config_file, config_section)
-            self.signer = oci.signer.Signer(
+            self.signer_factory = lambda: oci.signer.Signer(
                 tenancy=self.config["tenancy"],
                 user=self.config["user"],
                 fingerprint=self.config["fingerprint"],
@@ -308,6 +851,7 @@ class ShowOCIService(object):
                 pass_phrase=oci.config.get_config_value_or_default(self.config, "pass_phrase"),
                 private_key_content=self.config.get("key_content")
             )
+            self.signer = self.signer_factory()
         except oci.exceptions.ProfileNotFound as e:
             print("*********************************************************************")
             print("* " + str(e))
@@ -323,7 +867,8 @@ class ShowOCIService(object):
 
         try:
             # get signer from instance principals token
-            self.signer = oci.auth.signers.InstancePrincipalsSecurityTokenSigner()
+            self.signer_factory = oci.auth.signers.InstancePrincipalsSecurityTokenSigner
+            self.signer = self.signer_factory()
 
         except Exception:
             print("*********************************************************************")
@@ -359,7 +904,8 @@ class ShowOCIService(object):
             with open(delegation_token_location, 'r') as delegation_token_file:
                 delegation_token = delegation_token_file.read().strip()
                 # get signer from delegation token
-                self.signer = oci.auth.signers.InstancePrincipalsDelegationTokenSigner(delegation_token=delegation_token)
+                self.signer_factory = lambda: oci.auth.signers.InstancePrincipalsDelegationTokenSigner(delegation_token=delegation_token)
+                self.signer = self.signer_factory()
 
         except KeyError:
             print("*********************************************************************")
@@ -425,6 +971,9 @@ class ShowOCIService(object):
     # return availability domains
     ##########################################################################
     def get_availability_domains(self, region_name):
+        if region_name in self.availability_domains:
+            return self.availability_domains[region_name]
+
         ads = self.data[self.C_IDENTITY][self.C_IDENTITY_ADS]
         return [e for e in ads if e['region_name'] == region_name]
 
@@ -490,127 +1039,853 @@ class ShowOCIService(object):
     # returns CPUs, Memory and Local Storage SSD
     ##########################################################################
     def get_shape_details(self, shape_name):
-        for array in self.shapes_array:
-            if array['shape'] == shape_name:
-                return array
-        return {}
+        shape = self.__get_shapes_catalog().get(shape_name)
+        if shape:
+            return shape
+        return self.shapes_index.get(shape_name, {})
 
     ##########################################################################
-    # check oci version
+    # get shapes catalog of the current region, loaded once per region
     ##########################################################################
-    def check_oci_version_compatible(self):
+    def __get_shapes_catalog(self):
 
-        try:
-            # loop on digits
-            for i, rl in zip(self.get_oci_version().split("."), oci_compatible_version.split(".")):
-                if int(i) > int(rl):
-                    return True
-                if int(i) < int(rl):
-                    print("")
-                    print("*********************************************************************")
-                    print("Error, OCI SDK version " + oci_compatible_version + " required !")
-                    print("OCI SDK Version installed = " + self.get_oci_version())
-                    print("Please use below command to upgrade OCI SDK:")
-                    print("   python -m pip install --upgrade oci")
-                    print("")
-                    print("Aboting.")
-                    print("*********************************************************************")
-                    print("")
-                    raise SystemExit
+        region_name = self.__get_region_name()
+        with self.lock:
+            future = self.shapes.get(region_name)
+            failed = self.shapes_failed.get(region_name)
+            load = future is None or (failed is not None and time.time() - failed > self.shapes_retry)
+            if load:
+                future = self.shapes[region_name] = concurrent.futures.Future()
+                self.shapes_failed.pop(region_name, None)
 
-        except Exception as e:
-            self.__print_error("check_oci_version_compatible", e)
+        # a failed load uses the static shapes and is loaded again after the retry seconds
+        if load:
+            shapes, loaded = self.__load_shapes_catalog(region_name)
+            if not loaded:
+                with self.lock:
+                    self.shapes_failed[region_name] = time.time()
+            future.set_result(shapes)
+
+        return future.result()
 
     ##########################################################################
-    # search unique items with multi parameters
-    # parameters are
-    # MODULE - data Module
-    # SECTION - data Sub module
-    # P1, v1 - param and value
-    # p2, v2 - param and value - optional
-    # p3, v3 - param and value - optional
+    # load shapes catalog of the region from the file cache if not expired,
+    # otherwise from the compute and database shapes of the tenancy
+    # details missing from the api are taken from the static shapes
+    # return the shapes and if loaded, on error the static shapes are used
     ##########################################################################
+    def __load_shapes_catalog(self, region_name):
+
+        cached = self.shapes_cache.get(region_name)
+        if cached and time.time() - cached['time'] < self.shapes_cache_ttl:
+            return cached['shapes'], True
+
+        shapes = {}
+
+        def add_shape(name, cpu, memory, storage):
+            static = self.shapes_index.get(name, {})
+            shapes[name] = {
+                'shape': name,
+                'cpu': cpu if cpu is not None else static.get('cpu', 0),
+                'memory': memory if memory is not None else static.get('memory', 0),
+                'storage': storage if storage is not None else static.get('storage', 0)
+            }
 
-    def search_unique_item(self, module, section, p1, v1, p2=None, v2=None, p3=None, v3=None):
         try:
-            result = self.search_multi_items(module, section, p1, v1, p2, v2, p3, v3)
+            compute = self.__get_client(oci.core.ComputeClient)
+            compute_shapes = oci.pagination.list_call_get_all_results(
+                compute.list_shapes,
+                self.get_tenancy_id(),
+                retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+            ).data
 
-            if not result:
-                return None
+            for shape in compute_shapes:
+                disks = getattr(shape, 'local_disks_total_size_in_gbs', None)
+                add_shape(str(shape.shape), getattr(shape, 'ocpus', None), getattr(shape, 'memory_in_gbs', None), disks / 1000 if disks else None)
 
-            return result[0]
+            # database shapes only add the shapes missing from the compute and static shapes,
+            # their available counts are maximums per db system and not the static units
+            database_client = self.__get_client(oci.database.DatabaseClient, timeout=30)
+            db_shapes = oci.pagination.list_call_get_all_results(
+                database_client.list_db_system_shapes,
+                self.get_tenancy_id(),
+                retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+            ).data
+
+            for shape in db_shapes:
+                if str(shape.shape) in shapes or str(shape.shape) in self.shapes_index:
+                    continue
+                add_shape(str(shape.shape), getattr(shape, 'available_core_count', None), getattr(shape, 'available_memory_in_gbs', None), getattr(shape, 'available_data_storage_in_t_bs', None))
 
+        except oci.exceptions.RequestException as e:
+            if not self.__check_request_error(e):
+                self.__print_error("__load_shapes_catalog", e)
+                return {}, False
+        except oci.exceptions.ServiceError as e:
+            if not self.__check_service_error(e.code):
+                self.__print_error("__load_shapes_catalog", e)
+                return {}, False
         except Exception as e:
-            self.__print_error("search_unique_item", e)
+            self.__print_error("__load_shapes_catalog", e)
+            return {}, False
+
+        if shapes:
+            with self.lock:
+                self.shapes_cache[region_name] = {'time': time.time(), 'shapes': shapes}
+        return shapes, True
 
     ##########################################################################
-    # search multi items with multi parameters
-    # parameters are
-    # MODULE - data Module
-    # SECTION - data Sub module
-    # P1, v1 - param and value
-    # p2, v2 - param and value - optional
-    # p3, v3 - param and value - optional
+    # load shapes catalog cache from file
     ##########################################################################
-
-    def search_multi_items(self, module, section, p1, v1, p2=None, v2=None, p3=None, v3=None):
+    def __load_shapes_cache_file(self):
         try:
-            if len(module) == 0 or len(section) == 0:
-                return []
+            if not os.path.isfile(self.flags.shape_cache_file):
+                return
 
-            # check if module exists
-            if module not in self.data:
-                return []
+            with open(self.flags.shape_cache_file, 'r') as f:
+                self.shapes_cache = json.load(f)
 
-            # check if section exists
-            if section not in self.data[module]:
-                return []
+            print("Shapes Cache            = " + str(len(self.shapes_cache)) + " regions loaded from " + self.flags.shape_cache_file)
 
-            # assign data area to array
-            array = self.data[module][section]
+        except Exception as e:
+            print("Shapes Cache file " + self.flags.shape_cache_file + " not loaded, " + str(e))
 
-            # check parameters and search
-            if p2 and v2 and p3 and v3:
-                return [e for e in array if e[p1] == v1 and e[p2] == v2 and e[p3] == v3]
+    ##########################################################################
+    # save shapes catalog cache to file
+    ##########################################################################
+    def __save_shapes_cache_file(self):
+        try:
+            with open(self.flags.shape_cache_file, 'w') as f:
+                json.dump(self.shapes_cache, f)
+
+        except Exception as e:
+            print("Shapes Cache file " + self.flags.shape_cache_file + " not saved, " + str(e))
+
+    ##########################################################################
+    # load empty compartments cache from file
+    ##########################################################################
+    def __load_empty_cache_file(self):
+        try:
+            if not os.path.isfile(self.flags.empty_cache_file):
+                return
 
-            # check parameters and search
-            if p2 and v2:
-                return [e for e in array if e[p1] == v1 and e[p2] == v2]
+            with open(self.flags.empty_cache_file, 'r') as f:
+                self.empty_cache = json.load(f)
 
-            return [e for e in array if e[p1] == v1]
+            cnt = sum(len(compartments) for resources in self.empty_cache.values() for compartments in resources.values())
+            print("Empty Cache             = " + str(cnt) + " compartment resources loaded from " + self.flags.empty_cache_file)
 
         except Exception as e:
-            self.__print_error("search_multi_items " + module + ":" + section, e)
+            print("Empty Cache file " + self.flags.empty_cache_file + " not loaded, " + str(e))
 
     ##########################################################################
-    # initialize data key if not exist
+    # save empty compartments cache to file
     ##########################################################################
-    def __initialize_data_key(self, module, section):
-        if module not in self.data:
-            self.data[module] = {}
-        if section not in self.data[module]:
-            self.data[module][section] = []
+    def __save_empty_cache_file(self):
+        try:
+            with open(self.flags.empty_cache_file, 'w') as f:
+                json.dump(self.empty_cache, f)
+
+        except Exception as e:
+            print("Empty Cache file " + self.flags.empty_cache_file + " not saved, " + str(e))
 
     ##########################################################################
-    # print status message
+    # print the compartment resources skipped by the empty cache in this run
     ##########################################################################
-    def __load_print_status(self, msg):
-        print("--> " + msg.ljust(25) + "<-- ", end="")
+    def __print_empty_cache_skipped(self):
+        with self.lock:
+            compartments = set(compartment_id for region_name, resource, compartment_id in self.empty_cache_skipped)
+            resources = set(resource for region_name, resource, compartment_id in self.empty_cache_skipped)
+            print("Empty Cache Skipped     = " + str(len(self.empty_cache_skipped)) + " list calls, " + str(len(compartments)) + " compartments, " +
+                  str(len(resources)) + " resources, " + str(len(self.empty_cache_verified)) + " re-verified by sample")
 
     ##########################################################################
-    # print print error
+    # check if the compartment resource was seen empty within the empty cache hours
+    # a sample of them is listed again to re-verify, so new resources are found
+    # before the hours passed
     ##########################################################################
-    def __print_error(self, msg, e):
-        classname = type(self).__name__
+    def __is_empty_cache(self, region_name, resource, compartment_id):
+        if not self.flags.empty_cache_file or resource not in self.empty_cache_resources:
+            return False
 
-        if 'TooManyRequests' in str(e):
-            print(" - TooManyRequests Err in " + msg)
+        key = (region_name, resource, compartment_id)
+        with self.lock:
+            seen = self.empty_cache.get(region_name, {}).get(resource, {}).get(compartment_id)
+            if seen is None or time.time() - seen >= self.flags.empty_cache_hours * 3600:
+                return False
+
+            if random.random() * 100 < self.flags.empty_cache_sample:
+                self.empty_cache_verified.add(key)
+                return False
+
+            self.empty_cache_skipped.add(key)
+            return True
+
+    ##########################################################################
+    # mark the compartment resource as empty or remove it by the list call result
+    # skipped resources are not marked again so they are listed after the hours
+    ##########################################################################
+    def __set_empty_cache(self, region_name, resource, compartment_id, future):
+        if not self.flags.empty_cache_file or resource not in self.empty_cache_resources or future.cancelled() or future.exception():
+            return
+
+        with self.lock:
+            compartments = self.empty_cache.setdefault(region_name, {}).setdefault(resource, {})
+            if future.result():
+                compartments.pop(compartment_id, None)
+            else:
+                compartments[compartment_id] = time.time()
+
+    ##########################################################################
+    # discover the compartments of the resources of the region by resource search
+    # if the search is not available all the compartments are listed
+    ##########################################################################
+    def __load_search_compartments(self, region_name):
+
+        self.__load_print_status("Resource Search")
+        start_time = time.time()
+
+        try:
+            kwargs = {'service_endpoint': self.flags.search_endpoint} if self.flags.search_endpoint else {}
+            search_client = self.__get_client(oci.resource_search.ResourceSearchClient, **kwargs)
+
+            query = "query " + ", ".join(sorted(set(self.search_resource_types.values()))) + " resources"
+            resources = oci.pagination.list_call_get_all_results(
+                search_client.search_resources,
+                oci.resource_search.models.StructuredSearchDetails(
+                    type="Structured",
+                    query=query,
+                    matching_context_type=oci.resource_search.models.SearchDetails.MATCHING_CONTEXT_TYPE_NONE
+                ),
+                limit=1000,
+                retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+            ).data
+
+            data = {}
+            for resource in resources:
+                data.setdefault(str(resource.resource_type).lower(), set()).add(str(resource.compartment_id))
+
+            with self.lock:
+                self.search_compartments[region_name] = data
+
+            self.__load_print_cnt(len(resources), start_time)
+
+        except oci.exceptions.ServiceError as e:
+            print("not available, listing all compartments, " + str(e.code))
+        except Exception as e:
+            print("not available, listing all compartments, " + str(e))
+
+    ##########################################################################
+    # check if resource search found no resource of the type in the compartment
+    ##########################################################################
+    def __is_search_skipped(self, region_name, resource, compartment_id):
+        search = self.search_compartments.get(region_name)
+        resource_type = self.search_resource_types.get(resource)
+        if search is None or resource_type is None:
+            return False
+        return compartment_id not in search.get(resource_type.lower(), set())
+
+    ##########################################################################
+    # check oci version
+    ##########################################################################
+    def check_oci_version_compatible(self):
+
+        try:
+            # loop on digits
+            for i, rl in zip(self.get_oci_version().split("."), oci_compatible_version.split(".")):
+                if int(i) > int(rl):
+                    return True
+                if int(i) < int(rl):
+                    print("")
+                    print("*********************************************************************")
+                    print("Error, OCI SDK version " + oci_compatible_version + " required !")
+                    print("OCI SDK Version installed = " + self.get_oci_version())
+                    print("Please use below command to upgrade OCI SDK:")
+                    print("   python -m pip install --upgrade oci")
+                    print("")
+                    print("Aboting.")
+                    print("*********************************************************************")
+                    print("")
+                    raise SystemExit
+
+        except Exception as e:
+            self.__print_error("check_oci_version_compatible", e)
+
+    ##########################################################################
+    # return network security group name by id, None if not found
+    ##########################################################################
+    def get_network_nsg_name(self, nsg_id):
+        return self.nsg_names.get(nsg_id)
+
+    ##########################################################################
+    # add network security group names to the nsg names index
+    ##########################################################################
+    def __add_network_nsg_names(self, nsgs):
+        with self.lock:
+            for nsg in nsgs:
+                self.nsg_names.setdefault(nsg['id'], nsg['name'])
+
+    ##########################################################################
+    # search unique items with multi parameters
+    # parameters are
+    # MODULE - data Module
+    # SECTION - data Sub module
+    # P1, v1 - param and value
+    # p2, v2 - param and value - optional
+    # p3, v3 - param and value - optional
+    ##########################################################################
+
+    def search_unique_item(self, module, section, p1, v1, p2=None, v2=None, p3=None, v3=None):
+        try:
+            result = self.search_multi_items(module, section, p1, v1, p2, v2, p3, v3)
+
+            if not result:
+                return None
+
+            return result[0]
+
+        except Exception as e:
+            self.__print_error("search_unique_item", e)
+
+    ##########################################################################
+    # search multi items with multi parameters
+    # parameters are
+    # MODULE - data Module
+    # SECTION - data Sub module
+    # P1, v1 - param and value
+    # p2, v2 - param and value - optional
+    # p3, v3 - param and value - optional
+    ##########################################################################
+
+    def search_multi_items(self, module, section, p1, v1, p2=None, v2=None, p3=None, v3=None):
+        try:
+            if len(module) == 0 or len(section) == 0:
+                return []
+
+            # check if module exists
+            if module not in self.data:
+                return []
+
+            # check if section exists
+            if section not in self.data[module]:
+                return []
+
+            # assign data area to array
+            array = self.data[module][section]
+
+            # check parameters
+            if p2 and v2 and p3 and v3:
+                fields, values = (p1, p2, p3), (v1, v2, v3)
+            elif p2 and v2:
+                fields, values = (p1, p2), (v1, v2)
+            else:
+                fields, values = (p1,), (v1,)
+
+            # search by the index, or one by one if values are not hashable
+            index = self.__get_search_index(module, section, array, fields)
+            try:
+                if index is not None:
+                    return list(index.get(values, []))
+            except TypeError:
+                pass
+
+            return [e for e in array if all(e.get(field) == value for field, value in zip(fields, values))]
+
+        except Exception as e:
+            self.__print_error("search_multi_items " + module + ":" + section, e)
+
+    ##########################################################################
+    # search items of section by region and compartment
+    # from the partitioned view built at the end of the load
+    ##########################################################################
+    def search_region_compartment_items(self, module, section, region_name, compartment_id):
+        try:
+            region = self.data_partitions.get(region_name, {})
+            return list(region.get(compartment_id, {}).get(module, {}).get(section, []))
+
+        except Exception as e:
+            self.__print_error("search_region_compartment_items " + module + ":" + section, e)
+
+    ##########################################################################
+    # check if the region compartment has any items in the partitioned view
+    ##########################################################################
+    def is_region_compartment_data(self, region_name, compartment_id):
+        return compartment_id in self.data_partitions.get(region_name, {})
+
+    ##########################################################################
+    # build partitioned view of the data by region and compartment
+    # sections without region_name and compartment_id are not included
+    ##########################################################################
+    def __build_data_partitions(self):
+
+        partitions = {}
+        for module in self.data:
+            if not isinstance(self.data[module], dict):
+                continue
+
+            for section, array in self.data[module].items():
+                if not isinstance(array, list):
+                    continue
+
+                for item in array:
+                    if not isinstance(item, dict) or 'region_name' not in item or 'compartment_id' not in item:
+                        continue
+
+                    region = partitions.setdefault(item['region_name'], {})
+                    compartment = region.setdefault(item['compartment_id'], {})
+                    compartment.setdefault(module, {}).setdefault(section, []).append(item)
+
+        self.data_partitions = partitions
+
+    ##########################################################################
+    # get search index of section by fields, dict of values -> items
+    # the index is built on first search and rebuilt if the section was
+    # replaced, written since it was built (version) or items were added
+    # the search fields of an item must not be changed after it is added
+    # return None if the values of the fields are not hashable
+    ##########################################################################
+    def __get_search_index(self, module, section, array, fields):
+
+        key = (module, section) + fields
+        with self.lock:
+            version = self.data_versions.get((module, section), 0)
+            cached = self.search_indexes.get(key)
+            if cached and cached['array'] is array and cached['version'] == version and cached['length'] == len(array):
+                return cached['index']
+
+        length = len(array)
+        index = {}
+        try:
+            for e in array[:length]:
+                index.setdefault(tuple(e.get(field) for field in fields), []).append(e)
+        except TypeError:
+            index = None
+
+        with self.lock:
+            self.search_indexes[key] = {'array': array, 'version': version, 'length': length, 'index': index}
+        return index
+
+    ##########################################################################
+    # bump the version of the written sections in all the modules,
+    # their search indexes are rebuilt
+    ##########################################################################
+    def __set_data_changed(self, sections):
+        with self.lock:
+            for module in self.data:
+                if not isinstance(self.data[module], dict):
+                    continue
+                for section in sections:
+                    if section in self.data[module]:
+                        self.data_versions[(module, section)] = self.data_versions.get((module, section), 0) + 1
+
+    ##########################################################################
+    # clear search indexes, required if items were reordered or changed
+    ##########################################################################
+    def __clear_search_indexes(self):
+        with self.lock:
+            self.search_indexes = {}
+
+    ##########################################################################
+    # initialize data key if not exist
+    ##########################################################################
+    def __initialize_data_key(self, module, section):
+        with self.lock:
+            if module not in self.data:
+                self.data[module] = {}
+            if section not in self.data[module]:
+                self.data[module][section] = []
+                self.data_versions[(module, section)] = self.data_versions.get((module, section), 0) + 1
+
+    ##########################################################################
+    # get the compartments thread pool, None if calls run one by one
+    # the pool is shared by all regions so the total calls are bounded
+    ##########################################################################
+    def __get_compartments_pool(self):
+        if self.flags.threads_compartments <= 1:
+            return None
+
+        with self.lock:
+            if self.compartments_pool is None:
+                self.compartments_pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.flags.threads_compartments)
+            return self.compartments_pool
+
+    ##########################################################################
+    # thread pool for the subtree calls of listed items (i.e. db systems)
+    # separated from the compartments pool as the subtree calls submit
+    # get calls to the compartments pool and wait for them
+    ##########################################################################
+    def __get_subtrees_pool(self):
+        if self.flags.threads_compartments <= 1:
+            return None
+
+        with self.lock:
+            if self.subtrees_pool is None:
+                self.subtrees_pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.flags.threads_compartments)
+            return self.subtrees_pool
+
+    ##########################################################################
+    # thread pool for the get calls by ids (i.e. vnics, images)
+    # separated from the compartments pool so the get calls of a loader
+    # do not wait behind the list calls queued by the other loaders
+    ##########################################################################
+    def __get_get_calls_pool(self):
+        if self.flags.threads_compartments <= 1:
+            return None
+
+        with self.lock:
+            if self.get_calls_pool is None:
+                self.get_calls_pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.flags.threads_compartments)
+            return self.get_calls_pool
+
+    ##########################################################################
+    # close the compartments, subtrees and get calls thread pools
+    ##########################################################################
+    def __close_compartments_pool(self):
+        with self.lock:
+            if self.get_calls_pool is not None:
+                self.get_calls_pool.shutdown(wait=True)
+                self.get_calls_pool = None
+
+            if self.subtrees_pool is not None:
+                self.subtrees_pool.shutdown(wait=True)
+                self.subtrees_pool = None
+
+            if self.compartments_pool is not None:
+                self.compartments_pool.shutdown(wait=True)
+                self.compartments_pool = None
+
+    ##########################################################################
+    # wrap function to run on a pool thread with the region context
+    # and the output buffer of the calling thread
+    ##########################################################################
+    def __load_thread_function(self, function):
+        context = self.__get_region_context()
+        buffer = getattr(self.output.local, 'buffer', None) if self.output else None
+
+        def run(*args):
+            self.region_context.context = context
+            if self.output:
+                self.output.local.buffer = buffer
+            try:
+                return function(*args)
+            finally:
+                if self.output:
+                    self.output.local.buffer = None
+
+        return run
+
+    ##########################################################################
+    # run the subtree calls of a listed item concurrently on the subtrees pool
+    # calls is dict of key -> (function, args), return dict of key -> future
+    ##########################################################################
+    def __load_subtree_calls(self, calls):
+
+        pool = self.__get_subtrees_pool()
+        futures = {}
+        for key, (function, args) in calls.items():
+            if pool is None:
+                futures[key] = self.__run_as_future(lambda call_args, function=function: function(*call_args), args)
+            else:
+                futures[key] = pool.submit(self.__load_thread_function(function), *args)
+        return futures
+
+    ##########################################################################
+    # run function and return the result or exception as completed future
+    ##########################################################################
+    def __run_as_future(self, function, item):
+        future = concurrent.futures.Future()
+        try:
+            future.set_result(function(item))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    ##########################################################################
+    # run list function on each item (compartment) using the compartments pool
+    # yield item and future in the original items order, errors are raised
+    # by future.result() so they are handled by the caller loop
+    # skipped items (ManagedCompartmentForPaaS) yield None future
+    # with resource, compartments without it by resource search or seen
+    # empty in previous runs are not listed and yield empty result
+    # function runs on the pool with the region context of the caller
+    ##########################################################################
+    def __load_concurrent_calls(self, items, function, skip_managed_paas=False, resource=None, empty_result=None):
+
+        region_name = self.__get_region_name()
+        thread_function = self.__load_thread_function(function)
+
+        def is_skipped(item):
+            return skip_managed_paas and self.__if_managed_paas_compartment(item['name'])
+
+        # compartments without the resource by resource search or seen empty in previous runs
+        # return empty result, empty list unless the function returns other result
+        def call(item):
+            if resource and (self.__is_search_skipped(region_name, resource, item['id']) or self.__is_empty_cache(region_name, resource, item['id'])):
+                return self.__run_as_future(lambda item: [] if empty_result is None else empty_result, item)
+
+            if pool is None:
+                future = self.__run_as_future(function, item)
+            else:
+                future = pool.submit(thread_function, item)
+
+            if resource:
+                future.add_done_callback(lambda future: self.__set_empty_cache(region_name, resource, item['id'], future))
+            return future
+
+        # run one by one
+        pool = self.__get_compartments_pool()
+        if pool is None:
+            for item in items:
+                yield item, (None if is_skipped(item) else call(item))
+            return
+
+        # submit all and return in order
+        futures = [None if is_skipped(item) else call(item) for item in items]
+        try:
+            for item, future in zip(items, futures):
+                yield item, future
+        finally:
+            for future in futures:
+                if future is not None:
+                    future.cancel()
+
+    ##########################################################################
+    # connections pool size of the SDK clients
+    ##########################################################################
+    def __get_connections(self):
+        return self.flags.connections or max(10, self.flags.threads_compartments + self.flags.threads_loaders)
+
+    ##########################################################################
+    # get SDK client of the current region from the clients pool
+    # one client per service and region (and timeout) is created with the
+    # proxy and the connections pool size and reused by all the loaders
+    ##########################################################################
+    def __get_client(self, client_class, **kwargs):
+
+        key = (client_class.__name__, self.__get_region_name()) + tuple(sorted(kwargs.items()))
+        with self.lock:
+            if key not in self.clients:
+                client = client_class(self.__get_region_config(), signer=self.__get_region_signer(), **kwargs)
+                if self.flags.proxy:
+                    client.base_client.session.proxies = {'https': self.flags.proxy}
+
+                # all the calls of the client go through the endpoint throttle
+                client.base_client.request = self.throttle.wrap(client.base_client.endpoint, client.base_client.request)
+
+                # connections pool size to match the concurrent calls
+                # the pool of the SDK adapter is resized in place to keep its retries and settings
+                connections = self.__get_connections()
+                if connections != 10:
+                    adapter = client.base_client.session.get_adapter('https://')
+                    adapter.poolmanager.clear()
+                    adapter.init_poolmanager(connections, connections, block=getattr(adapter, '_pool_block', False))
+
+                self.clients[key] = client
+            return self.clients[key]
+
+    ##########################################################################
+    # run get function for each id, return dict of id -> future with the data
+    # ids are de-duplicated, with -async the calls are sent concurrently
+    # on asyncio event loop, with threads the calls are submitted to the
+    # get calls pool, otherwise one by one
+    ##########################################################################
+    def __load_get_calls(self, function, ids, **kwargs):
+
+        unique_ids = list(dict.fromkeys(item_id for item_id in ids if item_id))
+
+        if self.flags.async_calls > 0 and unique_ids and hasattr(function, '__self__'):
+            return ShowOCIAsyncCalls(self.flags.async_calls, self.flags.proxy, self.throttle).run(function, unique_ids, **kwargs)
+
+        def get_call(item_id):
+            return function(item_id, **kwargs).data
+
+        pool = self.__get_get_calls_pool()
+        if pool is not None:
+            get_call = self.__load_thread_function(get_call)
+            return {item_id: pool.submit(get_call, item_id) for item_id in unique_ids}
+
+        return {item_id: self.__run_as_future(get_call, item_id) for item_id in unique_ids}
+
+    ##########################################################################
+    # get private ips by id, return dict of id -> future
+    # private ips are shared by routes, scan ips and vips of the whole run,
+    # each unique id is requested once and repeat lookups are served from memory
+    ##########################################################################
+    def __load_private_ips_calls(self, virtual_network, ip_ids):
+
+        unique_ids = list(dict.fromkeys(ip_id for ip_id in ip_ids if ip_id and 'privateip' in ip_id))
+
+        with self.lock:
+            missing = [ip_id for ip_id in unique_ids if ip_id not in self.private_ips]
+            for ip_id in missing:
+                self.private_ips[ip_id] = concurrent.futures.Future()
+
+        def copy_result(call, target):
+            if call.exception():
+                target.set_exception(call.exception())
+            else:
+                target.set_result(call.result())
+
+        try:
+            calls = self.__load_get_calls(
+                virtual_network.get_private_ip,
+                missing,
+                retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+            )
+            for ip_id, call in calls.items():
+                call.add_done_callback(lambda call, target=self.private_ips[ip_id]: copy_result(call, target))
+        except Exception as e:
+            for ip_id in missing:
+                if not self.private_ips[ip_id].done():
+                    self.private_ips[ip_id].set_exception(e)
+
+        return {ip_id: self.private_ips[ip_id] for ip_id in unique_ids}
+
+    ##########################################################################
+    # get images by id using the images cache, return dict of id -> future
+    # the cache is seeded from the images listed in the compartments and
+    # from the platform images of the region, only misses call get_image
+    ##########################################################################
+    def __load_images_calls(self, compute, image_ids, **kwargs):
+
+        missing = [image_id for image_id in image_ids if image_id not in self.images_cache]
+        if missing:
+            self.__load_images_cache_platform(compute)
+            missing = [image_id for image_id in missing if image_id not in self.images_cache]
+
+        images = self.__load_get_calls(compute.get_image, missing, **kwargs)
+        for image_id, future in images.items():
+            if not future.exception():
+                self.__add_images_cache([future.result()])
+
+        for image_id in image_ids:
+            if image_id in self.images_cache:
+                images[image_id] = self.__run_as_future(self.images_cache.get, image_id)
+
+        return images
+
+    ##########################################################################
+    # add images to the images cache
+    ##########################################################################
+    def __add_images_cache(self, images):
+        with self.lock:
+            for image in images:
+                if image and image.id:
+                    self.images_cache[image.id] = image
+
+    ##########################################################################
+    # seed the images cache with the platform images of the region, once
+    ##########################################################################
+    def __load_images_cache_platform(self, compute):
+
+        region_name = self.__get_region_name()
+        with self.lock:
+            if region_name in self.images_cache_regions:
+                return
+            self.images_cache_regions.add(region_name)
+
+        try:
+            images = oci.pagination.list_call_get_all_results(
+                compute.list_images,
+                self.get_tenancy_id(),
+                retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+            ).data
+            self.__add_images_cache(images)
+
+        except oci.exceptions.ServiceError as e:
+            if self.__check_service_error(e.code):
+                return
+            raise
+
+    ##########################################################################
+    # load images cache from file
+    ##########################################################################
+    def __load_images_cache_file(self):
+        try:
+            if not os.path.isfile(self.flags.image_cache_file):
+                return
+
+            with open(self.flags.image_cache_file, 'r') as f:
+                images = json.load(f)
+
+            self.__add_images_cache([oci.core.models.Image(**image) for image in images])
+            print("Images Cache            = " + str(len(self.images_cache)) + " images loaded from " + self.flags.image_cache_file)
+
+        except Exception as e:
+            print("Images Cache file " + self.flags.image_cache_file + " not loaded, " + str(e))
+
+    ##########################################################################
+    # save images cache to file
+    ##########################################################################
+    def __save_images_cache_file(self):
+        try:
+            images = []
+            for image in self.images_cache.values():
+                images.append({'id': image.id, 'display_name': image.display_name, 'operating_system': image.operating_system, 'compartment_id': image.compartment_id})
+
+            with open(self.flags.image_cache_file, 'w') as f:
+                json.dump(images, f)
+
+        except Exception as e:
+            print("Images Cache file " + self.flags.image_cache_file + " not saved, " + str(e))
+
+    ##########################################################################
+    # set region context for the current thread
+    # every region gets its own copy of the config and its own signer, created
+    # like the main signer, so regions can be loaded in parallel without
+    # sharing the token refresh state of the signer
+    ##########################################################################
+    def __set_region_context(self, region_name):
+        config = dict(self.config)
+        config['region'] = region_name
+
+        with self.lock:
+            signer = self.region_signers.get(region_name)
+            if signer is None:
+                signer = self.region_signers[region_name] = self.signer_factory()
+                signer.region = region_name
+
+        self.region_context.context = {'region_name': region_name, 'config': config, 'signer': signer}
+
+    ##########################################################################
+    # get region name, config and signer of the current thread
+    ##########################################################################
+    def __get_region_context(self):
+        return getattr(self.region_context, 'context', None)
+
+    def __get_region_name(self):
+        context = self.__get_region_context()
+        return context['region_name'] if context else self.config['region']
+
+    def __get_region_config(self):
+        context = self.__get_region_context()
+        return context['config'] if context else self.config
+
+    def __get_region_signer(self):
+        context = self.__get_region_context()
+        return context['signer'] if context else self.signer
+
+    ##########################################################################
+    # print status message
+    ##########################################################################
+    def __load_print_status(self, msg):
+        print("--> " + msg.ljust(25) + "<-- ", end="")
+
+    ##########################################################################
+    # print print error
+    ##########################################################################
+    def __print_error(self, msg, e):
+        classname = type(self).__name__
+
+        if 'TooManyRequests' in str(e):
+            print(" - TooManyRequests Err in " + msg)
         elif isinstance(e, KeyError):
             print("\nError in " + classname + ":" + msg + ": KeyError " + str(e.args))
         else:
             print("\nError in " + classname + ":" + msg + ": " + str(e))
 
-        self.error += 1
+        with self.lock:
+            self.error += 1
 
     ##########################################################################
     # check service error to warn instead of error
@@ -647,7 +1922,8 @@ class ShowOCIService(object):
     ##########################################################################
     def __load_print_auth_warning(self, special_char="a", increase_warning=True):
         if increase_warning:
-            self.warning += 1
+            with self.lock:
+                self.warning += 1
         print(special_char, end="")
 
     ##########################################################################
@@ -670,8 +1946,32 @@ class ShowOCIService(object):
             if self.flags.filter_by_compartment_recursive:
                 print("Filtered by Compartment Recursive = " + self.flags.filter_by_compartment_recursive)
 
+            if self.flags.threads_regions > 1:
+                print("Parallel Regions        = " + str(self.flags.threads_regions))
+
+            if self.flags.threads_compartments > 1:
+                print("Parallel Compartments   = " + str(self.flags.threads_compartments))
+
+            if self.flags.threads_loaders > 1:
+                print("Parallel Loaders        = " + str(self.flags.threads_loaders))
+
+            if self.flags.async_calls > 0:
+                print("Async Get Calls         = " + str(self.flags.async_calls))
+
             print("")
 
+            # load images cache from previous run
+            if self.flags.image_cache_file:
+                self.__load_images_cache_file()
+
+            # load shapes catalog cache from previous run
+            if self.flags.shape_cache_file:
+                self.__load_shapes_cache_file()
+
+            # load empty compartments cache from previous run
+            if self.flags.empty_cache_file:
+                self.__load_empty_cache_file()
+
             # load identity
             self.__load_identity_main()
 
@@ -688,6 +1988,7 @@ class ShowOCIService(object):
             if self.flags.is_loop_on_compartments():
 
                 # run on each subscribed region
+                regions = []
                 tenancy = self.data[self.C_IDENTITY][self.C_IDENTITY_TENANCY]
                 for region_name in tenancy['list_region_subscriptions']:
 
@@ -695,8 +1996,46 @@ class ShowOCIService(object):
                     if self.flags.filter_by_region and str(self.flags.filter_by_region) not in region_name:
                         continue
 
-                    # load region into data
-                    self.__load_oci_region_data(region_name)
+                    regions.append(region_name)
+
+                # buffer the output of parallel regions and loaders
+                if self.flags.threads_regions > 1 or self.flags.threads_loaders > 1:
+                    self.output = ShowOCIThreadOutput.install()
+
+                # load regions into data
+                if self.flags.threads_regions > 1 and len(regions) > 1:
+                    self.__load_oci_regions_parallel(regions)
+                else:
+                    # the region context of the main thread is restored after the regions
+                    context = self.__get_region_context()
+                    try:
+                        for region_name in regions:
+                            self.__load_oci_region_data(region_name)
+                    finally:
+                        self.region_context.context = context
+
+            # build the partitioned view by region and compartment
+            self.__build_data_partitions()
+
+            # save images cache for next run
+            if self.flags.image_cache_file:
+                self.__save_images_cache_file()
+
+            # save shapes catalog cache for next run
+            if self.flags.shape_cache_file:
+                self.__save_shapes_cache_file()
+
+            # save empty compartments cache for next run
+            if self.flags.empty_cache_file:
+                self.__print_empty_cache_skipped()
+                self.__save_empty_cache_file()
+
+            # print the concurrency per endpoint
+            if self.flags.is_concurrent_calls():
+                self.print_header("API Concurrency per Endpoint", 2)
+                for line in self.throttle.report():
+                    print(line)
+                print("")
 
             return True
 
@@ -704,6 +2043,13 @@ class ShowOCIService(object):
             self.__print_error("__load_data_main: ", e)
             raise
 
+        finally:
+            self.__close_compartments_pool()
+
+            if self.output:
+                self.output.uninstall()
+                self.output = None
+
     ##########################################################################
     # run on Region
     ##########################################################################
@@ -714,28 +2060,226 @@ class ShowOCIService(object):
 
         # Assign Region to config file
         self.print_header("Region " + region_name, 2)
-        self.config['region'] = region_name
-        self.signer.region = region_name
+        self.__set_region_context(region_name)
 
         # load ADs
         if self.flags.is_load_basic_network():
             self.__load_identity_availability_domain(region_name)
 
+        # discover the compartments of the resources
+        if self.flags.search:
+            self.__load_search_compartments(region_name)
+
+        # region loaders
+        tasks = []
+
         # Load Network
         if self.flags.is_load_basic_network():
-            self.__load_core_network_main()
+            tasks += self.__load_core_network_main()
 
         # if load compute
         if self.flags.read_compute:
-            self.__load_core_compute_main()
+            tasks += self.__load_core_compute_main()
 
         # database
         if self.flags.read_database:
-            self.__load_database_main()
+            tasks += self.__load_database_main()
+
+        # run the loaders by their dependencies
+        self.__load_tasks_run(region_name, tasks)
 
         et = time.time() - region_start_time
         print("*** Elapsed Region '" + region_name + "' - " + '{:02d}:{:02d}:{:02d}'.format(round(et // 3600), (round(et % 3600 // 60)), round(et % 60)) + " ***")
 
+    ##########################################################################
+    # run on Regions in parallel
+    # output of each region is buffered and printed when the region completed
+    ##########################################################################
+    def __load_oci_regions_parallel(self, regions):
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.flags.threads_regions) as executor:
+            futures = [executor.submit(self.__load_oci_region_data_buffered, region_name) for region_name in regions]
+            for future in futures:
+                future.result()
+
+        # keep the same order as loading the regions one by one
+        self.__sort_data_by_region(regions)
+
+    ##########################################################################
+    # run on Region with buffered output
+    ##########################################################################
+    def __load_oci_region_data_buffered(self, region_name):
+        self.output.start_buffer()
+        try:
+            self.__load_oci_region_data(region_name)
+        finally:
+            self.output.flush_buffer()
+
+    ##########################################################################
+    # sort data by region subscription order after parallel load
+    ##########################################################################
+    def __sort_data_by_region(self, regions):
+
+        region_order = {region_name: index for index, region_name in enumerate(regions)}
+
+        for module in self.data:
+            for section in self.data[module]:
+                array = self.data[module][section]
+                if not isinstance(array, list) or not array:
+                    continue
+                if all(isinstance(item, dict) and 'region_name' in item for item in array):
+                    array.sort(key=lambda item: region_order.get(item['region_name'], len(regions)))
+
+        # drg route tables do not have region, sort them by the drg order
+        if self.C_NETWORK in self.data and self.C_NETWORK_DRG_RT in self.data[self.C_NETWORK]:
+            drg_order = {drg['id']: index for index, drg in enumerate(self.data[self.C_NETWORK].get(self.C_NETWORK_DRG, []))}
+            self.data[self.C_NETWORK][self.C_NETWORK_DRG_RT].sort(key=lambda item: drg_order.get(item['drg_id'], len(drg_order)))
+
+        # the sections were reordered, indexes must be rebuilt
+        self.__clear_search_indexes()
+
+    ##########################################################################
+    # create region loader task
+    # inputs and outputs are the data sections the loader reads and writes
+    ##########################################################################
+    def __load_task(self, name, group, function, inputs, outputs):
+        return {
+            'name': name,
+            'group': group,
+            'function': function,
+            'inputs': inputs,
+            'outputs': outputs,
+            'depends': [],
+            'elapsed': 0.0,
+            'output': ""
+        }
+
+    ##########################################################################
+    # run region loader tasks
+    # a task depends on the earlier tasks which write its inputs
+    # tasks run in order or in parallel by their dependencies,
+    # the output is printed in the tasks order
+    ##########################################################################
+    def __load_tasks_run(self, region_name, tasks):
+
+        # resolve dependencies
+        for index, task in enumerate(tasks):
+            task['depends'] = [prev for prev in range(index) if set(tasks[prev]['outputs']) & set(task['inputs'])]
+
+        # print the group header before the first task of each group
+        printed_group = [None]
+
+        def print_group(task):
+            if task['group'] != printed_group[0]:
+                if printed_group[0]:
+                    print("")
+                print(task['group'] + "...")
+                printed_group[0] = task['group']
+
+        if self.flags.threads_loaders > 1 and len(tasks) > 1:
+            try:
+                self.__load_tasks_run_parallel(tasks, print_group)
+            finally:
+                if printed_group[0]:
+                    print("")
+
+            self.__load_tasks_print_critical_path(region_name, tasks)
+            return
+
+        # run one by one
+        for task in tasks:
+            print_group(task)
+            start_time = time.time()
+            try:
+                task['function']()
+            finally:
+                task['elapsed'] = time.time() - start_time
+                self.__set_data_changed(task['outputs'])
+
+        if printed_group[0]:
+            print("")
+
+    ##########################################################################
+    # run region loader tasks in parallel
+    # the output of each task is buffered and printed in the tasks order
+    ##########################################################################
+    def __load_tasks_run_parallel(self, tasks, print_group):
+
+        # tasks run with the region context of the calling thread
+        context = self.__get_region_context()
+
+        def run_task(task):
+            self.region_context.context = context
+            self.output.start_buffer()
+            start_time = time.time()
+            try:
+                task['function']()
+            finally:
+                task['elapsed'] = time.time() - start_time
+                task['output'] = self.output.end_buffer()
+                self.__set_data_changed(task['outputs'])
+
+        pending = list(range(len(tasks)))
+        running = {}
+        completed = set()
+        printed = 0
+        error = None
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.flags.threads_loaders) as executor:
+            while pending or running:
+
+                # submit the tasks which all their dependencies completed, stop on error
+                if error is None:
+                    for index in [index for index in pending if all(depend in completed for depend in tasks[index]['depends'])]:
+                        pending.remove(index)
+                        running[executor.submit(run_task, tasks[index])] = index
+
+                if not running:
+                    break
+
+                done, not_done = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    completed.add(running.pop(future))
+                    if future.exception() and error is None:
+                        error = future.exception()
+
+                # print the output in the tasks order
+                while printed < len(tasks) and printed in completed:
+                    print_group(tasks[printed])
+                    print(tasks[printed]['output'], end="")
+                    printed += 1
+
+        if error:
+            raise error
+
+    ##########################################################################
+    # print the critical path of the region loaders
+    # the longest dependency chain by the loaders elapsed time
+    ##########################################################################
+    def __load_tasks_print_critical_path(self, region_name, tasks):
+
+        if not tasks:
+            return
+
+        finish = []
+        previous = []
+        for task in tasks:
+            depend = max(task['depends'], key=lambda index: finish[index], default=None)
+            previous.append(depend)
+            finish.append(task['elapsed'] + (0.0 if depend is None else finish[depend]))
+
+        # walk back from the last finished task
+        path = []
+        index = max(range(len(tasks)), key=lambda i: finish[i])
+        critical_time = finish[index]
+        while index is not None:
+            path.insert(0, tasks[index])
+            index = previous[index]
+
+        total_time = sum(task['elapsed'] for task in tasks)
+        print("*** Critical Path Region '" + region_name + "' - " + '{:.2f}'.format(critical_time) + "s of " + '{:.2f}'.format(total_time) + "s Loaders ***")
+        print("    " + " > ".join(task['name'] + " (" + '{:.2f}'.format(task['elapsed']) + "s)" for task in path))
+
     ##########################################################################
     # Identity Module
     ##########################################################################
@@ -744,9 +2288,7 @@ class ShowOCIService(object):
             print("Identity...")
 
             # create identity object
-            identity = oci.identity.IdentityClient(self.config, signer=self.signer)
-            if self.flags.proxy:
-                identity.base_client.session.proxies = {'https': self.flags.proxy}
+            identity = self.__get_client(oci.identity.IdentityClient)
 
             # get tenancy id from the config file
             tenancy_id = self.get_tenancy_id()
@@ -755,9 +2297,11 @@ class ShowOCIService(object):
             # loading main components - tenancy and compartments
             self.__load_identity_tenancy(identity, tenancy_id)
 
-            # Load single compartment or all
-            if 'ocid1.compartment' in self.flags.filter_by_compartment:
+            # Load single compartment, selected subtrees or all
+            if self.__is_single_compartments_filter():
                 self.__load_identity_single_compartments(identity)
+            elif self.__is_compartments_subtrees_filter():
+                self.__load_identity_compartments_subtrees(identity)
             else:
                 self.__load_identity_compartments(identity)
 
@@ -882,29 +2426,40 @@ class ShowOCIService(object):
 
             ###################################################
             # Build Compartments
-            # return nested compartment list
+            # walk the tree from the parent -> children map
+            # depth first without recursion, path is built
+            # from the parent path
             ###################################################
-            def build_compartments_nested(identity_client, cid, path):
+            def build_compartments_nested(cid):
                 try:
-                    compartment_list = [item for item in all_compartments if str(item.compartment_id) == str(cid)]
-
-                    if path != "":
-                        path = path + " / "
-
-                    for c in compartment_list:
-                        if c.lifecycle_state == oci.identity.models.Compartment.LIFECYCLE_STATE_ACTIVE:
-                            cvalue = {
-                                'id': str(c.id),
-                                'name': str(c.name),
-                                'description': str(c.description),
-                                'time_created': str(c.time_created),
-                                'is_accessible': str(c.is_accessible),
-                                'path': path + str(c.name),
-                                'defined_tags': [] if c.defined_tags is None else c.defined_tags,
-                                'freeform_tags': [] if c.freeform_tags is None else c.freeform_tags
-                            }
-                            compartments.append(cvalue)
-                            build_compartments_nested(identity_client, c.id, cvalue['path'])
+                    children = {}
+                    for item in all_compartments:
+                        children.setdefault(str(item.compartment_id), []).append(item)
+
+                    stack = [(c, "") for c in reversed(children.get(str(cid), []))]
+                    while stack:
+                        c, path = stack.pop()
+                        if c.lifecycle_state != oci.identity.models.Compartment.LIFECYCLE_STATE_ACTIVE:
+                            continue
+
+                        cvalue = {
+                            'id': str(c.id),
+                            'name': str(c.name),
+                            'description': str(c.description),
+                            'time_created': str(c.time_created),
+                            'is_accessible': str(c.is_accessible),
+                            'path': (path + " / " if path != "" else "") + str(c.name),
+                            'defined_tags': [] if c.defined_tags is None else c.defined_tags,
+                            'freeform_tags': [] if c.freeform_tags is None else c.freeform_tags
+                        }
+                        compartments.append(cvalue)
+
+                        # indexes by id, by path and by parent
+                        self.compartments_ids[cvalue['id']] = cvalue
+                        self.compartments_paths[cvalue['path']] = cvalue
+                        self.compartments_children.setdefault(str(c.compartment_id), []).append(cvalue)
+
+                        stack.extend((child, cvalue['path']) for child in reversed(children.get(str(c.id), [])))
 
                 except Exception as error:
                     raise Exception("Error in build_compartments_nested: " + str(error.args))
@@ -926,11 +2481,13 @@ class ShowOCIService(object):
                         'freeform_tags': [] if tenc.freeform_tags is None else tenc.freeform_tags
                     }
                     compartments.append(cvalue)
+                    self.compartments_ids[cvalue['id']] = cvalue
+                    self.compartments_paths[cvalue['path']] = cvalue
             except Exception as error:
                 raise Exception("Error in add_tenant_compartment: " + str(error.args))
 
             # Build the compartments
-            build_compartments_nested(identity, tenancy['id'], "")
+            build_compartments_nested(tenancy['id'])
 
             # sort the compartment
             sorted_compartments = sorted(compartments, key=lambda k: k['path'])
@@ -941,24 +2498,53 @@ class ShowOCIService(object):
                 self.__load_print_cnt(len(compartments), start_time)
                 return
 
-            filtered_compart = []
+            # selected compartments by id, filters can be comma separated
+            # and compartment selected by more than one filter is added once
+            selected = {}
 
-            # if filter by compartment, then reduce list and return new list
-            if self.flags.filter_by_compartment:
-                for x in sorted_compartments:
-                    if self.flags.filter_by_compartment in x['name'] or self.flags.filter_by_compartment in x['id']:
-                        filtered_compart.append(x)
+            # if filter by compartment, exact ocid or name/ocid like
+            # ocid not in the tenancy list (i.e. BOAT) is read by get compartment
+            for value in self.__get_filter_values(self.flags.filter_by_compartment):
+                if value in self.compartments_ids:
+                    selected[value] = self.compartments_ids[value]
+                    continue
 
-            # if filter by path compartment, then reduce list and return new list
-            if self.flags.filter_by_compartment_path:
-                for x in sorted_compartments:
-                    if self.flags.filter_by_compartment_path == x['path']:
-                        filtered_compart.append(x)            # if filter by path compartment, then reduce list and return new list
+                if value.startswith("ocid1.compartment"):
+                    cvalue = self.__load_identity_single_compartment(identity, value)
+                    if cvalue:
+                        selected[cvalue['id']] = cvalue
+                    else:
+                        self.__print_filter_not_found("-cp", value)
+                    continue
 
-            if self.flags.filter_by_compartment_recursive:
-                for x in sorted_compartments:
-                    if self.flags.filter_by_compartment_recursive in x['path']:
-                        filtered_compart.append(x)
+                matched = [x for x in sorted_compartments if value in x['name'] or value in x['id']]
+                for x in matched:
+                    selected[x['id']] = x
+                if not matched:
+                    self.__print_filter_not_found("-cp", value)
+
+            # if filter by path compartment, exact path
+            for value in self.__get_filter_values(self.flags.filter_by_compartment_path):
+                if value in self.compartments_paths:
+                    selected[self.compartments_paths[value]['id']] = self.compartments_paths[value]
+                else:
+                    self.__print_filter_not_found("-cpath", value)
+
+            # if filter by compartment recursive, subtree of ocid, or path like
+            # path like is a substring match so it cannot use the paths index
+            for value in self.__get_filter_values(self.flags.filter_by_compartment_recursive):
+                if value in self.compartments_ids:
+                    for x in self.__get_compartments_subtree(self.compartments_ids[value]):
+                        selected[x['id']] = x
+                    continue
+
+                matched = [x for x in sorted_compartments if value in x['path']]
+                for x in matched:
+                    selected[x['id']] = x
+                if not matched:
+                    self.__print_filter_not_found("-cpr", value)
+
+            filtered_compart = sorted(selected.values(), key=lambda k: k['path'])
 
             # add to data
             self.data[self.C_IDENTITY][self.C_IDENTITY_COMPARTMENTS] = filtered_compart
@@ -969,6 +2555,204 @@ class ShowOCIService(object):
         except Exception as e:
             raise Exception("Error in __load_identity_compartments: " + str(e.args))
 
+    ##########################################################################
+    # split comma separated filter values, \\, is a comma inside a value
+    ##########################################################################
+    def __get_filter_values(self, value):
+        items = str(value).replace("\\,", "\0").split(",")
+        return [item.replace("\0", ",").strip() for item in items if item.strip()]
+
+    ##########################################################################
+    # check if the compartment filter is compartment ocids only, so they are
+    # read one by one without listing the tenancy (BOAT authentication)
+    ##########################################################################
+    def __is_single_compartments_filter(self):
+        values = self.__get_filter_values(self.flags.filter_by_compartment)
+        return bool(values) and all(value.startswith("ocid1.compartment") for value in values)
+
+    ##########################################################################
+    # read single compartment by ocid, return None if not found
+    ##########################################################################
+    def __load_identity_single_compartment(self, identity, compartment_id):
+        try:
+            compartment = identity.get_compartment(compartment_id).data
+        except oci.exceptions.ServiceError as e:
+            if self.__check_service_error(e.code):
+                self.__load_print_auth_warning()
+                return None
+            raise
+
+        return {
+            'id': str(compartment.id),
+            'name': str(compartment.name),
+            'description': str(compartment.description),
+            'time_created': str(compartment.time_created),
+            'is_accessible': str(compartment.is_accessible),
+            'path': str(compartment.name),
+            'defined_tags': [] if compartment.defined_tags is None else compartment.defined_tags,
+            'freeform_tags': [] if compartment.freeform_tags is None else compartment.freeform_tags
+        }
+
+    ##########################################################################
+    # report compartment filter value which did not match any compartment
+    ##########################################################################
+    def __print_filter_not_found(self, flag, value):
+        with self.lock:
+            self.warning += 1
+        print("\nCompartment filter " + flag + " '" + value + "' not found")
+
+    ##########################################################################
+    # return the compartment and all its sub compartments
+    ##########################################################################
+    def __get_compartments_subtree(self, root):
+        subtree = []
+        stack = [root]
+        while stack:
+            compartment = stack.pop()
+            subtree.append(compartment)
+            stack.extend(self.compartments_children.get(compartment['id'], []))
+        return subtree
+
+    ##########################################################################
+    # check if the compartments filter can be loaded by walking the subtrees
+    # only compartment paths and recursive compartment ocids
+    ##########################################################################
+    def __is_compartments_subtrees_filter(self):
+        paths = self.__get_filter_values(self.flags.filter_by_compartment_path)
+        ocids = self.__get_filter_values(self.flags.filter_by_compartment_recursive)
+
+        if self.flags.filter_by_compartment or not (paths or ocids):
+            return False
+
+        return all(not path.startswith("/") for path in paths) and all(ocid.startswith("ocid1.compartment") for ocid in ocids)
+
+    ##########################################################################
+    # Load the selected compartments without listing the whole tenancy
+    # compartment path is found by walking down the path names,
+    # recursive compartment by walking up for its path and down for its
+    # sub compartments, the children of each level are listed concurrently
+    ##########################################################################
+    def __load_identity_compartments_subtrees(self, identity):
+
+        self.__load_print_status("Compartments")
+        start_time = time.time()
+
+        try:
+            tenancy = self.data[self.C_IDENTITY][self.C_IDENTITY_TENANCY]
+            selected = {}
+
+            def list_children(compartment_id):
+                return oci.pagination.list_call_get_all_results(
+                    identity.list_compartments,
+                    compartment_id,
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
+            def add_compartment(c, path):
+                cvalue = {
+                    'id': str(c.id),
+                    'name': str(c.name),
+                    'description': str(c.description),
+                    'time_created': str(c.time_created),
+                    'is_accessible': str(c.is_accessible),
+                    'path': path,
+                    'defined_tags': [] if c.defined_tags is None else c.defined_tags,
+                    'freeform_tags': [] if c.freeform_tags is None else c.freeform_tags
+                }
+                selected[cvalue['id']] = cvalue
+                self.compartments_ids[cvalue['id']] = cvalue
+                self.compartments_paths[cvalue['path']] = cvalue
+                return cvalue
+
+            def is_active(c):
+                return c.lifecycle_state == oci.identity.models.Compartment.LIFECYCLE_STATE_ACTIVE
+
+            # compartment paths
+            for path in self.__get_filter_values(self.flags.filter_by_compartment_path):
+                try:
+                    names = [name.strip() for name in path.split("/")]
+                    parent_id = tenancy['id']
+                    compartment = None
+                    for name in names:
+                        compartment = next((c for c in list_children(parent_id) if str(c.name) == name and is_active(c)), None)
+                        if not compartment:
+                            break
+                        parent_id = compartment.id
+
+                    if compartment:
+                        add_compartment(compartment, " / ".join(names))
+                    else:
+                        self.__print_filter_not_found("-cpath", path)
+
+                except oci.exceptions.ServiceError as e:
+                    if self.__check_service_error(e.code):
+                        self.__load_print_auth_warning()
+                        self.__print_filter_not_found("-cpath", path)
+                        continue
+                    raise
+
+            # recursive compartments, the root with its path
+            roots = []
+            for compartment_id in self.__get_filter_values(self.flags.filter_by_compartment_recursive):
+                try:
+                    compartment = identity.get_compartment(compartment_id).data
+                    if not is_active(compartment):
+                        self.__print_filter_not_found("-cpr", compartment_id)
+                        continue
+
+                    names = [str(compartment.name)]
+                    parent_id = compartment.compartment_id
+                    while parent_id and parent_id != tenancy['id']:
+                        parent = identity.get_compartment(parent_id).data
+                        names.insert(0, str(parent.name))
+                        parent_id = parent.compartment_id
+
+                    roots.append(add_compartment(compartment, " / ".join(names)))
+
+                except oci.exceptions.ServiceError as e:
+                    if self.__check_service_error(e.code):
+                        self.__load_print_auth_warning()
+                        self.__print_filter_not_found("-cpr", compartment_id)
+                        continue
+                    raise
+
+            # walk down the sub compartments level by level
+            # compartment already selected by path is walked too, each compartment once
+            level = list({root['id']: root for root in roots}.values())
+            walked = set(root['id'] for root in level)
+            while level:
+                next_level = []
+                for parent, future in self.__load_concurrent_calls(level, lambda parent: list_children(parent['id'])):
+                    print(".", end="")
+                    try:
+                        for c in future.result():
+                            if not is_active(c):
+                                continue
+
+                            cvalue = selected.get(str(c.id)) or add_compartment(c, parent['path'] + " / " + str(c.name))
+                            self.compartments_children.setdefault(parent['id'], []).append(cvalue)
+                            if cvalue['id'] not in walked:
+                                walked.add(cvalue['id'])
+                                next_level.append(cvalue)
+
+                    except oci.exceptions.ServiceError as e:
+                        if self.__check_service_error(e.code):
+                            self.__load_print_auth_warning()
+                            continue
+                        raise
+
+                level = next_level
+
+            # add to data
+            compartments = sorted(selected.values(), key=lambda k: k['path'])
+            self.data[self.C_IDENTITY][self.C_IDENTITY_COMPARTMENTS] = compartments
+            self.__load_print_cnt(len(compartments), start_time)
+
+        except oci.exceptions.RequestException:
+            raise
+        except Exception as e:
+            raise Exception("Error in __load_identity_compartments_subtrees: " + str(e.args))
+
     ##########################################################################
     # Load single compartment to support BOAT authentication
     ##########################################################################
@@ -981,27 +2765,12 @@ class ShowOCIService(object):
         try:
 
             # read compartments to variable
-            compartment = ""
-            try:
-                compartment = identity.get_compartment(self.flags.filter_by_compartment).data
-            except oci.exceptions.ServiceError as e:
-                if self.__check_service_error(e.code):
-                    self.__load_print_auth_warning()
-                else:
-                    raise
-
-            if compartment:
-                cvalue = {
-                    'id': str(compartment.id),
-                    'name': str(compartment.name),
-                    'description': str(compartment.description),
-                    'time_created': str(compartment.time_created),
-                    'is_accessible': str(compartment.is_accessible),
-                    'path': str(compartment.name),
-                    'defined_tags': [] if compartment.defined_tags is None else compartment.defined_tags,
-                    'freeform_tags': [] if compartment.freeform_tags is None else compartment.freeform_tags
-                }
-                compartments.append(cvalue)
+            for compartment_id in self.__get_filter_values(self.flags.filter_by_compartment):
+                cvalue = self.__load_identity_single_compartment(identity, compartment_id)
+                if not cvalue:
+                    self.__print_filter_not_found("-cp", compartment_id)
+                elif cvalue['id'] not in [x['id'] for x in compartments]:
+                    compartments.append(cvalue)
 
             self.data[self.C_IDENTITY][self.C_IDENTITY_COMPARTMENTS] = compartments
             self.__load_print_cnt(len(compartments), start_time)
@@ -1037,22 +2806,32 @@ class ShowOCIService(object):
                 else:
                     raise
 
-            members = []
+            # indexes by id
+            users_by_id = {user.id: user for user in users}
+            groups_by_id = {group.id: group for group in groups}
+            identity_providers_by_id = {item.id: item for item in identity_providers}
+
+            # group names by user id
+            members = {}
 
             ##########################
             # add groups
             ##########################
-            for group in groups:
+            # list user group memberships for all groups concurrently
+            def list_user_group_memberships(group):
+                return oci.pagination.list_call_get_all_results(
+                    identity.list_user_group_memberships, tenancy_id, group_id=group.id, retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY).data
+
+            for group, future in self.__load_concurrent_calls(groups, list_user_group_memberships):
                 print(".", end="")
                 try:
-                    user_group_memberships = oci.pagination.list_call_get_all_results(
-                        identity.list_user_group_memberships, tenancy_id, group_id=group.id, retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY).data
+                    user_group_memberships = future.result()
 
                     group_users = []
                     for ugm in user_group_memberships:
-                        members.append({'user_id': ugm.user_id, 'group_id': ugm.group_id})
-                        for item in [str(item_var.name) for item_var in users if item_var.id == ugm.user_id]:
-                            group_users.append(item)
+                        members.setdefault(ugm.user_id, []).append(groups_by_id[ugm.group_id].name)
+                        if ugm.user_id in users_by_id:
+                            group_users.append(str(users_by_id[ugm.user_id].name))
 
                     datagroup.append({'id': group.id, 'name': group.name, 'users': ', '.join(x for x in group_users)})
 
@@ -1073,21 +2852,18 @@ class ShowOCIService(object):
             start_time = time.time()
             for user in users:
 
-                group_users = []
                 print(".", end="")
 
                 # find the group users
-                for ugm in [e['group_id'] for e in members if user.id == e['user_id']]:
-                    group_users.append(next(item for item in groups if item.id == ugm).name)
+                group_users = members.get(user.id, [])
 
                 # identity provider
-                identity_provider_name = ""
-                try:
-                    if user.identity_provider_id:
-                        identity_provider_name = next(
-                            item for item in identity_providers if item.id == user.identity_provider_id).name
-                except Exception:
-                    identity_provider_name = 'unknown'
+                identity_provider_name = ""
+                if user.identity_provider_id:
+                    if user.identity_provider_id in identity_providers_by_id:
+                        identity_provider_name = identity_providers_by_id[user.identity_provider_id].name
+                    else:
+                        identity_provider_name = 'unknown'
 
                 # user data
                 user_data = {
@@ -1333,9 +3109,7 @@ class ShowOCIService(object):
             print("Identity...")
 
             # create identity object
-            identity = oci.identity.IdentityClient(self.config, signer=self.signer)
-            if self.flags.proxy:
-                identity.base_client.session.proxies = {'https': self.flags.proxy}
+            identity = self.__get_client(oci.identity.IdentityClient)
 
             self.__load_print_status("Availability Domains")
             start_time = time.time()
@@ -1361,6 +3135,8 @@ class ShowOCIService(object):
 
             # add to data
             self.data[self.C_IDENTITY][self.C_IDENTITY_ADS] += data
+            with self.lock:
+                self.availability_domains[region_name] = data
 
             # mark count
             self.__load_print_cnt(len(data), start_time)
@@ -1382,12 +3158,8 @@ class ShowOCIService(object):
     def __load_core_network_main(self):
 
         try:
-            print("Network...")
-
             # Open connectivity to OCI
-            virtual_network = oci.core.VirtualNetworkClient(self.config, signer=self.signer)
-            if self.flags.proxy:
-                virtual_network.base_client.session.proxies = {'https': self.flags.proxy}
+            virtual_network = self.__get_client(oci.core.VirtualNetworkClient)
 
             # reference to compartments
             compartments = self.data[self.C_IDENTITY][self.C_IDENTITY_COMPARTMENTS]
@@ -1420,44 +3192,70 @@ class ShowOCIService(object):
             # reference to network:
             network = self.data[self.C_NETWORK]
 
+            # vcns and routes of the region
+            vcns = []
+            routes = []
+
             # append the data for vcns
-            vcns = self.__load_core_network_vcn(virtual_network, compartments)
-            network[self.C_NETWORK_VCN] += vcns
-
-            # mark if vcn exist for this regiot
-            self.is_vcn_exist_for_region = (len(vcns) > 0)
-
-            # read network resources only if there are vcns
-            if self.is_vcn_exist_for_region:
-
-                # append the data for subnets
-                subnets = self.__load_core_network_subnet(virtual_network, compartments, network[self.C_NETWORK_VCN])
-                network[self.C_NETWORK_SUBNET] += subnets
-                network[self.C_NETWORK_NSG] += self.__load_core_network_nsg(virtual_network, compartments)
-
-                # if to load all network resources
-                if self.flags.read_network:
-
-                    # append the data
-                    network[self.C_NETWORK_VLAN] += self.__load_core_network_vlan(virtual_network, compartments, vcns)
-                    network[self.C_NETWORK_LPG] += self.__load_core_network_lpg(virtual_network, compartments)
-                    network[self.C_NETWORK_SGW] += self.__load_core_network_sgw(virtual_network, compartments)
-                    network[self.C_NETWORK_NAT] += self.__load_core_network_nat(virtual_network, compartments)
-                    network[self.C_NETWORK_DRG_AT] += self.__load_core_network_dra(virtual_network, compartments)
-                    network[self.C_NETWORK_DRG] += self.__load_core_network_drg(virtual_network, compartments)
-                    network[self.C_NETWORK_CPE] += self.__load_core_network_cpe(virtual_network, compartments)
-                    network[self.C_NETWORK_IPS] += self.__load_core_network_ips(virtual_network, compartments)
-                    network[self.C_NETWORK_RPC] += self.__load_core_network_rpc(virtual_network, compartments)
-                    network[self.C_NETWORK_VC] += self.__load_core_network_vc(virtual_network, compartments)
-                    network[self.C_NETWORK_IGW] += self.__load_core_network_igw(virtual_network, compartments)
-                    network[self.C_NETWORK_SLIST] += self.__load_core_network_seclst(virtual_network, compartments)
-                    network[self.C_NETWORK_DHCP] += self.__load_core_network_dhcpop(virtual_network, compartments)
-
-                    routes = self.__load_core_network_routet(virtual_network, compartments)
+            def load_vcn():
+                vcns.extend(self.__load_core_network_vcn(virtual_network, compartments))
+                network[self.C_NETWORK_VCN] += vcns
+
+            # read network resources only if there are vcns for this region
+            def load_network(section, function, *args):
+                def load():
+                    if vcns:
+                        network[section] += function(virtual_network, compartments, *args)
+                return load
+
+            # nsgs with the nsg names index of the region
+            def load_nsg():
+                if vcns:
+                    nsgs = self.__load_core_network_nsg(virtual_network, compartments)
+                    network[self.C_NETWORK_NSG] += nsgs
+                    self.__add_network_nsg_names(nsgs)
+
+            def load_routet():
+                if vcns:
+                    routes.extend(self.__load_core_network_routet(virtual_network, compartments))
                     network[self.C_NETWORK_ROUTE] += routes
+
+            def load_privateip():
+                if vcns:
                     network[self.C_NETWORK_PRIVATEIP] += self.__load_core_network_privateip(virtual_network, routes)
 
-            print("")
+            # loaders with their inputs and outputs
+            group = "Network"
+            vcn = self.C_NETWORK_VCN
+            tasks = [
+                self.__load_task('network_vcn', group, load_vcn, [], [vcn]),
+                self.__load_task('network_subnet', group, load_network(self.C_NETWORK_SUBNET, self.__load_core_network_subnet, network[self.C_NETWORK_VCN]), [vcn], [self.C_NETWORK_SUBNET]),
+                self.__load_task('network_nsg', group, load_nsg, [vcn], [self.C_NETWORK_NSG])
+            ]
+
+            # if to load all network resources
+            if self.flags.read_network:
+                drg_inputs = [vcn, self.C_NETWORK_DRG_AT, self.C_NETWORK_DRG_RT]
+                tasks += [
+                    self.__load_task('network_vlan', group, load_network(self.C_NETWORK_VLAN, self.__load_core_network_vlan, vcns), [vcn], [self.C_NETWORK_VLAN]),
+                    self.__load_task('network_lpg', group, load_network(self.C_NETWORK_LPG, self.__load_core_network_lpg), [vcn], [self.C_NETWORK_LPG]),
+                    self.__load_task('network_sgw', group, load_network(self.C_NETWORK_SGW, self.__load_core_network_sgw), [vcn], [self.C_NETWORK_SGW]),
+                    self.__load_task('network_nat', group, load_network(self.C_NETWORK_NAT, self.__load_core_network_nat), [vcn], [self.C_NETWORK_NAT]),
+                    self.__load_task('network_drg_attached', group, load_network(self.C_NETWORK_DRG_AT, self.__load_core_network_dra), [vcn], [self.C_NETWORK_DRG_AT]),
+                    self.__load_task('network_drg', group, load_network(self.C_NETWORK_DRG, self.__load_core_network_drg), [vcn, self.C_NETWORK_DRG_AT], [self.C_NETWORK_DRG, self.C_NETWORK_DRG_RT]),
+                    self.__load_task('network_cpe', group, load_network(self.C_NETWORK_CPE, self.__load_core_network_cpe), [vcn], [self.C_NETWORK_CPE]),
+                    self.__load_task('network_ipsec', group, load_network(self.C_NETWORK_IPS, self.__load_core_network_ips), drg_inputs, [self.C_NETWORK_IPS]),
+                    self.__load_task('network_rpc', group, load_network(self.C_NETWORK_RPC, self.__load_core_network_rpc), drg_inputs, [self.C_NETWORK_RPC]),
+                    self.__load_task('network_virtual_circuit', group, load_network(self.C_NETWORK_VC, self.__load_core_network_vc), drg_inputs, [self.C_NETWORK_VC]),
+                    self.__load_task('network_igw', group, load_network(self.C_NETWORK_IGW, self.__load_core_network_igw), [vcn], [self.C_NETWORK_IGW]),
+                    self.__load_task('network_seclist', group, load_network(self.C_NETWORK_SLIST, self.__load_core_network_seclst), [vcn], [self.C_NETWORK_SLIST]),
+                    self.__load_task('network_dhcp', group, load_network(self.C_NETWORK_DHCP, self.__load_core_network_dhcpop), [vcn], [self.C_NETWORK_DHCP]),
+                    self.__load_task('network_route', group, load_routet, [vcn], [self.C_NETWORK_ROUTE]),
+                    self.__load_task('network_privateip', group, load_privateip, [vcn, self.C_NETWORK_ROUTE], [self.C_NETWORK_PRIVATEIP])
+                ]
+
+            return tasks
+
         except oci.exceptions.RequestException:
             raise
         except oci.exceptions.ServiceError:
@@ -1478,18 +3276,22 @@ class ShowOCIService(object):
 
             self.__load_print_status("Virtual Cloud Networks")
 
+            # list vcns for all compartments concurrently
+            def list_vcns(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_vcns,
+                    compartment['id'],
+                    lifecycle_state=oci.core.models.Vcn.LIFECYCLE_STATE_AVAILABLE,
+                    sort_by="DISPLAYNAME",
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_vcns, resource=self.C_NETWORK_VCN):
 
                 vcns = []
                 try:
-                    vcns = oci.pagination.list_call_get_all_results(
-                        virtual_network.list_vcns,
-                        compartment['id'],
-                        lifecycle_state=oci.core.models.Vcn.LIFECYCLE_STATE_AVAILABLE,
-                        sort_by="DISPLAYNAME",
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    vcns = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -1512,7 +3314,7 @@ class ShowOCIService(object):
                            'defined_tags': [] if vcn.defined_tags is None else vcn.defined_tags,
                            'freeform_tags': [] if vcn.freeform_tags is None else vcn.freeform_tags,
                            'compartment_id': str(compartment['id']),
-                           'region_name': str(self.config['region'])}
+                           'region_name': str(self.__get_region_name())}
                     data.append(val)
                     cnt += 1
 
@@ -1542,17 +3344,21 @@ class ShowOCIService(object):
 
             self.__load_print_status("VLANs")
 
-            for compartment in compartments:
+            # list vlans for all compartments concurrently
+            def list_vlans(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_vlans,
+                    compartment['id'],
+                    lifecycle_state=oci.core.models.Vlan.LIFECYCLE_STATE_AVAILABLE,
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
+            for compartment, future in self.__load_concurrent_calls(compartments, list_vlans, resource=self.C_NETWORK_VLAN):
                 print(".", end="")
 
                 vlans = []
                 try:
-                    vlans = oci.pagination.list_call_get_all_results(
-                        virtual_network.list_vlans,
-                        compartment['id'],
-                        lifecycle_state=oci.core.models.Vlan.LIFECYCLE_STATE_AVAILABLE,
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    vlans = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if 'not whitelisted' in str(e.message).lower():
@@ -1580,7 +3386,7 @@ class ShowOCIService(object):
                            'compartment_id': str(compartment['id']),
                            'defined_tags': [] if vlan.defined_tags is None else vlan.defined_tags,
                            'freeform_tags': [] if vlan.freeform_tags is None else vlan.freeform_tags,
-                           'region_name': str(self.config['region'])
+                           'region_name': str(self.__get_region_name())
                            }
 
                     data.append(val)
@@ -1610,17 +3416,21 @@ class ShowOCIService(object):
 
             self.__load_print_status("Internet Gateways")
 
-            for compartment in compartments:
+            # list internet gateways for all compartments concurrently
+            def list_internet_gateways(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_internet_gateways,
+                    compartment['id'],
+                    lifecycle_state=oci.core.models.InternetGateway.LIFECYCLE_STATE_AVAILABLE,
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
+            for compartment, future in self.__load_concurrent_calls(compartments, list_internet_gateways, resource=self.C_NETWORK_IGW):
                 print(".", end="")
 
                 igws = []
                 try:
-                    igws = oci.pagination.list_call_get_all_results(
-                        virtual_network.list_internet_gateways,
-                        compartment['id'],
-                        lifecycle_state=oci.core.models.InternetGateway.LIFECYCLE_STATE_AVAILABLE,
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    igws = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -1634,7 +3444,7 @@ class ShowOCIService(object):
                            'time_created': str(igw.time_created),
                            'compartment_name': str(compartment['name']),
                            'compartment_id': str(compartment['id']),
-                           'region_name': str(self.config['region'])
+                           'region_name': str(self.__get_region_name())
                            }
 
                     data.append(val)
@@ -1662,16 +3472,20 @@ class ShowOCIService(object):
 
             self.__load_print_status("Local Peer GWs")
 
+            # list local peering gateways for all compartments concurrently
+            def list_local_peering_gateways(compartment):
+                return virtual_network.list_local_peering_gateways(
+                    compartment['id'],
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # Loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_local_peering_gateways, resource=self.C_NETWORK_LPG):
                 print(".", end="")
 
                 local_peering_gateways = []
                 try:
-                    local_peering_gateways = virtual_network.list_local_peering_gateways(
-                        compartment['id'],
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    local_peering_gateways = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -1704,7 +3518,7 @@ class ShowOCIService(object):
                            'compartment_id': str(compartment['id']),
                            'defined_tags': [] if lpg.defined_tags is None else lpg.defined_tags,
                            'freeform_tags': [] if lpg.freeform_tags is None else lpg.freeform_tags,
-                           'region_name': str(self.config['region'])}
+                           'region_name': str(self.__get_region_name())}
                     data.append(val)
                     cnt += 1
 
@@ -1734,16 +3548,20 @@ class ShowOCIService(object):
 
             self.__load_print_status("Remote Peer Conns")
 
+            # list remote peering connections for all compartments concurrently
+            def list_remote_peering_connections(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_remote_peering_connections,
+                    compartment['id'],
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # iLoop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_remote_peering_connections, resource=self.C_NETWORK_RPC):
 
                 rpcs = []
                 try:
-                    rpcs = oci.pagination.list_call_get_all_results(
-                        virtual_network.list_remote_peering_connections,
-                        compartment['id'],
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    rpcs = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -1763,7 +3581,7 @@ class ShowOCIService(object):
                            'is_cross_tenancy_peering': str(rpc.is_cross_tenancy_peering),
                            'peer_region_name': str(rpc.peer_region_name), 'peer_tenancy_id': str(rpc.peer_tenancy_id),
                            'peering_status': str(rpc.peering_status), 'compartment_name': str(compartment['name']),
-                           'compartment_id': str(compartment['id']), 'region_name': str(self.config['region']),
+                           'compartment_id': str(compartment['id']), 'region_name': str(self.__get_region_name()),
                            'drg_route_table_id': "",
                            'drg_route_table': ""
                            }
@@ -1802,18 +3620,22 @@ class ShowOCIService(object):
 
             self.__load_print_status("Route Tables")
 
+            # list route tables for all compartments concurrently
+            def list_route_tables(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_route_tables,
+                    compartment['id'],
+                    lifecycle_state=oci.core.models.RouteTable.LIFECYCLE_STATE_AVAILABLE,
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # Loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_route_tables, resource=self.C_NETWORK_ROUTE):
                 print(".", end="")
 
                 route_tables = []
                 try:
-                    route_tables = oci.pagination.list_call_get_all_results(
-                        virtual_network.list_route_tables,
-                        compartment['id'],
-                        lifecycle_state=oci.core.models.RouteTable.LIFECYCLE_STATE_AVAILABLE,
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    route_tables = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -1837,7 +3659,7 @@ class ShowOCIService(object):
                            'compartment_name': str(compartment['name']),
                            'defined_tags': [] if rt.defined_tags is None else rt.defined_tags,
                            'freeform_tags': [] if rt.freeform_tags is None else rt.freeform_tags,
-                           'compartment_id': str(compartment['id']), 'region_name': str(self.config['region'])}
+                           'compartment_id': str(compartment['id']), 'region_name': str(self.__get_region_name())}
                     data.append(val)
                     cnt += 1
 
@@ -1897,17 +3719,21 @@ class ShowOCIService(object):
 
             self.__load_print_status("DHCP Options")
 
+            # list dhcp options for all compartments concurrently
+            def list_dhcp_options(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_dhcp_options,
+                    compartment['id'],
+                    lifecycle_state=oci.core.models.DhcpOptions.LIFECYCLE_STATE_AVAILABLE,
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY).data
+
             # Loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_dhcp_options, resource=self.C_NETWORK_DHCP):
                 print(".", end="")
 
                 dhcp_options = []
                 try:
-                    dhcp_options = oci.pagination.list_call_get_all_results(
-                        virtual_network.list_dhcp_options,
-                        compartment['id'],
-                        lifecycle_state=oci.core.models.DhcpOptions.LIFECYCLE_STATE_AVAILABLE,
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY).data
+                    dhcp_options = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -1931,7 +3757,7 @@ class ShowOCIService(object):
                            'compartment_name': str(compartment['name']), 'compartment_id': str(compartment['id']),
                            'defined_tags': [] if dhcp.defined_tags is None else dhcp.defined_tags,
                            'freeform_tags': [] if dhcp.freeform_tags is None else dhcp.freeform_tags,
-                           'region_name': str(self.config['region'])}
+                           'region_name': str(self.__get_region_name())}
                     data.append(val)
                     cnt += 1
 
@@ -2111,19 +3937,23 @@ class ShowOCIService(object):
 
             self.__load_print_status("Security Lists")
 
+            # list security lists for all compartments concurrently
+            def list_security_lists(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_security_lists,
+                    compartment['id'],
+                    lifecycle_state=oci.core.models.SecurityList.LIFECYCLE_STATE_AVAILABLE,
+                    sort_by="DISPLAYNAME",
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # Loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_security_lists, resource=self.C_NETWORK_SLIST):
                 print(".", end="")
 
                 sec_lists = []
                 try:
-                    sec_lists = oci.pagination.list_call_get_all_results(
-                        virtual_network.list_security_lists,
-                        compartment['id'],
-                        lifecycle_state=oci.core.models.SecurityList.LIFECYCLE_STATE_AVAILABLE,
-                        sort_by="DISPLAYNAME",
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    sec_lists = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -2152,7 +3982,7 @@ class ShowOCIService(object):
                            'compartment_id': str(compartment['id']),
                            'defined_tags': [] if sl.defined_tags is None else sl.defined_tags,
                            'freeform_tags': [] if sl.freeform_tags is None else sl.freeform_tags,
-                           'region_name': str(self.config['region'])}
+                           'region_name': str(self.__get_region_name())}
                     data.append(val)
                     cnt += 1
 
@@ -2179,11 +4009,11 @@ class ShowOCIService(object):
 
             # search the nsgs, if cannot find specify the ocids instead of name
             for nsg in nsg_ids:
-                result = self.search_unique_item(self.C_NETWORK, self.C_NETWORK_NSG, 'id', str(nsg))
-                if result:
+                name = self.get_network_nsg_name(str(nsg))
+                if name is not None:
                     if return_value:
                         return_value += ", "
-                    return_value += result['name']
+                    return_value += name
                 else:
                     if return_value:
                         return_value += ", "
@@ -2349,8 +4179,17 @@ class ShowOCIService(object):
 
             self.__load_print_status("Network Security Groups")
 
+            # list network security groups for all compartments concurrently
+            def list_network_security_groups(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_network_security_groups,
+                    compartment_id=compartment['id'],
+                    lifecycle_state=oci.core.models.NetworkSecurityGroup.LIFECYCLE_STATE_AVAILABLE,
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_network_security_groups, skip_managed_paas=True, resource=self.C_NETWORK_NSG):
 
                 # ngw will throw error if run on Paas compartment
                 if self.__if_managed_paas_compartment(compartment['name']):
@@ -2359,12 +4198,7 @@ class ShowOCIService(object):
 
                 arrs = []
                 try:
-                    arrs = oci.pagination.list_call_get_all_results(
-                        virtual_network.list_network_security_groups,
-                        compartment_id=compartment['id'],
-                        lifecycle_state=oci.core.models.NetworkSecurityGroup.LIFECYCLE_STATE_AVAILABLE,
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    arrs = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -2385,7 +4219,7 @@ class ShowOCIService(object):
                            'defined_tags': [] if arr.defined_tags is None else arr.defined_tags,
                            'freeform_tags': [] if arr.freeform_tags is None else arr.freeform_tags,
                            'compartment_id': str(compartment['id']),
-                           'region_name': str(self.config['region']),
+                           'region_name': str(self.__get_region_name()),
                            'sec_rules': []
                            }
 
@@ -2437,19 +4271,27 @@ class ShowOCIService(object):
 
             self.__load_print_status("Subnets")
 
+            # vcns of the region by id
+            region_name = self.__get_region_name()
+            vcns_by_id = {vcn['id']: vcn for vcn in vcns if vcn['region_name'] == region_name}
+
+            # list subnets for all compartments concurrently
+            def list_subnets(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_subnets,
+                    compartment['id'],
+                    lifecycle_state=oci.core.models.Subnet.LIFECYCLE_STATE_AVAILABLE,
+                    sort_by="DISPLAYNAME",
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # Loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_subnets, resource=self.C_NETWORK_SUBNET):
                 print(".", end="")
 
                 subnets = []
                 try:
-                    subnets = oci.pagination.list_call_get_all_results(
-                        virtual_network.list_subnets,
-                        compartment['id'],
-                        lifecycle_state=oci.core.models.Subnet.LIFECYCLE_STATE_AVAILABLE,
-                        sort_by="DISPLAYNAME",
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    subnets = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -2481,16 +4323,16 @@ class ShowOCIService(object):
                            'defined_tags': [] if subnet.defined_tags is None else subnet.defined_tags,
                            'freeform_tags': [] if subnet.freeform_tags is None else subnet.freeform_tags,
                            'compartment_name': str(compartment['name']), 'compartment_id': str(compartment['id']),
-                           'region_name': str(self.config['region'])
+                           'region_name': str(self.__get_region_name())
                            }
 
                     # find vcn
-                    for vcn in vcns:
-                        if str(subnet.vcn_id) == vcn['id']:
-                            val['dns'] = str(subnet.dns_label) + "." + vcn['vcn_domain_name']
-                            val['vcn_name'] = vcn['display_name']
-                            val['vcn_domain_name'] = vcn['vcn_domain_name']
-                            val['vcn_cidr'] = str(', '.join(x for x in vcn['cidr_blocks']))
+                    vcn = vcns_by_id.get(str(subnet.vcn_id))
+                    if vcn:
+                        val['dns'] = str(subnet.dns_label) + "." + vcn['vcn_domain_name']
+                        val['vcn_name'] = vcn['display_name']
+                        val['vcn_domain_name'] = vcn['vcn_domain_name']
+                        val['vcn_cidr'] = str(', '.join(x for x in vcn['cidr_blocks']))
 
                     data.append(val)
                     cnt += 1
@@ -2521,17 +4363,21 @@ class ShowOCIService(object):
 
             self.__load_print_status("Service Gateways")
 
+            # list service gateways for all compartments concurrently
+            def list_service_gateways(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_service_gateways,
+                    compartment['id'],
+                    lifecycle_state=oci.core.models.ServiceGateway.LIFECYCLE_STATE_AVAILABLE,
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_service_gateways, resource=self.C_NETWORK_SGW):
 
                 sgws = []
                 try:
-                    sgws = oci.pagination.list_call_get_all_results(
-                        virtual_network.list_service_gateways,
-                        compartment['id'],
-                        lifecycle_state=oci.core.models.ServiceGateway.LIFECYCLE_STATE_AVAILABLE,
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    sgws = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -2554,7 +4400,7 @@ class ShowOCIService(object):
                            'compartment_id': str(compartment['id']),
                            'defined_tags': [] if sgw.defined_tags is None else sgw.defined_tags,
                            'freeform_tags': [] if sgw.freeform_tags is None else sgw.freeform_tags,
-                           'region_name': str(self.config['region'])}
+                           'region_name': str(self.__get_region_name())}
 
                     data.append(val)
                     cnt += 1
@@ -2585,8 +4431,17 @@ class ShowOCIService(object):
 
             self.__load_print_status("NAT Gateways")
 
+            # list nat gateways for all compartments concurrently
+            def list_nat_gateways(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_nat_gateways,
+                    compartment['id'],
+                    lifecycle_state=oci.core.models.NatGateway.LIFECYCLE_STATE_AVAILABLE,
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_nat_gateways, skip_managed_paas=True, resource=self.C_NETWORK_NAT):
                 # natgw will throw error if run on Paas compartment
                 if self.__if_managed_paas_compartment(compartment['name']):
                     print(".", end="")
@@ -2594,12 +4449,7 @@ class ShowOCIService(object):
 
                 natgws = []
                 try:
-                    natgws = oci.pagination.list_call_get_all_results(
-                        virtual_network.list_nat_gateways,
-                        compartment['id'],
-                        lifecycle_state=oci.core.models.NatGateway.LIFECYCLE_STATE_AVAILABLE,
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    natgws = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -2619,7 +4469,7 @@ class ShowOCIService(object):
                            'display_name': str(nat.display_name),
                            'defined_tags': [] if nat.defined_tags is None else nat.defined_tags,
                            'freeform_tags': [] if nat.freeform_tags is None else nat.freeform_tags,
-                           'compartment_name': str(compartment['name']), 'compartment_id': str(compartment['id']), 'region_name': str(self.config['region'])}
+                           'compartment_name': str(compartment['name']), 'compartment_id': str(compartment['id']), 'region_name': str(self.__get_region_name())}
 
                     if nat.block_traffic:
                         val['name'] += " - Blocked"
@@ -2652,17 +4502,21 @@ class ShowOCIService(object):
 
             self.__load_print_status("Dynamic Routing GW Attch")
 
+            # list drg attachments for all compartments concurrently
+            def list_drg_attachments(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_drg_attachments,
+                    compartment['id'],
+                    attachment_type="ALL",
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_drg_attachments):
 
                 arrs = []
                 try:
-                    arrs = oci.pagination.list_call_get_all_results(
-                        virtual_network.list_drg_attachments,
-                        compartment['id'],
-                        attachment_type="ALL",
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    arrs = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -2688,7 +4542,7 @@ class ShowOCIService(object):
                             'route_table_id': "" if str(arr.route_table_id) == "None" else str(arr.route_table_id),
                             'compartment_name': str(compartment['name']),
                             'compartment_id': str(compartment['id']),
-                            'region_name': str(self.config['region']),
+                            'region_name': str(self.__get_region_name()),
                             'ipsec_id': "",
                             'ipsec_connection_id': "",
                             'virtual_cirtcuit_id': "",
@@ -2737,16 +4591,20 @@ class ShowOCIService(object):
 
             self.__load_print_status("Dynamic Routing GWs")
 
+            # list drgs for all compartments concurrently
+            def list_drgs(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_drgs,
+                    compartment['id'],
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_drgs, resource=self.C_NETWORK_DRG):
 
                 arrs = []
                 try:
-                    arrs = oci.pagination.list_call_get_all_results(
-                        virtual_network.list_drgs,
-                        compartment['id'],
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    arrs = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -2769,7 +4627,7 @@ class ShowOCIService(object):
                                'compartment_id': str(compartment['id']),
                                'defined_tags': [] if arr.defined_tags is None else arr.defined_tags,
                                'freeform_tags': [] if arr.freeform_tags is None else arr.freeform_tags,
-                               'region_name': str(self.config['region'])
+                               'region_name': str(self.__get_region_name())
                                }
 
                         # get Redundancy
@@ -2894,16 +4752,20 @@ class ShowOCIService(object):
 
             self.__load_print_status("Customer Prem Equipments")
 
+            # list cpes for all compartments concurrently
+            def list_cpes(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_cpes,
+                    compartment['id'],
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_cpes, resource=self.C_NETWORK_CPE):
 
                 arrs = []
                 try:
-                    arrs = oci.pagination.list_call_get_all_results(
-                        virtual_network.list_cpes,
-                        compartment['id'],
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    arrs = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -2925,7 +4787,7 @@ class ShowOCIService(object):
                            'defined_tags': [] if arr.defined_tags is None else arr.defined_tags,
                            'freeform_tags': [] if arr.freeform_tags is None else arr.freeform_tags,
                            'compartment_id': str(compartment['id']),
-                           'region_name': str(self.config['region'])
+                           'region_name': str(self.__get_region_name())
                            }
                     data.append(val)
                     cnt += 1
@@ -2946,16 +4808,16 @@ class ShowOCIService(object):
     ##########################################################################
     # query private ip
     ##########################################################################
-    def __load_core_network_single_privateip(self, virtual_network, ip_id, return_name=True):
+    def __load_core_network_single_privateip(self, virtual_network, ip_id, return_name=True, private_ips=None):
 
         try:
             if 'privateip' not in ip_id:
                 return ""
 
-            arr = virtual_network.get_private_ip(
-                ip_id,
-                retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-            ).data
+            # use the private ips already requested
+            if not private_ips or ip_id not in private_ips:
+                private_ips = self.__load_private_ips_calls(virtual_network, [ip_id])
+            arr = private_ips[ip_id].result()
 
             if arr:
                 if return_name:
@@ -3011,6 +4873,12 @@ class ShowOCIService(object):
 
             self.__load_print_status("Routed Private IPs")
 
+            # get the private ips of all routes
+            private_ips = self.__load_private_ips_calls(
+                virtual_network,
+                [rl['network_entity_id'] for route in routes for rl in route['route_rules']]
+            )
+
             # loop on all routes with private ips
             for route in routes:
                 for rl in route['route_rules']:
@@ -3020,10 +4888,7 @@ class ShowOCIService(object):
                     # get the list
                     arr = None
                     try:
-                        arr = virtual_network.get_private_ip(
-                            rl['network_entity_id'],
-                            retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                        ).data
+                        arr = private_ips[rl['network_entity_id']].result()
                     except oci.exceptions.ServiceError as e:
                         if str(e.code) == 'NotAuthorizedOrNotFound':
                             continue
@@ -3042,7 +4907,7 @@ class ShowOCIService(object):
                            'hostname_label': str(arr.hostname_label), 'is_primary': str(arr.is_primary),
                            'ip_address': str(arr.ip_address), 'subnet_id': str(arr.subnet_id),
                            'compartment_id': str(arr.compartment_id), 'vnic_id': str(arr.vnic_id),
-                           'region_name': str(self.config['region'])}
+                           'region_name': str(self.__get_region_name())}
                     data.append(val)
                     cnt += 1
 
@@ -3072,15 +4937,19 @@ class ShowOCIService(object):
 
             self.__load_print_status("Virtual Circuits")
 
+            # list virtual circuits for all compartments concurrently
+            def list_virtual_circuits(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_virtual_circuits,
+                    compartment['id'],
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_virtual_circuits, resource=self.C_NETWORK_VC):
                 arrs = []
                 try:
-                    arrs = oci.pagination.list_call_get_all_results(
-                        virtual_network.list_virtual_circuits,
-                        compartment['id'],
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    arrs = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -3111,7 +4980,7 @@ class ShowOCIService(object):
                            'service_type': str(arr.service_type), 'cross_connect_mappings': data_cc,
                            'type': str(arr.type), 'time_created': str(arr.time_created),
                            'compartment_name': str(compartment['name']), 'compartment_id': str(compartment['id']),
-                           'region_name': str(self.config['region']),
+                           'region_name': str(self.__get_region_name()),
                            'drg_route_table_id': "",
                            'drg_route_table': ""
                            }
@@ -3151,16 +5020,20 @@ class ShowOCIService(object):
 
             self.__load_print_status("IPSEC tunnels")
 
+            # list ip sec connections for all compartments concurrently
+            def list_ip_sec_connections(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_ip_sec_connections,
+                    compartment['id'],
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_ip_sec_connections, resource=self.C_NETWORK_IPS):
 
                 arrs = []
                 try:
-                    arrs = oci.pagination.list_call_get_all_results(
-                        virtual_network.list_ip_sec_connections,
-                        compartment['id'],
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    arrs = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -3212,7 +5085,7 @@ class ShowOCIService(object):
                                'compartment_name': str(compartment['name']), 'compartment_id': str(compartment['id']),
                                'defined_tags': [] if arr.defined_tags is None else arr.defined_tags,
                                'freeform_tags': [] if arr.freeform_tags is None else arr.freeform_tags,
-                               'region_name': str(self.config['region']),
+                               'region_name': str(self.__get_region_name()),
                                'static_routes': [str(es) for es in arr.static_routes], 'tunnels': data_tun,
                                'drg_route_table_id': "",
                                'drg_route_table': ""
@@ -3253,22 +5126,14 @@ class ShowOCIService(object):
     def __load_core_compute_main(self):
 
         try:
-            print("Compute...")
-
             # BlockstorageClient
-            block_storage = oci.core.BlockstorageClient(self.config, signer=self.signer)
-            if self.flags.proxy:
-                block_storage.base_client.session.proxies = {'https': self.flags.proxy}
+            block_storage = self.__get_client(oci.core.BlockstorageClient)
 
             # ComputeClient
-            compute_client = oci.core.ComputeClient(self.config, signer=self.signer)
-            if self.flags.proxy:
-                compute_client.base_client.session.proxies = {'https': self.flags.proxy}
+            compute_client = self.__get_client(oci.core.ComputeClient)
 
             # virtual_network - for vnics
-            virtual_network = oci.core.VirtualNetworkClient(self.config, signer=self.signer)
-            if self.flags.proxy:
-                virtual_network.base_client.session.proxies = {'https': self.flags.proxy}
+            virtual_network = self.__get_client(oci.core.VirtualNetworkClient)
 
             # reference to compartments
             compartments = self.get_compartment()
@@ -3291,20 +5156,35 @@ class ShowOCIService(object):
             block = self.data[self.C_BLOCK]
 
             # append the data
-            compute[self.C_COMPUTE_INST] += self.__load_core_compute_instances(compute_client, compartments)
-            compute[self.C_COMPUTE_IMAGES] += self.__load_core_compute_images(compute_client, compartments)
-            compute[self.C_COMPUTE_BOOT_VOL_ATTACH] += self.__load_core_compute_boot_vol_attach(compute_client, compartments)
-            compute[self.C_COMPUTE_VOLUME_ATTACH] += self.__load_core_compute_vol_attach(compute_client, compartments)
-            compute[self.C_COMPUTE_VNIC_ATTACH] += self.__load_core_compute_vnic_attach(compute_client, virtual_network, compartments)
-
-            print("")
-            print("Block Storage...")
-
-            block[self.C_BLOCK_VOLGRP] += self.__load_core_block_volume_group(block_storage, compartments)
-            block[self.C_BLOCK_BOOT] += self.__load_core_block_boot(block_storage, compartments)
-            block[self.C_BLOCK_VOL] += self.__load_core_block_volume(block_storage, compartments)
-
-            print("")
+            def load_compute(section, function, *args):
+                def load():
+                    compute[section] += function(*args)
+                return load
+
+            def load_block(section, function):
+                def load():
+                    block[section] += function(block_storage, compartments)
+                return load
+
+            # loaders with their inputs and outputs
+            # vnics resolve subnets and nsgs, boot and block volumes resolve the volume groups
+            group = "Compute"
+            tasks = [
+                self.__load_task('compute_instances', group, load_compute(self.C_COMPUTE_INST, self.__load_core_compute_instances, compute_client, compartments), [], [self.C_COMPUTE_INST]),
+                self.__load_task('compute_images', group, load_compute(self.C_COMPUTE_IMAGES, self.__load_core_compute_images, compute_client, compartments), [], [self.C_COMPUTE_IMAGES]),
+                self.__load_task('compute_boot_volume_attach', group, load_compute(self.C_COMPUTE_BOOT_VOL_ATTACH, self.__load_core_compute_boot_vol_attach, compute_client, compartments), [], [self.C_COMPUTE_BOOT_VOL_ATTACH]),
+                self.__load_task('compute_volume_attach', group, load_compute(self.C_COMPUTE_VOLUME_ATTACH, self.__load_core_compute_vol_attach, compute_client, compartments), [], [self.C_COMPUTE_VOLUME_ATTACH]),
+                self.__load_task('compute_vnic_attach', group, load_compute(self.C_COMPUTE_VNIC_ATTACH, self.__load_core_compute_vnic_attach, compute_client, virtual_network, compartments), [self.C_NETWORK_SUBNET, self.C_NETWORK_NSG], [self.C_COMPUTE_VNIC_ATTACH])
+            ]
+
+            group = "Block Storage"
+            tasks += [
+                self.__load_task('block_volume_group', group, load_block(self.C_BLOCK_VOLGRP, self.__load_core_block_volume_group), [], [self.C_BLOCK_VOLGRP]),
+                self.__load_task('block_boot', group, load_block(self.C_BLOCK_BOOT, self.__load_core_block_boot), [self.C_BLOCK_VOLGRP], [self.C_BLOCK_BOOT]),
+                self.__load_task('block_volume', group, load_block(self.C_BLOCK_VOL, self.__load_core_block_volume), [self.C_BLOCK_VOLGRP], [self.C_BLOCK_VOL])
+            ]
+
+            return tasks
 
         except oci.exceptions.RequestException:
             raise
@@ -3315,6 +5195,7 @@ class ShowOCIService(object):
             raise
         except Exception as e:
             self.__print_error("__load_core_compute_main", e)
+            return []
 
     ##########################################################################
     # data compute read instances
@@ -3330,24 +5211,30 @@ class ShowOCIService(object):
             self.__load_print_status("Instances")
 
             # loop on all compartments
-            for compartment in compartments:
+            # list instances and console connections for all compartments concurrently
+            def list_instances(compartment):
+                instances = oci.pagination.list_call_get_all_results(
+                    compute.list_instances,
+                    compartment['id'],
+                    sort_by="DISPLAYNAME",
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
+                instance_consoles = oci.pagination.list_call_get_all_results(
+                    compute.list_instance_console_connections,
+                    compartment['id'],
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
+                return instances, instance_consoles
+
+            for compartment, future in self.__load_concurrent_calls(compartments, list_instances, resource=self.C_COMPUTE_INST, empty_result=([], [])):
 
                 # read instances and console connections
                 arrs = []
                 consoles = []
                 try:
-                    arrs = oci.pagination.list_call_get_all_results(
-                        compute.list_instances,
-                        compartment['id'],
-                        sort_by="DISPLAYNAME",
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
-
-                    consoles = oci.pagination.list_call_get_all_results(
-                        compute.list_instance_console_connections,
-                        compartment['id'],
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    arrs, consoles = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -3357,13 +5244,18 @@ class ShowOCIService(object):
 
                 print(".", end="")
 
+                # skip terminated and provisioning instances
+                arrs = [arr for arr in arrs if not (
+                    arr.lifecycle_state == oci.core.models.Instance.LIFECYCLE_STATE_TERMINATED or
+                    arr.lifecycle_state == oci.core.models.Instance.LIFECYCLE_STATE_PROVISIONING or
+                    arr.lifecycle_state == oci.core.models.Instance.LIFECYCLE_STATE_TERMINATING)]
+
+                # get the images of the instances
+                images = self.__load_images_calls(compute, [arr.image_id for arr in arrs])
+
                 # loop on array
                 # arr = oci.core.models.Instance
                 for arr in arrs:
-                    if (arr.lifecycle_state == oci.core.models.Instance.LIFECYCLE_STATE_TERMINATED or
-                            arr.lifecycle_state == oci.core.models.Instance.LIFECYCLE_STATE_PROVISIONING or
-                            arr.lifecycle_state == oci.core.models.Instance.LIFECYCLE_STATE_TERMINATING):
-                        continue
 
                     # load data
                     val = {'id': str(arr.id), 'display_name': str(arr.display_name), 'shape': str(arr.shape),
@@ -3372,7 +5264,7 @@ class ShowOCIService(object):
                            'time_created': str(arr.time_created),
                            'time_maintenance_reboot_due': str(arr.time_maintenance_reboot_due),
                            'image_id': str(arr.image_id), 'compartment_name': str(compartment['name']),
-                           'compartment_id': str(compartment['id']), 'region_name': str(self.config['region']),
+                           'compartment_id': str(compartment['id']), 'region_name': str(self.__get_region_name()),
                            'console_id': "", 'console': "", 'console_connection_string': "",
                            'defined_tags': [] if arr.defined_tags is None else arr.defined_tags,
                            'freeform_tags': [] if arr.freeform_tags is None else arr.freeform_tags,
@@ -3421,12 +5313,13 @@ class ShowOCIService(object):
 
                     # mark reboot migration flag
                     if arr.time_maintenance_reboot_due is not None:
-                        self.reboot_migration_counter += 1
+                        with self.lock:
+                            self.reboot_migration_counter += 1
 
                     # get image info
                     try:
                         # image = oci.core.models.Image
-                        image = compute.get_image(arr.image_id).data
+                        image = images[arr.image_id].result()
                         if image:
                             val['image'] = str(image.display_name)
                             val['image_os'] = str(image.operating_system)
@@ -3472,18 +5365,22 @@ class ShowOCIService(object):
 
             self.__load_print_status("Images")
 
+            # list images for all compartments concurrently
+            def list_images(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    compute.list_images,
+                    compartment['id'],
+                    sort_by="DISPLAYNAME",
+                    lifecycle_state=oci.core.models.Image.LIFECYCLE_STATE_AVAILABLE,
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_images):
 
                 images = []
                 try:
-                    images = oci.pagination.list_call_get_all_results(
-                        compute.list_images,
-                        compartment['id'],
-                        sort_by="DISPLAYNAME",
-                        lifecycle_state=oci.core.models.Image.LIFECYCLE_STATE_AVAILABLE,
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    images = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -3491,10 +5388,16 @@ class ShowOCIService(object):
                         continue
                     raise
 
+                # add the listed images (custom and platform) to the images cache
+                self.__add_images_cache(images)
+
                 # filter the array to only customer images
                 arrs = [i for i in images if i.compartment_id is not None]
                 print(".", end="")
 
+                # get the base images
+                base_images = self.__load_images_calls(compute, [arr.base_image_id for arr in arrs], retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY)
+
                 # loop on array
                 # arr = oci.core.models.Image.
                 for arr in arrs:
@@ -3504,10 +5407,10 @@ class ShowOCIService(object):
                            'operating_system': str(arr.operating_system),
                            'size_in_gbs': str(round(arr.size_in_mbs / 1024)),
                            'compartment_name': str(compartment['name']), 'compartment_id': str(compartment['id']),
-                           'region_name': str(self.config['region']),
+                           'region_name': str(self.__get_region_name()),
                            'defined_tags': [] if arr.defined_tags is None else arr.defined_tags,
                            'freeform_tags': [] if arr.freeform_tags is None else arr.freeform_tags,
-                           'base_image_name': (str(compute.get_image(arr.base_image_id, retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY).data.display_name) if arr.base_image_id else "")
+                           'base_image_name': (str(base_images[arr.base_image_id].result().display_name) if arr.base_image_id else "")
                            }
                     data.append(val)
                     cnt += 1
@@ -3538,23 +5441,34 @@ class ShowOCIService(object):
 
             self.__load_print_status("Boot Volumes Attached")
 
+            # list boot volume attachments for all compartments and ads concurrently
+            # ListBootVolumeAttachments requires the availability domain, so unlike the
+            # boot volumes they cannot be listed once per compartment
+            ads = self.get_availability_domains(self.__get_region_name())
+            compartments_ads = [(compartment, ad) for compartment in compartments for ad in ads]
+
+            def list_boot_volume_attachments(compartment_ad):
+                compartment, ad = compartment_ad
+                return oci.pagination.list_call_get_all_results(
+                    compute.list_boot_volume_attachments,
+                    ad['name'],
+                    compartment['id'],
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
+            futures = self.__load_concurrent_calls(compartments_ads, list_boot_volume_attachments)
+
             # loop on all compartments
             for compartment in compartments:
                 print(".", end="")
 
                 # loop on all ads
-                ads = self.get_availability_domains(self.config['region'])
-
                 for ad in ads:
 
                     arrs = []
                     try:
-                        arrs = oci.pagination.list_call_get_all_results(
-                            compute.list_boot_volume_attachments,
-                            ad['name'],
-                            compartment['id'],
-                            retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                        ).data
+                        compartment_ad, future = next(futures)
+                        arrs = future.result()
 
                     except oci.exceptions.ServiceError as e:
                         if self.__check_service_error(e.code):
@@ -3569,7 +5483,7 @@ class ShowOCIService(object):
                                'boot_volume_id': str(arr.boot_volume_id), 'instance_id': str(arr.instance_id),
                                'lifecycle_state': str(arr.lifecycle_state), 'time_created': str(arr.time_created),
                                'compartment_name': str(compartment['name']), 'compartment_id': str(compartment['id']),
-                               'region_name': str(self.config['region'])}
+                               'region_name': str(self.__get_region_name())}
                         data.append(val)
                         cnt += 1
 
@@ -3599,15 +5513,19 @@ class ShowOCIService(object):
 
             self.__load_print_status("Volumes Attached")
 
+            # list volume attachments for all compartments concurrently
+            def list_volume_attachments(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    compute.list_volume_attachments,
+                    compartment['id'],
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_volume_attachments, resource=self.C_COMPUTE_VOLUME_ATTACH):
                 arrs = []
                 try:
-                    arrs = oci.pagination.list_call_get_all_results(
-                        compute.list_volume_attachments,
-                        compartment['id'],
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    arrs = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -3624,7 +5542,7 @@ class ShowOCIService(object):
                            'instance_id': str(arr.instance_id), 'lifecycle_state': str(arr.lifecycle_state),
                            'time_created': str(arr.time_created), 'attachment_type': str(arr.attachment_type),
                            'compartment_name': str(compartment['name']), 'compartment_id': str(compartment['id']),
-                           'region_name': str(self.config['region'])}
+                           'region_name': str(self.__get_region_name())}
                     data.append(val)
                     cnt += 1
 
@@ -3645,14 +5563,14 @@ class ShowOCIService(object):
     # load Core Network Vnic
     ##########################################################################
 
-    def __load_core_compute_vnic(self, virtual_network, vnic_id):
+    def __load_core_compute_vnic(self, virtual_network, vnic_id, vnics):
         data = {}
         try:
             if vnic_id is None:
                 return {}
 
             # get the vnic
-            vnic = virtual_network.get_vnic(vnic_id).data
+            vnic = vnics[vnic_id].result()
 
             # add attributes to data
             data['private_ip'] = str(vnic.private_ip)
@@ -3698,11 +5616,27 @@ class ShowOCIService(object):
             data['display_name'] += subnet_display
 
             # get all private_ip_addresses for vnic
+            # from the bulk vnic ips if the subnet was listed, otherwise by the vnic
             data['ip_addresses'] = []
-            private_ip_addresses = virtual_network.list_private_ips(vnic_id=vnic_id).data
+            vnic_ips = self.__load_core_compute_vnic_ips(virtual_network)
+            if str(vnic.subnet_id) in vnic_ips['subnet_ids']:
+                private_ip_addresses = vnic_ips['private_ips'].get(str(vnic_id), [])
+            else:
+                private_ip_addresses = virtual_network.list_private_ips(vnic_id=vnic_id).data
+
             for pip in private_ip_addresses:
                 data['ip_addresses'].append({'ip_address': str(pip.ip_address), 'id': str(pip.id), 'type': "Private"})
 
+                # public ip assigned to the private ip from the bulk public ips
+                if str(pip.id) in vnic_ips['public_ips']:
+                    pub_ip = vnic_ips['public_ips'][str(pip.id)]
+                    data['ip_addresses'].append({'ip_address': str(pub_ip.ip_address), 'id': str(pub_ip.id), 'type': "Public"})
+                    continue
+
+                # all public ips of the region listed, or private subnet without public ips
+                if vnic_ips['public_ips_complete'] or (str(vnic.subnet_id) in vnic_ips['subnet_ids'] and subnet and subnet['public_private'] == "Private"):
+                    continue
+
                 # get public ip assigned to the private ip
                 try:
                     privdetails = oci.core.models.GetPublicIpByPrivateIpIdDetails()
@@ -3728,6 +5662,131 @@ class ShowOCIService(object):
         except Exception as e:
             self.__print_error("__load_core_compute_vnic", e)
 
+    ##########################################################################
+    # get vnic ips of the region, loaded once per region by bulk calls of -ipbulk
+    # shared by the vnics attached and the db nodes
+    ##########################################################################
+    def __load_core_compute_vnic_ips(self, virtual_network):
+
+        if not self.flags.ip_bulk:
+            return {'subnet_ids': set(), 'private_ips': {}, 'public_ips': {}, 'public_ips_complete': False}
+
+        region_name = self.__get_region_name()
+        with self.lock:
+            future = self.vnic_ips.get(region_name)
+            load = future is None
+            if load:
+                future = self.vnic_ips[region_name] = concurrent.futures.Future()
+
+        if load:
+            try:
+                future.set_result(self.__load_core_compute_vnic_ips_bulk(virtual_network))
+            except Exception as e:
+                future.set_exception(e)
+
+        return future.result()
+
+    ##########################################################################
+    # load vnic ips by bulk calls
+    # private ips listed by subnet and grouped by vnic
+    # public ips listed once per region scope, reserved for the loaded compartments
+    # and ephemeral by availability domain for the compartments of the private
+    # ips joined to vnic, as ephemeral public ip is in the private ip compartment
+    # public_ips_complete is set if all the compartments are loaded, so private
+    # ip without public ip listed has no public ip and does not need get call
+    ##########################################################################
+    def __load_core_compute_vnic_ips_bulk(self, virtual_network):
+
+        vnic_ips = {'subnet_ids': set(), 'private_ips': {}, 'public_ips': {}, 'public_ips_complete': False}
+        try:
+            region_name = self.__get_region_name()
+
+            # subnets of the region
+            subnets = []
+            if self.C_NETWORK in self.data and self.C_NETWORK_SUBNET in self.data[self.C_NETWORK]:
+                subnets = [subnet for subnet in self.data[self.C_NETWORK][self.C_NETWORK_SUBNET] if subnet['region_name'] == region_name]
+
+            if not subnets:
+                return vnic_ips
+
+            # list private ips for all subnets concurrently
+            def list_private_ips(subnet):
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_private_ips,
+                    subnet_id=subnet['id'],
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
+            pip_compartments = set()
+            for subnet, future in self.__load_concurrent_calls(subnets, list_private_ips):
+                try:
+                    for pip in future.result():
+                        if not pip.vnic_id:
+                            continue
+                        vnic_ips['private_ips'].setdefault(str(pip.vnic_id), []).append(pip)
+                        pip_compartments.add(str(pip.compartment_id))
+                    vnic_ips['subnet_ids'].add(subnet['id'])
+
+                except oci.exceptions.ServiceError as e:
+                    if self.__check_service_error(e.code):
+                        continue
+                    raise
+
+            # primary ip first as listed by vnic, the secondary ips keep the listing order
+            for pips in vnic_ips['private_ips'].values():
+                pips.sort(key=lambda pip: not pip.is_primary)
+
+            # list public ips, reserved by compartment, ephemeral by compartment and availability domain
+            ads = self.get_availability_domains(region_name)
+            complete = not (self.flags.filter_by_compartment or self.flags.filter_by_compartment_path or self.flags.filter_by_compartment_recursive)
+            items = []
+            for compartment in self.get_compartment():
+                items.append((compartment, None))
+                if compartment['id'] in pip_compartments:
+                    items += [(compartment, ad['name']) for ad in ads]
+
+            def list_public_ips(compartment_ad):
+                compartment, ad = compartment_ad
+                if ad:
+                    return oci.pagination.list_call_get_all_results(
+                        virtual_network.list_public_ips,
+                        "AVAILABILITY_DOMAIN",
+                        compartment['id'],
+                        availability_domain=ad,
+                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                    ).data
+
+                return oci.pagination.list_call_get_all_results(
+                    virtual_network.list_public_ips,
+                    "REGION",
+                    compartment['id'],
+                    lifetime="RESERVED",
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
+            for compartment_ad, future in self.__load_concurrent_calls(items, list_public_ips):
+                try:
+                    for pub_ip in future.result():
+                        if pub_ip.private_ip_id:
+                            vnic_ips['public_ips'][str(pub_ip.private_ip_id)] = pub_ip
+
+                except oci.exceptions.ServiceError as e:
+                    if self.__check_service_error(e.code):
+                        complete = False
+                        continue
+                    raise
+
+            vnic_ips['public_ips_complete'] = complete
+            return vnic_ips
+
+        except oci.exceptions.RequestException as e:
+            if self.__check_request_error(e):
+                return {'subnet_ids': set(), 'private_ips': {}, 'public_ips': {}, 'public_ips_complete': False}
+            raise
+        except Exception as e:
+            self.__print_error("__load_core_compute_vnic_ips_bulk", e)
+            return {'subnet_ids': set(), 'private_ips': {}, 'public_ips': {}, 'public_ips_complete': False}
+
     ##########################################################################
     # data compute read volume attached
     ##########################################################################
@@ -3741,16 +5800,20 @@ class ShowOCIService(object):
 
             self.__load_print_status("Vnics Attached")
 
+            # list vnic attachments for all compartments concurrently
+            def list_vnic_attachments(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    compute.list_vnic_attachments,
+                    compartment['id'],
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_vnic_attachments, resource=self.C_COMPUTE_VNIC_ATTACH):
 
                 arrs = []
                 try:
-                    arrs = oci.pagination.list_call_get_all_results(
-                        compute.list_vnic_attachments,
-                        compartment['id'],
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    arrs = future.result()
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
                         self.__load_print_auth_warning()
@@ -3759,18 +5822,19 @@ class ShowOCIService(object):
 
                 print(".", end="")
 
+                # get the vnics of the attached vnics
+                arrs = [arr for arr in arrs if str(arr.lifecycle_state) == oci.core.models.VnicAttachment.LIFECYCLE_STATE_ATTACHED]
+                vnics = self.__load_get_calls(virtual_network.get_vnic, [arr.vnic_id for arr in arrs])
+
                 # loop on array
                 # arr = oci.core.models.VnicAttachment
                 for arr in arrs:
-                    if str(arr.lifecycle_state) != oci.core.models.VnicAttachment.LIFECYCLE_STATE_ATTACHED:
-                        continue
-
                     val = {'id': str(arr.id), 'display_name': str(arr.display_name), 'vnic_id': str(arr.vnic_id),
-                           'vnic_details': self.__load_core_compute_vnic(virtual_network, arr.vnic_id),
+                           'vnic_details': self.__load_core_compute_vnic(virtual_network, arr.vnic_id, vnics),
                            'instance_id': str(arr.instance_id), 'time_created': str(arr.time_created),
                            'nic_index': str(arr.nic_index), 'subnet_id': str(arr.subnet_id),
                            'compartment_name': str(compartment['name']), 'compartment_id': str(compartment['id']),
-                           'region_name': str(self.config['region'])}
+                           'region_name': str(self.__get_region_name())}
                     data.append(val)
                     cnt += 1
 
@@ -3789,17 +5853,17 @@ class ShowOCIService(object):
 
     ##########################################################################
     # get volume backup policy
+    # assignments is dict of volume id -> future of the policy assignments
     ##########################################################################
-    def __load_core_block_volume_backup_policy(self, block_storage, volume_id):
+    def __load_core_block_volume_backup_policy(self, block_storage, volume_id, assignments):
 
         try:
             backupstr = ""
-            backup_policy_assignments = block_storage.get_volume_backup_policy_asset_assignment(volume_id).data
+            backup_policy_assignments = assignments[volume_id].result()
 
             if backup_policy_assignments:
                 for backup_policy_assignment in backup_policy_assignments:
-                    bp = block_storage.get_volume_backup_policy(backup_policy_assignment.policy_id).data
-                    backupstr += bp.display_name + " "
+                    backupstr += self.__load_core_block_volume_backup_policy_name(block_storage, backup_policy_assignment.policy_id) + " "
             return backupstr
 
         except oci.exceptions.RequestException as e:
@@ -3813,6 +5877,50 @@ class ShowOCIService(object):
         except Exception as e:
             self.__print_error("__load_core_block_volume_backup_policy", e)
 
+    ##########################################################################
+    # get volume backup policy name by policy id from the policies cache
+    # the oracle defined policies of the region are preloaded once,
+    # other threads of the region wait for the preload to complete,
+    # the custom policies are loaded by get call on first use
+    ##########################################################################
+    def __load_core_block_volume_backup_policy_name(self, block_storage, policy_id):
+
+        region_name = self.__get_region_name()
+        with self.lock:
+            future = self.backup_policies_regions.get(region_name)
+            preload = future is None
+            if preload:
+                future = self.backup_policies_regions[region_name] = concurrent.futures.Future()
+
+        if preload:
+            try:
+                policies = oci.pagination.list_call_get_all_results(
+                    block_storage.list_volume_backup_policies,
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
+                with self.lock:
+                    for policy in policies:
+                        self.backup_policies[str(policy.id)] = str(policy.display_name)
+                future.set_result(True)
+
+            except oci.exceptions.ServiceError as e:
+                if self.__check_service_error(e.code):
+                    future.set_result(False)
+                else:
+                    future.set_exception(e)
+            except Exception as e:
+                future.set_exception(e)
+
+        future.result()
+
+        if str(policy_id) not in self.backup_policies:
+            bp = block_storage.get_volume_backup_policy(policy_id).data
+            with self.lock:
+                self.backup_policies[str(policy_id)] = str(bp.display_name)
+
+        return self.backup_policies[str(policy_id)]
+
     ##########################################################################
     # data compute read boot volume
     ##########################################################################
@@ -3826,59 +5934,82 @@ class ShowOCIService(object):
 
             self.__load_print_status("Boot Volumes")
 
-            # reference to volgroups
-            volgroups = self.data[self.C_BLOCK][self.C_BLOCK_VOLGRP]
+            # volume group names of the region by id
+            region_name = self.__get_region_name()
+            volgroups = {volgrp['id']: volgrp['display_name'] for volgrp in self.data[self.C_BLOCK][self.C_BLOCK_VOLGRP] if volgrp['region_name'] == region_name}
 
-            # loop on all compartments
-            for compartment in compartments:
-                print(".", end="")
+            # list boot volumes for all compartments concurrently by the compartment only,
+            # if the service requires the availability domain list by the compartment ads
+            availability_domains = self.get_availability_domains(region_name)
+            ads_names = [ad['name'] for ad in availability_domains]
 
-                # loop on all ads
-                availability_domains = self.get_availability_domains(self.config['region'])
-                for ad in availability_domains:
+            def list_boot_volumes(compartment):
+                try:
+                    boot_volumes = oci.pagination.list_call_get_all_results(
+                        block_storage.list_boot_volumes,
+                        compartment_id=compartment['id'],
+                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                    ).data
+
+                except oci.exceptions.ServiceError as e:
+                    if e.status != 400:
+                        raise
 
                     boot_volumes = []
-                    try:
-                        boot_volumes = oci.pagination.list_call_get_all_results(
+                    for ad in availability_domains:
+                        boot_volumes += oci.pagination.list_call_get_all_results(
                             block_storage.list_boot_volumes,
-                            ad['name'],
-                            compartment['id'],
+                            availability_domain=ad['name'],
+                            compartment_id=compartment['id'],
                             retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
                         ).data
 
-                    except oci.exceptions.ServiceError as e:
-                        if self.__check_service_error(e.code):
-                            self.__load_print_auth_warning()
-                            continue
-                        raise
+                # keep the availability domains order
+                return sorted(boot_volumes, key=lambda arr: ads_names.index(arr.availability_domain) if arr.availability_domain in ads_names else len(ads_names))
 
-                    # loop on array
-                    # arr = oci.core.models.BootVolume.
-                    for arr in boot_volumes:
+            # loop on all compartments
+            for compartment, future in self.__load_concurrent_calls(compartments, list_boot_volumes, resource=self.C_BLOCK_BOOT):
+                print(".", end="")
 
-                        val = {'id': str(arr.id), 'display_name': str(arr.display_name),
-                               'size_in_gbs': str(arr.size_in_gbs),
-                               'time_created': str(arr.time_created),
-                               'kms_key_id': str(arr.kms_key_id),
-                               'vpus_per_gb': str(arr.vpus_per_gb),
-                               'is_hydrated': str(arr.is_hydrated),
-                               'volume_group_id': str(arr.volume_group_id),
-                               'volume_group_name': "", 'availability_domain': str(arr.availability_domain),
-                               'compartment_name': str(compartment['name']), 'compartment_id': str(compartment['id']),
-                               'defined_tags': [] if arr.defined_tags is None else arr.defined_tags,
-                               'freeform_tags': [] if arr.freeform_tags is None else arr.freeform_tags,
-                               'region_name': str(self.config['region']),
-                               'backup_policy': self.__load_core_block_volume_backup_policy(block_storage, str(arr.id)),
-                               'lifecycle_state': str(arr.lifecycle_state)}
+                boot_volumes = []
+                try:
+                    boot_volumes = future.result()
+
+                except oci.exceptions.ServiceError as e:
+                    if self.__check_service_error(e.code):
+                        self.__load_print_auth_warning()
+                        continue
+                    raise
 
-                        # find vol group name
-                        for volgrp in volgroups:
-                            if str(arr.volume_group_id) == volgrp['id']:
-                                val['volume_group_name'] = volgrp['display_name']
+                # get the backup policy assignments of the boot volumes
+                assignments = self.__load_get_calls(block_storage.get_volume_backup_policy_asset_assignment, [str(arr.id) for arr in boot_volumes])
 
-                        # check boot volume backup policy
-                        data.append(val)
-                        cnt += 1
+                # loop on array
+                # arr = oci.core.models.BootVolume.
+                for arr in boot_volumes:
+
+                    val = {'id': str(arr.id), 'display_name': str(arr.display_name),
+                           'size_in_gbs': str(arr.size_in_gbs),
+                           'time_created': str(arr.time_created),
+                           'kms_key_id': str(arr.kms_key_id),
+                           'vpus_per_gb': str(arr.vpus_per_gb),
+                           'is_hydrated': str(arr.is_hydrated),
+                           'volume_group_id': str(arr.volume_group_id),
+                           'volume_group_name': "", 'availability_domain': str(arr.availability_domain),
+                           'compartment_name': str(compartment['name']), 'compartment_id': str(compartment['id']),
+                           'defined_tags': [] if arr.defined_tags is None else arr.defined_tags,
+                           'freeform_tags': [] if arr.freeform_tags is None else arr.freeform_tags,
+                           'region_name': str(self.__get_region_name()),
+                           'backup_policy': self.__load_core_block_volume_backup_policy(block_storage, str(arr.id), assignments),
+                           'lifecycle_state': str(arr.lifecycle_state)}
+
+                    # find vol group name
+                    if str(arr.volume_group_id) in volgroups:
+                        val['volume_group_name'] = volgroups[str(arr.volume_group_id)]
+
+                    # check boot volume backup policy
+                    data.append(val)
+                    cnt += 1
 
             self.__load_print_cnt(cnt, start_time)
             return data
@@ -3906,19 +6037,24 @@ class ShowOCIService(object):
 
             self.__load_print_status("Block Volumes")
 
-            # reference to volgroups
-            volgroups = self.data[self.C_BLOCK][self.C_BLOCK_VOLGRP]
+            # volume group names of the region by id
+            region_name = self.__get_region_name()
+            volgroups = {volgrp['id']: volgrp['display_name'] for volgrp in self.data[self.C_BLOCK][self.C_BLOCK_VOLGRP] if volgrp['region_name'] == region_name}
+
+            # list volumes for all compartments concurrently
+            def list_volumes(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    block_storage.list_volumes, compartment['id'],
+                    sort_by="DISPLAYNAME",
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
 
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_volumes, resource=self.C_BLOCK_VOL):
 
                 arrs = []
                 try:
-                    arrs = oci.pagination.list_call_get_all_results(
-                        block_storage.list_volumes, compartment['id'],
-                        sort_by="DISPLAYNAME",
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    arrs = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -3928,6 +6064,9 @@ class ShowOCIService(object):
 
                 print(".", end="")
 
+                # get the backup policy assignments of the volumes
+                assignments = self.__load_get_calls(block_storage.get_volume_backup_policy_asset_assignment, [str(arr.id) for arr in arrs])
+
                 # loop on array
                 # arr = oci.core.models.Volume.
                 for arr in arrs:
@@ -3944,14 +6083,13 @@ class ShowOCIService(object):
                            'is_hydrated': str(arr.is_hydrated),
                            'defined_tags': [] if arr.defined_tags is None else arr.defined_tags,
                            'freeform_tags': [] if arr.freeform_tags is None else arr.freeform_tags,
-                           'region_name': str(self.config['region']),
-                           'backup_policy': self.__load_core_block_volume_backup_policy(block_storage, str(arr.id)),
+                           'region_name': str(self.__get_region_name()),
+                           'backup_policy': self.__load_core_block_volume_backup_policy(block_storage, str(arr.id), assignments),
                            'lifecycle_state': str(arr.lifecycle_state)}
 
                     # find vol group name
-                    for volgrp in volgroups:
-                        if str(arr.volume_group_id) == volgrp['id']:
-                            val['volume_group_name'] = volgrp['display_name']
+                    if str(arr.volume_group_id) in volgroups:
+                        val['volume_group_name'] = volgroups[str(arr.volume_group_id)]
 
                     # check boot volume backup policy
                     data.append(val)
@@ -3983,8 +6121,18 @@ class ShowOCIService(object):
 
             self.__load_print_status("Block Volume Groups")
 
+            # list volume groups for all compartments concurrently
+            def list_volume_groups(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    block_storage.list_volume_groups,
+                    compartment['id'],
+                    sort_by="DISPLAYNAME",
+                    lifecycle_state=oci.core.models.VolumeGroup.LIFECYCLE_STATE_AVAILABLE,
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_volume_groups, skip_managed_paas=True, resource=self.C_BLOCK_VOLGRP):
 
                 if self.__if_managed_paas_compartment(compartment['name']):
                     print(".", end="")
@@ -3993,13 +6141,7 @@ class ShowOCIService(object):
                 # retrieve the data from oci
                 arrs = []
                 try:
-                    arrs = oci.pagination.list_call_get_all_results(
-                        block_storage.list_volume_groups,
-                        compartment['id'],
-                        sort_by="DISPLAYNAME",
-                        lifecycle_state=oci.core.models.VolumeGroup.LIFECYCLE_STATE_AVAILABLE,
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    arrs = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -4019,7 +6161,7 @@ class ShowOCIService(object):
                            'volume_ids': [str(a) for a in arr.volume_ids], 'compartment_name': str(compartment['name']),
                            'defined_tags': [] if arr.defined_tags is None else arr.defined_tags,
                            'freeform_tags': [] if arr.freeform_tags is None else arr.freeform_tags,
-                           'compartment_id': str(compartment['id']), 'region_name': str(self.config['region'])}
+                           'compartment_id': str(compartment['id']), 'region_name': str(self.__get_region_name())}
 
                     # check boot volume backup policy
                     data.append(val)
@@ -4050,16 +6192,10 @@ class ShowOCIService(object):
     def __load_database_main(self):
 
         try:
-            print("Database...")
-
             # LoadBalancerClient
-            database_client = oci.database.DatabaseClient(self.config, signer=self.signer, timeout=30)
-            if self.flags.proxy:
-                database_client.base_client.session.proxies = {'https': self.flags.proxy}
+            database_client = self.__get_client(oci.database.DatabaseClient, timeout=30)
 
-            virtual_network = oci.core.VirtualNetworkClient(self.config, signer=self.signer, timeout=15)
-            if self.flags.proxy:
-                virtual_network.base_client.session.proxies = {'https': self.flags.proxy}
+            virtual_network = self.__get_client(oci.core.VirtualNetworkClient, timeout=15)
 
             # reference to compartments
             compartments = self.get_compartment()
@@ -4075,13 +6211,24 @@ class ShowOCIService(object):
             db = self.data[self.C_DATABASE]
 
             # append the data
-            db[self.C_DATABASE_EXADATA] += self.__load_database_exadata_infrastructure(database_client, virtual_network, compartments)
-            db[self.C_DATABASE_DBSYSTEMS] += self.__load_database_dbsystems(database_client, virtual_network, compartments)
-            db[self.C_DATABASE_ADB_D_INFRA] += self.__load_database_adb_d_infrastructure(database_client, compartments)
-            db[self.C_DATABASE_ADB_DATABASE] += self.__load_database_adb_database(database_client, compartments)
-            db[self.C_DATABASE_SOFTWARE_IMAGES] += self.__load_database_software_images(database_client, compartments)
-
-            print("")
+            def load_database(section, function, *args):
+                def load():
+                    db[section] += function(*args)
+                return load
+
+            # loaders with their inputs and outputs
+            # exadata, db systems and dedicated infrastructures resolve the subnets
+            # exadata and db systems resolve the nsgs of the db nodes vnics
+            group = "Database"
+            subnet = self.C_NETWORK_SUBNET
+            nsg = self.C_NETWORK_NSG
+            return [
+                self.__load_task('database_exadata', group, load_database(self.C_DATABASE_EXADATA, self.__load_database_exadata_infrastructure, database_client, virtual_network, compartments), [subnet, nsg], [self.C_DATABASE_EXADATA]),
+                self.__load_task('database_dbsystems', group, load_database(self.C_DATABASE_DBSYSTEMS, self.__load_database_dbsystems, database_client, virtual_network, compartments), [subnet, nsg], [self.C_DATABASE_DBSYSTEMS]),
+                self.__load_task('database_adb_d_infrastructure', group, load_database(self.C_DATABASE_ADB_D_INFRA, self.__load_database_adb_d_infrastructure, database_client, compartments), [subnet], [self.C_DATABASE_ADB_D_INFRA]),
+                self.__load_task('database_autonomous', group, load_database(self.C_DATABASE_ADB_DATABASE, self.__load_database_adb_database, database_client, compartments), [], [self.C_DATABASE_ADB_DATABASE]),
+                self.__load_task('database_software_images', group, load_database(self.C_DATABASE_SOFTWARE_IMAGES, self.__load_database_software_images, database_client, compartments), [], [self.C_DATABASE_SOFTWARE_IMAGES])
+            ]
 
         except oci.exceptions.RequestException:
             raise
@@ -4089,17 +6236,18 @@ class ShowOCIService(object):
             raise
         except Exception as e:
             self.__print_error("__load_database_main", e)
+            return []
 
     ##########################################################################
     # __load_database_maintatance
     ##########################################################################
-    def __load_database_maintatance(self, database_client, maintenance_run_id, db_system_name):
+    def __load_database_maintatance(self, database_client, maintenance_run_id, db_system_name, add_alert=True):
         try:
             if not maintenance_run_id:
                 return {}
 
             # oci.database.models.MaintenanceRun
-            mt = database_client.get_maintenance_run(maintenance_run_id).data
+            mt = self.__load_database_maintenance_run(database_client, maintenance_run_id)
             val = {'id': str(mt.id),
                    'display_name': str(mt.display_name),
                    'description': str(mt.description),
@@ -4120,7 +6268,8 @@ class ShowOCIService(object):
                 delta = mt.time_scheduled.date() - datetime.date.today()
                 if delta.days <= 14 and delta.days >= 0 and not mt.time_started:
                     val['maintenance_alert'] = "DBSystem Maintenance is in " + str(delta.days).ljust(2, ' ') + " days, on " + str(mt.time_scheduled)[0:16] + " for " + db_system_name
-                    self.dbsystem_maintenance.append(val['maintenance_alert'])
+                    if add_alert:
+                        self.__add_database_maintenance_alert(val['maintenance_alert'])
             return val
 
         except oci.exceptions.ServiceError:
@@ -4132,6 +6281,37 @@ class ShowOCIService(object):
         except Exception as e:
             self.__print_error("__load_database_maintatance", e)
 
+    ##########################################################################
+    # get maintenance run by id, once per id for the whole run
+    ##########################################################################
+    def __load_database_maintenance_run(self, database_client, maintenance_run_id):
+
+        with self.lock:
+            future = self.maintenance_runs.get(maintenance_run_id)
+            owner = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                self.maintenance_runs[maintenance_run_id] = future
+
+        if owner:
+            try:
+                future.set_result(database_client.get_maintenance_run(
+                    maintenance_run_id,
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data)
+            except Exception as e:
+                future.set_exception(e)
+
+        return future.result()
+
+    ##########################################################################
+    # add maintenance alert, once per alert
+    ##########################################################################
+    def __add_database_maintenance_alert(self, alert):
+        with self.lock:
+            if alert not in self.dbsystem_maintenance:
+                self.dbsystem_maintenance.append(alert)
+
     ##########################################################################
     # __load_database_maintatance_windows
     ##########################################################################
@@ -4170,8 +6350,17 @@ class ShowOCIService(object):
 
             self.__load_print_status("Exadata Infrastructure")
 
+            # list cloud exadata infrastructures for all compartments concurrently
+            def list_cloud_exadata_infrastructures(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    database_client.list_cloud_exadata_infrastructures,
+                    compartment['id'],
+                    sort_by="DISPLAYNAME",
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_cloud_exadata_infrastructures, skip_managed_paas=True, resource=self.C_DATABASE_EXADATA):
                 # skip managed paas compartment
                 if self.__if_managed_paas_compartment(compartment['name']):
                     print(".", end="")
@@ -4182,12 +6371,7 @@ class ShowOCIService(object):
                 # list db system
                 list_exa = []
                 try:
-                    list_exa = oci.pagination.list_call_get_all_results(
-                        database_client.list_cloud_exadata_infrastructures,
-                        compartment['id'],
-                        sort_by="DISPLAYNAME",
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    list_exa = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -4196,6 +6380,9 @@ class ShowOCIService(object):
                     else:
                         raise
 
+                # vm clusters of the compartment by infrastructure id, listed once
+                vm_clusters = None
+
                 # loop on the Exadata infrastructure
                 # dbs = oci.database.models.CloudExadataInfrastructureSummary
                 for dbs in list_exa:
@@ -4203,6 +6390,9 @@ class ShowOCIService(object):
                             dbs.lifecycle_state == oci.database.models.CloudExadataInfrastructureSummary.LIFECYCLE_STATE_TERMINATING):
                         continue
 
+                    if vm_clusters is None:
+                        vm_clusters = self.__load_database_exadata_vm_clusters_by_exa(database_client, compartment)
+
                     value = {'id': str(dbs.id),
                              'display_name': str(dbs.display_name),
                              'shape': str(dbs.shape),
@@ -4225,8 +6415,8 @@ class ShowOCIService(object):
                              'maintenance_window': self.__load_database_maintatance_windows(dbs.maintenance_window),
                              'defined_tags': [] if dbs.defined_tags is None else dbs.defined_tags,
                              'freeform_tags': [] if dbs.freeform_tags is None else dbs.freeform_tags,
-                             'region_name': str(self.config['region']),
-                             'vm_clusters': self.__load_database_exadata_vm_clusters(database_client, virtual_network, dbs.id, compartment)
+                             'region_name': str(self.__get_region_name()),
+                             'vm_clusters': self.__load_database_exadata_vm_clusters(database_client, virtual_network, vm_clusters.get(str(dbs.id), []), compartment)
                              }
 
                     # get shape
@@ -4260,18 +6450,46 @@ class ShowOCIService(object):
             return data
 
     ##########################################################################
-    # __load_database_exadata_vm_clusters
+    # list the vm clusters of the compartment, return dict of infrastructure id -> list
     ##########################################################################
-    def __load_database_exadata_vm_clusters(self, database_client, virtual_network, exa_id, compartment):
+    def __load_database_exadata_vm_clusters_by_exa(self, database_client, compartment):
 
-        data = []
+        data = {}
         try:
-            vms = database_client.list_cloud_vm_clusters(
+            vms = oci.pagination.list_call_get_all_results(
+                database_client.list_cloud_vm_clusters,
                 compartment['id'],
-                cloud_exadata_infrastructure_id=exa_id,
                 retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
             ).data
 
+            for vm in vms:
+                data.setdefault(str(vm.cloud_exadata_infrastructure_id), []).append(vm)
+            return data
+
+        except oci.exceptions.ServiceError as e:
+            if self.__check_service_error(e.code):
+                self.__load_print_auth_warning()
+                return data
+            else:
+                raise
+        except oci.exceptions.RequestException as e:
+            if self.__check_request_error(e):
+                return data
+            raise
+        except Exception as e:
+            self.__print_error("__load_database_exadata_vm_clusters_by_exa", e)
+            return data
+
+    ##########################################################################
+    # __load_database_exadata_vm_clusters
+    ##########################################################################
+    def __load_database_exadata_vm_clusters(self, database_client, virtual_network, vms, compartment):
+
+        data = []
+        try:
+            # request the scan and vip private ips of all vm clusters together
+            self.__load_private_ips_calls(virtual_network, [ip_id for arr in vms for ip_id in (arr.scan_ip_ids or []) + (arr.vip_ids or [])])
+
             # arr = oci.database.models.CloudVmClusterSummary
             for arr in vms:
                 if (arr.lifecycle_state == oci.database.models.CloudVmClusterSummary.LIFECYCLE_STATE_TERMINATED or
@@ -4318,7 +6536,7 @@ class ShowOCIService(object):
                     'patches': [],
                     'db_homes': self.__load_database_dbsystems_dbhomes(database_client, virtual_network, compartment, arr.id, exa=True),
                     'db_nodes': self.__load_database_dbsystems_dbnodes(database_client, virtual_network, compartment, arr.id, exa=True),
-                    'region_name': str(self.config['region']),
+                    'region_name': str(self.__get_region_name()),
                     'scan_ips': [],
                     'vip_ips': [],
                     'scan_dns_name': str(arr.scan_dns_name),
@@ -4344,18 +6562,21 @@ class ShowOCIService(object):
                 else:
                     value['license_model'] = str(arr.license_model)
 
+                # get scan and vip private ips
+                private_ips = self.__load_private_ips_calls(virtual_network, (arr.scan_ip_ids or []) + (arr.vip_ids or []))
+
                 # scan IPs
                 if arr.scan_ip_ids is not None:
                     scan_ips = []
                     for scan_ip in arr.scan_ip_ids:
-                        scan_ips.append(self.__load_core_network_single_privateip(virtual_network, scan_ip))
+                        scan_ips.append(self.__load_core_network_single_privateip(virtual_network, scan_ip, private_ips=private_ips))
                     value['scan_ips'] = scan_ips
 
                 # VIPs
                 if arr.vip_ids is not None:
                     vip_ips = []
                     for vipip in arr.vip_ids:
-                        vip_ips.append(self.__load_core_network_single_privateip(virtual_network, vipip))
+                        vip_ips.append(self.__load_core_network_single_privateip(virtual_network, vipip, private_ips=private_ips))
                     value['vip_ips'] = vip_ips
 
                 # add to main data
@@ -4423,8 +6644,17 @@ class ShowOCIService(object):
 
             self.__load_print_status("DB Systems")
 
+            # list db systems for all compartments concurrently
+            def list_db_systems(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    database_client.list_db_systems,
+                    compartment['id'],
+                    sort_by="DISPLAYNAME",
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_db_systems, skip_managed_paas=True, resource=self.C_DATABASE_DBSYSTEMS):
                 # skip managed paas compartment
                 if self.__if_managed_paas_compartment(compartment['name']):
                     print(".", end="")
@@ -4435,12 +6665,7 @@ class ShowOCIService(object):
                 # list db system
                 list_db_systems = []
                 try:
-                    list_db_systems = oci.pagination.list_call_get_all_results(
-                        database_client.list_db_systems,
-                        compartment['id'],
-                        sort_by="DISPLAYNAME",
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    list_db_systems = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -4449,12 +6674,37 @@ class ShowOCIService(object):
                     else:
                         raise
 
+                # request the scan and vip private ips of all db systems together
+                self.__load_private_ips_calls(virtual_network, [ip_id for dbs in list_db_systems for ip_id in (dbs.scan_ip_ids or []) + (dbs.vip_ids or [])])
+
+                # expand the subtrees of the db systems concurrently
+                subtrees = {}
+                for dbs in list_db_systems:
+                    if (dbs.lifecycle_state == oci.database.models.DbSystemSummary.LIFECYCLE_STATE_TERMINATED or dbs.lifecycle_state == "MIGRATED"):
+                        continue
+
+                    subtrees[dbs.id] = self.__load_subtree_calls({
+                        'last_maintenance_run': (self.__load_database_maintatance, (database_client, dbs.last_maintenance_run_id, str(dbs.display_name) + " - " + str(dbs.shape), False)),
+                        'next_maintenance_run': (self.__load_database_maintatance, (database_client, dbs.next_maintenance_run_id, str(dbs.display_name) + " - " + str(dbs.shape), False)),
+                        'patches': (self.__load_database_dbsystems_patches, (database_client, dbs.id)),
+                        'db_nodes': (self.__load_database_dbsystems_dbnodes, (database_client, virtual_network, compartment, dbs.id)),
+                        'db_homes': (self.__load_database_dbsystems_dbhomes, (database_client, virtual_network, compartment, dbs.id))
+                    })
+
                 # loop on the db systems
                 # dbs = oci.database.models.DbSystemSummary
                 for dbs in list_db_systems:
-                    if (dbs.lifecycle_state == oci.database.models.DbSystemSummary.LIFECYCLE_STATE_TERMINATED or dbs.lifecycle_state == "MIGRATED"):
+                    if dbs.id not in subtrees:
                         continue
 
+                    # wait for the subtree of the db system
+                    subtree = {key: future.result() for key, future in subtrees[dbs.id].items()}
+
+                    # add the maintenance alerts in the db systems order
+                    for maintenance in [subtree['last_maintenance_run'], subtree['next_maintenance_run']]:
+                        if maintenance and maintenance['maintenance_alert']:
+                            self.__add_database_maintenance_alert(maintenance['maintenance_alert'])
+
                     value = {'id': str(dbs.id),
                              'display_name': str(dbs.display_name),
                              'shape': str(dbs.shape),
@@ -4484,15 +6734,15 @@ class ShowOCIService(object):
                              'storage_management': "",
                              'sparse_diskgroup': str(dbs.sparse_diskgroup),
                              'reco_storage_size_in_gb': str(dbs.reco_storage_size_in_gb),
-                             'last_maintenance_run': self.__load_database_maintatance(database_client, dbs.last_maintenance_run_id, str(dbs.display_name) + " - " + str(dbs.shape)),
-                             'next_maintenance_run': self.__load_database_maintatance(database_client, dbs.next_maintenance_run_id, str(dbs.display_name) + " - " + str(dbs.shape)),
+                             'last_maintenance_run': subtree['last_maintenance_run'],
+                             'next_maintenance_run': subtree['next_maintenance_run'],
                              'maintenance_window': self.__load_database_maintatance_windows(dbs.maintenance_window),
-                             'region_name': str(self.config['region']),
+                             'region_name': str(self.__get_region_name()),
                              'defined_tags': [] if dbs.defined_tags is None else dbs.defined_tags,
                              'freeform_tags': [] if dbs.freeform_tags is None else dbs.freeform_tags,
-                             'patches': self.__load_database_dbsystems_patches(database_client, dbs.id),
-                             'db_nodes': self.__load_database_dbsystems_dbnodes(database_client, virtual_network, compartment, dbs.id),
-                             'db_homes': self.__load_database_dbsystems_dbhomes(database_client, virtual_network, compartment, dbs.id),
+                             'patches': subtree['patches'],
+                             'db_nodes': subtree['db_nodes'],
+                             'db_homes': subtree['db_homes'],
                              'scan_dns_name': "" if dbs.scan_dns_name is None else str(dbs.scan_dns_name),
                              'zone_id': str(dbs.zone_id),
                              }
@@ -4530,12 +6780,15 @@ class ShowOCIService(object):
                     else:
                         value['database_edition_short'] = dbs.database_edition
 
+                    # get scan and vip private ips
+                    private_ips = self.__load_private_ips_calls(virtual_network, (dbs.scan_ip_ids or []) + (dbs.vip_ids or []))
+
                     # scan IPs
                     value['scan_ips'] = []
                     if dbs.scan_ip_ids is not None:
                         scan_ips = []
                         for scan_ip in dbs.scan_ip_ids:
-                            scan_ips.append(self.__load_core_network_single_privateip(virtual_network, scan_ip))
+                            scan_ips.append(self.__load_core_network_single_privateip(virtual_network, scan_ip, private_ips=private_ips))
                         value['scan_ips'] = scan_ips
 
                     # VIPs
@@ -4543,7 +6796,7 @@ class ShowOCIService(object):
                     if dbs.vip_ids is not None:
                         vip_ips = []
                         for vipip in dbs.vip_ids:
-                            vip_ips.append(self.__load_core_network_single_privateip(virtual_network, vipip))
+                            vip_ips.append(self.__load_core_network_single_privateip(virtual_network, vipip, private_ips=private_ips))
                         value['vip_ips'] = vip_ips
 
                     # add the data
@@ -4561,6 +6814,59 @@ class ShowOCIService(object):
             self.__print_error("__load_database_dbsystems", e)
             return data
 
+    ##########################################################################
+    # list db homes once per compartment by -dbbulk
+    # return dict of parent id -> list, or None to list per parent
+    # db nodes and databases require the parent id so they are listed per parent
+    ##########################################################################
+    def __load_database_bulk(self, database_client, compartment):
+
+        if not self.flags.db_bulk:
+            return None
+
+        key = (self.__get_region_name(), compartment['id'])
+        with self.lock:
+            future = self.database_bulk.get(key)
+            owner = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                self.database_bulk[key] = future
+
+        # on error the owner reports it once and all list per parent
+        if owner:
+            try:
+                future.set_result(self.__load_database_bulk_list(database_client, compartment['id']))
+            except oci.exceptions.ServiceError as e:
+                if self.__check_service_error(e.code):
+                    self.__load_print_auth_warning()
+                else:
+                    self.__print_error("__load_database_bulk, listing db homes per parent", e)
+                future.set_result(None)
+            except Exception as e:
+                self.__print_error("__load_database_bulk, listing db homes per parent", e)
+                future.set_result(None)
+
+        return future.result()
+
+    ##########################################################################
+    # list all db homes of the compartment and bucket them by parent id
+    ##########################################################################
+    def __load_database_bulk_list(self, database_client, compartment_id):
+
+        items = oci.pagination.list_call_get_all_results(
+            database_client.list_db_homes,
+            compartment_id,
+            retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+        ).data
+
+        data = {}
+        for item in items:
+            for parent in ['db_system_id', 'vm_cluster_id']:
+                parent_id = getattr(item, parent)
+                if parent_id:
+                    data.setdefault(str(parent_id), []).append(item)
+        return data
+
     ##########################################################################
     # __load_database_exadata_infrastructure
     ##########################################################################
@@ -4585,6 +6891,9 @@ class ShowOCIService(object):
                     retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
                 ).data
 
+            # get the vnics and backup vnics of the db nodes
+            vnics = self.__load_get_calls(virtual_network.get_vnic, [str(db_node.vnic_id) for db_node in db_nodes] + [str(db_node.backup_vnic_id) for db_node in db_nodes])
+
             # db_node = oci.database.models.DbNodeSummary
             for db_node in db_nodes:
                 data.append(
@@ -4597,13 +6906,14 @@ class ShowOCIService(object):
                      'maintenance_type': str(db_node.maintenance_type),
                      'time_maintenance_window_start': str(db_node.time_maintenance_window_start),
                      'time_maintenance_window_end': str(db_node.time_maintenance_window_end),
-                     'vnic_details': self.__load_core_compute_vnic(virtual_network, str(db_node.vnic_id)),
-                     'backup_vnic_details': self.__load_core_compute_vnic(virtual_network, str(db_node.backup_vnic_id)),
+                     'vnic_details': self.__load_core_compute_vnic(virtual_network, str(db_node.vnic_id), vnics),
+                     'backup_vnic_details': self.__load_core_compute_vnic(virtual_network, str(db_node.backup_vnic_id), vnics),
                      'software_storage_size_in_gb': str(db_node.software_storage_size_in_gb)})
 
                 # mark reboot migration flag
                 if db_node.maintenance_type is not None:
-                    self.reboot_migration_counter += 1
+                    with self.lock:
+                        self.reboot_migration_counter += 1
 
             # add to main data
             return data
@@ -4634,7 +6944,11 @@ class ShowOCIService(object):
         db_homes = []
         api_call = ""
         try:
-            if not exa:
+            bulk = self.__load_database_bulk(database_client, compartment)
+            if bulk is not None:
+                api_call = "database_client.list_db_homes with compartment_id"
+                db_homes = bulk.get(dbs_id, [])
+            elif not exa:
                 api_call = "database_client.list_db_homes with db_system_id"
                 db_homes = oci.pagination.list_call_get_all_results(
                     database_client.list_db_homes,
@@ -4702,10 +7016,14 @@ class ShowOCIService(object):
                 retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
             ).data
 
+            # data guard associations of the databases are listed concurrently
+            def list_data_guard_associations(db):
+                return self.__load_database_dbsystems_db_dg(database_client, db.id)
+
+            dbs = [db for db in dbs if db.lifecycle_state != oci.database.models.DatabaseSummary.LIFECYCLE_STATE_TERMINATED]
+
             # db = oci.database.models.DatabaseSummary
-            for db in dbs:
-                if db.lifecycle_state == oci.database.models.DatabaseSummary.LIFECYCLE_STATE_TERMINATED:
-                    continue
+            for db, dg_future in self.__load_concurrent_calls(dbs, self.__load_thread_function(list_data_guard_associations)):
 
                 value = {'id': str(db.id),
                          'compartment_id': str(db.compartment_id),
@@ -4736,7 +7054,7 @@ class ShowOCIService(object):
                     if db.connection_strings.cdb_default:
                         value['connection_strings_cdb'] = db.connection_strings.cdb_default
 
-                value['dataguard'] = self.__load_database_dbsystems_db_dg(database_client, db.id)
+                value['dataguard'] = dg_future.result()
                 data.append(value)
 
             # add to main data
@@ -4897,8 +7215,17 @@ class ShowOCIService(object):
 
             self.__load_print_status("Autonomous Dedicated")
 
+            # list autonomous exadata infrastructures for all compartments concurrently
+            def list_autonomous_exadata_infrastructures(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    database_client.list_autonomous_exadata_infrastructures,
+                    compartment['id'],
+                    sort_by="DISPLAYNAME",
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_autonomous_exadata_infrastructures, skip_managed_paas=True, resource=self.C_DATABASE_ADB_D_INFRA):
                 # skip managed paas compartment
                 if self.__if_managed_paas_compartment(compartment['name']):
                     print(".", end="")
@@ -4909,12 +7236,7 @@ class ShowOCIService(object):
                 # list_autonomous_exadata_infrastructures
                 list_exa = []
                 try:
-                    list_exa = oci.pagination.list_call_get_all_results(
-                        database_client.list_autonomous_exadata_infrastructures,
-                        compartment['id'],
-                        sort_by="DISPLAYNAME",
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    list_exa = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -4923,6 +7245,9 @@ class ShowOCIService(object):
                     else:
                         raise
 
+                # container databases of the compartment by infrastructure id, listed once
+                containers = None
+
                 # loop on the Exadata infrastructure
                 # dbs = oci.database.models.AutonomousExadataInfrastructureSummary
                 for dbs in list_exa:
@@ -4930,6 +7255,9 @@ class ShowOCIService(object):
                             dbs.lifecycle_state == oci.database.models.AutonomousExadataInfrastructureSummary.LIFECYCLE_STATE_TERMINATING):
                         continue
 
+                    if containers is None:
+                        containers = self.__load_database_adb_d_containers_by_exa(database_client, compartment)
+
                     value = {'id': str(dbs.id),
                              'display_name': str(dbs.display_name),
                              'availability_domain': str(dbs.availability_domain),
@@ -4955,8 +7283,8 @@ class ShowOCIService(object):
                              'freeform_tags': [] if dbs.freeform_tags is None else dbs.freeform_tags,
                              'compartment_name': str(compartment['name']),
                              'compartment_id': str(compartment['id']),
-                             'region_name': str(self.config['region']),
-                             'containers': self.__load_database_adb_d_containers(database_client, dbs.id, compartment)
+                             'region_name': str(self.__get_region_name()),
+                             'containers': self.__load_database_adb_d_containers(database_client, containers.get(str(dbs.id), []))
                              }
 
                     # license model
@@ -4991,18 +7319,43 @@ class ShowOCIService(object):
             return data
 
     ##########################################################################
-    # __load_database_autonomous_exadata_infrastructure
+    # list the autonomous container databases of the compartment, return dict of infrastructure id -> list
     ##########################################################################
-    def __load_database_adb_d_containers(self, database_client, exa_id, compartment):
+    def __load_database_adb_d_containers_by_exa(self, database_client, compartment):
 
-        data = []
+        data = {}
         try:
-            vms = database_client.list_autonomous_container_databases(
+            vms = oci.pagination.list_call_get_all_results(
+                database_client.list_autonomous_container_databases,
                 compartment['id'],
-                autonomous_exadata_infrastructure_id=exa_id,
                 retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
             ).data
 
+            for vm in vms:
+                data.setdefault(str(vm.autonomous_exadata_infrastructure_id), []).append(vm)
+            return data
+
+        except oci.exceptions.ServiceError as e:
+            if self.__check_service_error(e.code):
+                self.__load_print_auth_warning()
+                return data
+            else:
+                raise
+        except oci.exceptions.RequestException as e:
+            if self.__check_request_error(e):
+                return data
+            raise
+        except Exception as e:
+            self.__print_error("__load_database_adb_d_containers_by_exa", e)
+            return data
+
+    ##########################################################################
+    # __load_database_autonomous_exadata_infrastructure
+    ##########################################################################
+    def __load_database_adb_d_containers(self, database_client, vms):
+
+        data = []
+        try:
             # arr = oci.database.models.AutonomousContainerDatabaseSummary
             for arr in vms:
                 if (arr.lifecycle_state == oci.database.models.AutonomousContainerDatabaseSummary.LIFECYCLE_STATE_TERMINATED or
@@ -5035,7 +7388,7 @@ class ShowOCIService(object):
                     'db_version': str(arr.db_version),
                     'key_store_id': str(arr.key_store_id),
                     'key_store_wallet_name': str(arr.key_store_wallet_name),
-                    'region_name': str(self.config['region'])
+                    'region_name': str(self.__get_region_name())
                 }
 
                 # add to main data
@@ -5070,8 +7423,17 @@ class ShowOCIService(object):
 
             self.__load_print_status("Autonomous Databases")
 
+            # list autonomous databases for all compartments concurrently
+            def list_autonomous_databases(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    database_client.list_autonomous_databases,
+                    compartment['id'],
+                    sort_by="DISPLAYNAME",
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_autonomous_databases, skip_managed_paas=True, resource=self.C_DATABASE_ADB_DATABASE):
 
                 # skip managed paas compartment
                 if self.__if_managed_paas_compartment(compartment['name']):
@@ -5082,12 +7444,7 @@ class ShowOCIService(object):
 
                 list_autos = []
                 try:
-                    list_autos = oci.pagination.list_call_get_all_results(
-                        database_client.list_autonomous_databases,
-                        compartment['id'],
-                        sort_by="DISPLAYNAME",
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    list_autos = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -5118,7 +7475,7 @@ class ShowOCIService(object):
                              'compartment_id': str(compartment['id']),
                              'defined_tags': [] if dbs.defined_tags is None else dbs.defined_tags,
                              'freeform_tags': [] if dbs.freeform_tags is None else dbs.freeform_tags,
-                             'region_name': str(self.config['region']),
+                             'region_name': str(self.__get_region_name()),
                              'whitelisted_ips': "" if dbs.whitelisted_ips is None else str(', '.join(x for x in dbs.whitelisted_ips)),
                              'db_workload': str(dbs.db_workload),
                              'db_type': ("ATP" if str(dbs.db_workload) == "OLTP" else "ADWC"),
@@ -5189,8 +7546,17 @@ class ShowOCIService(object):
 
             self.__load_print_status("Database Software Images")
 
+            # list database software images for all compartments concurrently
+            def list_database_software_images(compartment):
+                return oci.pagination.list_call_get_all_results(
+                    database_client.list_database_software_images,
+                    compartment['id'],
+                    sort_by="DISPLAYNAME",
+                    retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
+                ).data
+
             # loop on all compartments
-            for compartment in compartments:
+            for compartment, future in self.__load_concurrent_calls(compartments, list_database_software_images, skip_managed_paas=True, resource=self.C_DATABASE_SOFTWARE_IMAGES):
 
                 # skip managed paas compartment
                 if self.__if_managed_paas_compartment(compartment['name']):
@@ -5201,12 +7567,7 @@ class ShowOCIService(object):
 
                 db_soft_images = []
                 try:
-                    db_soft_images = oci.pagination.list_call_get_all_results(
-                        database_client.list_database_software_images,
-                        compartment['id'],
-                        sort_by="DISPLAYNAME",
-                        retry_strategy=oci.retry.DEFAULT_RETRY_STRATEGY
-                    ).data
+                    db_soft_images = future.result()
 
                 except oci.exceptions.ServiceError as e:
                     if self.__check_service_error(e.code):
@@ -5240,7 +7601,7 @@ class ShowOCIService(object):
                              'compartment_id': str(compartment['id']),
                              'defined_tags': [] if array.defined_tags is None else array.defined_tags,
                              'freeform_tags': [] if array.freeform_tags is None else array.freeform_tags,
-                             'region_name': str(self.config['region'])
+                             'region_name': str(self.__get_region_name())
                              }
 
                     # add the data
@@ -5427,6 +7788,11 @@ class ShowOCIData(object):
                     continue
 
                 print("    Compartment " + compartment['path'] + "...")
+
+                # skip compartment without data in the region
+                if not self.service.is_region_compartment_data(region_name, compartment['id']):
+                    continue
+
                 data = {
                     'compartment_id': compartment['id'],
                     'compartment_name': compartment['name'],
@@ -5750,9 +8116,9 @@ class ShowOCIData(object):
                 nsgs = []
                 if 'nsg_ids' in vlan:
                     for nsg in vlan['nsg_ids']:
-                        nsg_obj = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_NSG, 'id', nsg)
-                        if nsg_obj:
-                            nsgs.append(nsg_obj['name'])
+                        nsg_name = self.service.get_network_nsg_name(nsg)
+                        if nsg_name is not None:
+                            nsgs.append(nsg_name)
 
                 # Get the route and dhcp options
                 route_name = ""
@@ -5843,10 +8209,10 @@ class ShowOCIData(object):
                         # source
                         #########################################################################
                         if valsec['source_type'] == "NETWORK_SECURITY_GROUP":
-                            result = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_NSG, 'id', valsec['source'])
-                            if result:
-                                valsec['source_name'] = result['name']
-                                valsec['desc'] = valsec['desc'].replace(self.service.C_NETWORK_NSG_REPTEXT, result['name'].ljust(17))
+                            nsg_name = self.service.get_network_nsg_name(valsec['source'])
+                            if nsg_name is not None:
+                                valsec['source_name'] = nsg_name
+                                valsec['desc'] = valsec['desc'].replace(self.service.C_NETWORK_NSG_REPTEXT, nsg_name.ljust(17))
                             else:
                                 # if not found place the OCID instead of name
                                 valsec['source_name'] = "Not Found"
@@ -5857,10 +8223,10 @@ class ShowOCIData(object):
                         # Destination
                         #########################################################################
                         if valsec['destination_type'] == "NETWORK_SECURITY_GROUP":
-                            result = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_NSG, 'id', valsec['destination'])
-                            if result:
-                                valsec['destination_name'] = result['name']
-                                valsec['desc'] = valsec['desc'].replace(self.service.C_NETWORK_NSG_REPTEXT, result['name'].ljust(17))
+                            nsg_name = self.service.get_network_nsg_name(valsec['destination'])
+                            if nsg_name is not None:
+                                valsec['destination_name'] = nsg_name
+                                valsec['desc'] = valsec['desc'].replace(self.service.C_NETWORK_NSG_REPTEXT, nsg_name.ljust(17))
                             else:
                                 # if not found place the OCID instead of name
                                 valsec['destination_name'] = "Not Found"
@@ -6017,7 +8383,7 @@ class ShowOCIData(object):
 
         vcn_data = []
         try:
-            vcns = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_VCN, 'region_name', region_name, 'compartment_id', compartment['id'])
+            vcns = self.service.search_region_compartment_items(self.service.C_NETWORK, self.service.C_NETWORK_VCN, region_name, compartment['id'])
 
             for vcn in vcns:
 
@@ -6071,7 +8437,7 @@ class ShowOCIData(object):
     def __get_core_network_cpe(self, region_name, compartment):
         data = []
         try:
-            cpes = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_CPE, 'region_name', region_name, 'compartment_id', compartment['id'])
+            cpes = self.service.search_region_compartment_items(self.service.C_NETWORK, self.service.C_NETWORK_CPE, region_name, compartment['id'])
             return cpes
 
         except Exception as e:
@@ -6085,7 +8451,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            drgs = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_DRG, 'region_name', region_name, 'compartment_id', compartment['id'])
+            drgs = self.service.search_region_compartment_items(self.service.C_NETWORK, self.service.C_NETWORK_DRG, region_name, compartment['id'])
             for drg in drgs:
                 drg_id = drg['id']
                 val = {
@@ -6110,6 +8476,7 @@ class ShowOCIData(object):
                 for da in drg_attachments:
                     if da['vcn_id']:
                         vcn = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_VCN, 'id', da['vcn_id'])
+                        # sets the drg routes of the vcn item, its search field 'id' is not changed
                         if vcn:
                             vcn['drg_route_table_id'] = da['drg_route_table_id']
                             vcn['drg_route_table'] = self.__get_core_network_drg_route(da['drg_route_table_id'])
@@ -6218,7 +8585,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            rpcs = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_RPC, 'region_name', region_name, 'compartment_id', compartment['id'])
+            rpcs = self.service.search_region_compartment_items(self.service.C_NETWORK, self.service.C_NETWORK_RPC, region_name, compartment['id'])
             for rpc in rpcs:
                 drg_name = self.__get_core_network_drg_name(rpc['drg_id'])
                 main_data = {
@@ -6253,7 +8620,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            list_ip_sec_connections = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_IPS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            list_ip_sec_connections = self.service.search_region_compartment_items(self.service.C_NETWORK, self.service.C_NETWORK_IPS, region_name, compartment['id'])
 
             for ips in list_ip_sec_connections:
                 drg = self.__get_core_network_drg_name(ips['drg_id'])
@@ -6292,7 +8659,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            list_virtual_circuits = self.service.search_multi_items(self.service.C_NETWORK, self.service.C_NETWORK_VC, 'region_name', region_name, 'compartment_id', compartment['id'])
+            list_virtual_circuits = self.service.search_region_compartment_items(self.service.C_NETWORK, self.service.C_NETWORK_VC, region_name, compartment['id'])
 
             for vc in list_virtual_circuits:
                 drg = self.__get_core_network_drg_name(vc['drg_id'])
@@ -6510,7 +8877,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            volumes = self.service.search_multi_items(self.service.C_BLOCK, self.service.C_BLOCK_VOL, 'region_name', region_name, 'compartment_id', compartment['id'])
+            volumes = self.service.search_region_compartment_items(self.service.C_BLOCK, self.service.C_BLOCK_VOL, region_name, compartment['id'])
             volattc = self.service.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_VOLUME_ATTACH, 'region_name', region_name)
 
             # loop on volumes
@@ -6559,7 +8926,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            volumes = self.service.search_multi_items(self.service.C_BLOCK, self.service.C_BLOCK_BOOT, 'region_name', region_name, 'compartment_id', compartment['id'])
+            volumes = self.service.search_region_compartment_items(self.service.C_BLOCK, self.service.C_BLOCK_BOOT, region_name, compartment['id'])
             volattc = self.service.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_BOOT_VOL_ATTACH, 'region_name', region_name)
 
             # loop on volumes
@@ -6609,7 +8976,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            volgroups = self.service.search_multi_items(self.service.C_BLOCK, self.service.C_BLOCK_VOLGRP, 'region_name', region_name, 'compartment_id', compartment['id'])
+            volgroups = self.service.search_region_compartment_items(self.service.C_BLOCK, self.service.C_BLOCK_VOLGRP, region_name, compartment['id'])
 
             for vplgrp in volgroups:
                 value = {'id': vplgrp['id'], 'name': vplgrp['display_name'], 'size_in_gbs': vplgrp['size_in_gbs'],
@@ -6647,7 +9014,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            instances = self.service.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_INST, 'region_name', region_name, 'compartment_id', compartment['id'])
+            instances = self.service.search_region_compartment_items(self.service.C_COMPUTE, self.service.C_COMPUTE_INST, region_name, compartment['id'])
 
             for instance in instances:
 
@@ -6767,7 +9134,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            images = self.service.search_multi_items(self.service.C_COMPUTE, self.service.C_COMPUTE_IMAGES, 'region_name', region_name, 'compartment_id', compartment['id'])
+            images = self.service.search_region_compartment_items(self.service.C_COMPUTE, self.service.C_COMPUTE_IMAGES, region_name, compartment['id'])
 
             for image in images:
                 value = {'id': image['id'],
@@ -6998,7 +9365,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            list_exas = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_EXADATA, 'region_name', region_name, 'compartment_id', compartment['id'])
+            list_exas = self.service.search_region_compartment_items(self.service.C_DATABASE, self.service.C_DATABASE_EXADATA, region_name, compartment['id'])
 
             for dbs in list_exas:
                 value = {
@@ -7099,7 +9466,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            list_db_systems = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_DBSYSTEMS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            list_db_systems = self.service.search_region_compartment_items(self.service.C_DATABASE, self.service.C_DATABASE_DBSYSTEMS, region_name, compartment['id'])
 
             for dbs in list_db_systems:
                 value = {'id': dbs['id'],
@@ -7250,9 +9617,9 @@ class ShowOCIData(object):
             # get the nsg names
             if dbs['nsg_ids']:
                 for nsg in dbs['nsg_ids']:
-                    nsg_obj = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_NSG, 'id', nsg)
-                    if nsg_obj:
-                        value['nsg_names'].append(nsg_obj['name'])
+                    nsg_name = self.service.get_network_nsg_name(nsg)
+                    if nsg_name is not None:
+                        value['nsg_names'].append(nsg_name)
 
             return value
 
@@ -7267,7 +9634,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            list_autos = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_ADB_DATABASE, 'region_name', region_name, 'compartment_id', compartment['id'])
+            list_autos = self.service.search_region_compartment_items(self.service.C_DATABASE, self.service.C_DATABASE_ADB_DATABASE, region_name, compartment['id'])
 
             for dbs in list_autos:
 
@@ -7289,7 +9656,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            infrastructures = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_ADB_D_INFRA, 'region_name', region_name, 'compartment_id', compartment['id'])
+            infrastructures = self.service.search_region_compartment_items(self.service.C_DATABASE, self.service.C_DATABASE_ADB_D_INFRA, region_name, compartment['id'])
 
             for infra in infrastructures:
                 value = {'id': str(infra['id']),
@@ -7348,9 +9715,9 @@ class ShowOCIData(object):
                 # get the nsg names
                 if infra['nsg_ids']:
                     for nsg in infra['nsg_ids']:
-                        nsg_obj = self.service.search_unique_item(self.service.C_NETWORK, self.service.C_NETWORK_NSG, 'id', nsg)
-                        if nsg_obj:
-                            value['nsg_names'].append(nsg_obj['name'])
+                        nsg_name = self.service.get_network_nsg_name(nsg)
+                        if nsg_name is not None:
+                            value['nsg_names'].append(nsg_name)
 
                 data.append(value)
             return data
@@ -7366,7 +9733,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            database_software_images = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_SOFTWARE_IMAGES, 'region_name', region_name, 'compartment_id', compartment['id'])
+            database_software_images = self.service.search_region_compartment_items(self.service.C_DATABASE, self.service.C_DATABASE_SOFTWARE_IMAGES, region_name, compartment['id'])
             return database_software_images
 
         except Exception as e:
@@ -7404,7 +9771,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            database_gg_deployments = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_GG_DEPLOYMENTS, 'region_name', region_name, 'compartment_id', compartment['id'])
+            database_gg_deployments = self.service.search_region_compartment_items(self.service.C_DATABASE, self.service.C_DATABASE_GG_DEPLOYMENTS, region_name, compartment['id'])
             return database_gg_deployments
 
         except Exception as e:
@@ -7418,7 +9785,7 @@ class ShowOCIData(object):
 
         data = []
         try:
-            database_gg_db_registrations = self.service.search_multi_items(self.service.C_DATABASE, self.service.C_DATABASE_GG_DB_REGISTRATION, 'region_name', region_name, 'compartment_id', compartment['id'])
+            database_gg_db_registrations = self.service.search_region_compartment_items(self.service.C_DATABASE, self.service.C_DATABASE_GG_DB_REGISTRATION, region_name, compartment['id'])
             return database_gg_db_registrations
 
         except Exception as e:
@@ -8872,9 +11239,9 @@ def set_parser_arguments():
     parser.add_argument('-t', default="", dest='profile', help='Config file section to use (tenancy profile)')
     parser.add_argument('-p', default="", dest='proxy', help='Set Proxy (i.e. www-proxy-server.com:80) ')
     parser.add_argument('-rg', default="", dest='region', help='Filter by Region')
-    parser.add_argument('-cp', default="", dest='compart', help='Filter by Compartment Name or OCID')
-    parser.add_argument('-cpr', default="", dest='compart_recur', help='Filter by Comp Name Recursive')
-    parser.add_argument('-cpath', default="", dest='compartpath', help='Filter by Compartment path ,(i.e. -cpath "Adi / Sub"')
+    parser.add_argument('-cp', default="", dest='compart', help='Filter by Compartment Name or OCID (comma separated, \\, for comma in name)')
+    parser.add_argument('-cpr', default="", dest='compart_recur', help='Filter by Comp Name or Path like, or OCID Recursive (comma separated, \\, for comma in name)')
+    parser.add_argument('-cpath', default="", dest='compartpath', help='Filter by Compartment path ,(i.e. -cpath "Adi / Sub", comma separated, \\, for comma in name)')
     parser.add_argument('-tenantid', default="", dest='tenantid', help='Override confile file tenancy_id')
     parser.add_argument('-cf', default="", dest='config', help="Config File (~/.oci/config)")
     parser.add_argument('-jf', type=argparse.FileType('w'), dest='joutfile', help="Output to file   (JSON format)")
@@ -8882,6 +11249,20 @@ def set_parser_arguments():
     parser.add_argument('-sjf', type=argparse.FileType('w'), dest='sjoutfile', help="Output to screen (nice format) and JSON File")
     parser.add_argument('-cachef', type=argparse.FileType('w'), dest='servicefile', help="Output Cache to file   (JSON format)")
     parser.add_argument('-caches', action='store_true', default=False, dest='servicescr', help="Output Cache to screen (JSON format)")
+    parser.add_argument('-threads-regions', type=int, default=1, dest='threads_regions', help="Number of regions to load in parallel (default 1)")
+    parser.add_argument('-threads-compartments', type=int, default=1, dest='threads_compartments', help="Number of compartment list calls to run in parallel (default 1)")
+    parser.add_argument('-threads-loaders', type=int, default=1, dest='threads_loaders', help="Number of region loaders to run in parallel by dependencies (default 1)")
+    parser.add_argument('-async', type=int, nargs='?', const=32, default=0, dest='async_calls', help="Use asyncio for get calls with up to N concurrent calls per endpoint (default 32, requires aiohttp)")
+    parser.add_argument('-connections', type=int, default=0, dest='connections', help="Connections pool size per SDK client (default by the parallel threads, min 10)")
+    parser.add_argument('-imagecache', default="", dest='image_cache_file', help="Images cache file to reuse images across runs (JSON format)")
+    parser.add_argument('-shapecache', default="", dest='shape_cache_file', help="Shapes catalog cache file to reuse shapes for 24 hours (JSON format)")
+    parser.add_argument('-dbbulk', action='store_true', default=False, dest='db_bulk', help="List db homes once per compartment instead of per db system")
+    parser.add_argument('-ipbulk', action='store_true', default=False, dest='ip_bulk', help="List vnic private ips once per subnet and public ips once per compartment")
+    parser.add_argument('-emptycache', default="", dest='empty_cache_file', help="Empty compartments cache file to skip resources seen empty in previous runs (JSON format)")
+    parser.add_argument('-search', action='store_true', default=False, dest='search', help="Discover the compartments of the resources by Resource Search and list only them")
+    parser.add_argument('-searchendpoint', default="", dest='search_endpoint', help="Resource Search endpoint override (i.e. local stand-in for testing)")
+    parser.add_argument('-emptyhours', type=int, default=24, dest='empty_cache_hours', help="Hours to skip a compartment resource seen empty before listing it again (default 24)")
+    parser.add_argument('-emptysample', type=int, default=10, dest='empty_cache_sample', help="Percent of the compartment resources seen empty to list again on every run (default 10)")
     parser.add_argument('--version', action='version', version='%(prog)s ' + version)
 
     result = parser.parse_args()
@@ -8915,6 +11296,45 @@ def set_service_extract_flags(cmd):
     if cmd.proxy:
         prm.proxy = cmd.proxy
 
+    if cmd.threads_regions > 1:
+        prm.threads_regions = cmd.threads_regions
+
+    if cmd.threads_compartments > 1:
+        prm.threads_compartments = cmd.threads_compartments
+
+    if cmd.threads_loaders > 1:
+        prm.threads_loaders = cmd.threads_loaders
+
+    if cmd.connections > 0:
+        prm.connections = cmd.connections
+
+    if cmd.image_cache_file:
+        prm.image_cache_file = cmd.image_cache_file
+
+    if cmd.shape_cache_file:
+        prm.shape_cache_file = cmd.shape_cache_file
+
+    if cmd.db_bulk:
+        prm.db_bulk = True
+
+    if cmd.ip_bulk:
+        prm.ip_bulk = True
+
+    if cmd.empty_cache_file:
+        prm.empty_cache_file = cmd.empty_cache_file
+        prm.empty_cache_hours = cmd.empty_cache_hours
+        prm.empty_cache_sample = cmd.empty_cache_sample
+
+    if cmd.search:
+        prm.search = True
+        prm.search_endpoint = cmd.search_endpoint
+
+    if cmd.async_calls > 0:
+        if aiohttp:
+            prm.async_calls = cmd.async_calls
+        else:
+            print("aiohttp is not installed, -async ignored")
+
     if cmd.mgdcompart:
         prm.read_ManagedCompartmentForPaaS = False
 
@@ -8975,4 +11395,5 @@ def print_to_json_file(output, file_name, data, header):
 ##########################################################################
 # Main
 ##########################################################################
-execute_extract()
+if __name__ == "__main__":
+    execute_extract()
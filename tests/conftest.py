@@ -0,0 +1,121 @@
+##########################################################################
+# showocic tests
+# the service is created from a config file with a generated key and the
+# calls are sent to a local stub server instead of the OCI endpoints
+##########################################################################
+import json
+import os
+import sys
+import threading
+
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import showocic  # noqa: E402
+
+TENANCY_ID = "ocid1.tenancy.oc1..tenancy"
+REGION = "us-ashburn-1"
+
+
+##########################################################################
+# config file with a generated api key
+##########################################################################
+@pytest.fixture(scope="session")
+def config_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp("oci")
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    key_file = path / "key.pem"
+    key_file.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.TraditionalOpenSSL,
+        serialization.NoEncryption()
+    ))
+
+    config = path / "config"
+    config.write_text(
+        "[DEFAULT]\n"
+        "tenancy = " + TENANCY_ID + "\n"
+        "user = ocid1.user.oc1..user\n"
+        "fingerprint = aa:bb:cc:dd:ee:ff:00:11:22:33:44:55:66:77:88:99\n"
+        "key_file = " + str(key_file) + "\n"
+        "region = " + REGION + "\n"
+    )
+    return str(config)
+
+
+##########################################################################
+# flags with the config file, tests set the rest before creating the service
+##########################################################################
+@pytest.fixture
+def flags(config_file):
+    flags = showocic.ShowOCIFlags()
+    flags.config_file = config_file
+    flags.config_section = "DEFAULT"
+    return flags
+
+
+@pytest.fixture
+def make_service(flags):
+    services = []
+
+    def make(**kwargs):
+        for name, value in kwargs.items():
+            setattr(flags, name, value)
+        service = showocic.ShowOCIService(flags)
+        service.data = {}  # data is a class attribute, not shared between the tests
+        services.append(service)
+        return service
+
+    yield make
+
+    for service in services:
+        service._ShowOCIService__close_compartments_pool()
+
+
+##########################################################################
+# local http server, handler(method, path, body) returns (status, json)
+# or (status, json, headers)
+##########################################################################
+@pytest.fixture
+def stub_server():
+    servers = []
+
+    def start(handler):
+        class Handler(BaseHTTPRequestHandler):
+
+            def respond(self):
+                length = int(self.headers.get("content-length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                response = handler(self.command, self.path, body)
+                status, data, headers = response if len(response) == 3 else response + ({},)
+                content = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(content)))
+                self.send_header("opc-request-id", "stub")
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = respond
+            do_POST = respond
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return "http://127.0.0.1:" + str(server.server_address[1])
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,138 @@
+##########################################################################
+# compartments tree and the -cp, -cpath and -cpr filters
+##########################################################################
+import oci
+
+from conftest import TENANCY_ID
+
+ACTIVE = oci.identity.models.Compartment.LIFECYCLE_STATE_ACTIVE
+DELETED = oci.identity.models.Compartment.LIFECYCLE_STATE_DELETED
+
+
+def compartment(compartment_id, name, parent_id, state=ACTIVE):
+    return oci.identity.models.Compartment(
+        id=compartment_id, name=name, compartment_id=parent_id, lifecycle_state=state,
+        description=name, is_accessible=True
+    )
+
+
+COMPARTMENTS = [
+    compartment("ocid1.compartment.oc1..a", "A", TENANCY_ID),
+    compartment("ocid1.compartment.oc1..a1", "A1", "ocid1.compartment.oc1..a"),
+    compartment("ocid1.compartment.oc1..a1x", "X", "ocid1.compartment.oc1..a1"),
+    compartment("ocid1.compartment.oc1..a2", "A2", "ocid1.compartment.oc1..a", DELETED),
+    compartment("ocid1.compartment.oc1..a2x", "X", "ocid1.compartment.oc1..a2"),
+    compartment("ocid1.compartment.oc1..b", "B", TENANCY_ID),
+    compartment("ocid1.compartment.oc1..b1", "X", "ocid1.compartment.oc1..b"),
+    compartment("ocid1.compartment.oc1..cd", "C,D", TENANCY_ID)
+]
+
+# compartment of other tenancy, read by get compartment only
+OTHER = compartment("ocid1.compartment.oc1..other", "Other", "ocid1.tenancy.oc1..other")
+
+
+class StubIdentity(object):
+
+    def __init__(self):
+        self.calls = []
+
+    def list_compartments(self, compartment_id, compartment_id_in_subtree=False, **kwargs):
+        self.calls.append(('list_compartments', compartment_id, compartment_id_in_subtree))
+        if compartment_id_in_subtree:
+            data = list(COMPARTMENTS)
+        else:
+            data = [c for c in COMPARTMENTS if c.compartment_id == compartment_id]
+        return oci.response.Response(200, {}, data, None)
+
+    def get_compartment(self, compartment_id, **kwargs):
+        self.calls.append(('get_compartment', compartment_id))
+        if compartment_id == TENANCY_ID:
+            return oci.response.Response(200, {}, compartment(TENANCY_ID, "tenancy", None), None)
+        for c in COMPARTMENTS + [OTHER]:
+            if c.id == compartment_id:
+                return oci.response.Response(200, {}, c, None)
+        raise oci.exceptions.ServiceError(404, "NotAuthorizedOrNotFound", {}, "not found " + compartment_id)
+
+
+def load_compartments(make_service, subtrees=False, **filters):
+    service = make_service(**filters)
+    service.data[service.C_IDENTITY] = {service.C_IDENTITY_TENANCY: {'id': TENANCY_ID}}
+    identity = StubIdentity()
+    if subtrees:
+        assert service._ShowOCIService__is_compartments_subtrees_filter()
+        service._ShowOCIService__load_identity_compartments_subtrees(identity)
+    else:
+        service._ShowOCIService__load_identity_compartments(identity)
+    return service, identity, [c['path'] for c in service.get_compartment()]
+
+
+def test_tree_paths_and_subtree(make_service):
+    service, identity, paths = load_compartments(make_service)
+
+    assert paths == ["/ tenancy (root)", "A", "A / A1", "A / A1 / X", "B", "B / X", "C,D"]
+    assert [c['id'] for c in service.compartments_children[TENANCY_ID]] == ["ocid1.compartment.oc1..a", "ocid1.compartment.oc1..b", "ocid1.compartment.oc1..cd"]
+
+    subtree = service._ShowOCIService__get_compartments_subtree(service.compartments_ids["ocid1.compartment.oc1..a"])
+    assert sorted(c['path'] for c in subtree) == ["A", "A / A1", "A / A1 / X"]
+
+
+def test_filter_by_compartment(make_service, capsys):
+    service, identity, paths = load_compartments(make_service, filter_by_compartment="ocid1.compartment.oc1..b,X,ocid1.compartment.oc1..other,nothing")
+
+    # exact ocid, name like (twice, added once), ocid of other tenancy by get compartment
+    assert paths == ["A / A1 / X", "B", "B / X", "Other"]
+    assert ('get_compartment', "ocid1.compartment.oc1..other") in identity.calls
+    assert "Compartment filter -cp 'nothing' not found" in capsys.readouterr().out
+    assert service.warning == 1
+
+
+def test_filter_by_compartment_name_with_comma(make_service):
+    service, identity, paths = load_compartments(make_service, filter_by_compartment="C\\,D")
+    assert paths == ["C,D"]
+    assert service._ShowOCIService__get_filter_values("a\\,b, c ,,d") == ["a,b", "c", "d"]
+
+
+def test_filter_by_compartment_ocids_only(make_service):
+    service = make_service(filter_by_compartment="ocid1.compartment.oc1..b, ocid1.compartment.oc1..other")
+    assert service._ShowOCIService__is_single_compartments_filter()
+
+    service = make_service(filter_by_compartment="ocid1.compartment.oc1..b,B")
+    assert not service._ShowOCIService__is_single_compartments_filter()
+
+
+def test_filter_by_path_and_recursive(make_service, capsys):
+    service, identity, paths = load_compartments(
+        make_service,
+        filter_by_compartment_path="B,A / A2,A / A1",
+        filter_by_compartment_recursive="ocid1.compartment.oc1..a1,ocid1.compartment.oc1..missing"
+    )
+
+    assert paths == ["A / A1", "A / A1 / X", "B"]
+    out = capsys.readouterr().out
+    assert "Compartment filter -cpath 'A / A2' not found" in out
+    assert "Compartment filter -cpr 'ocid1.compartment.oc1..missing' not found" in out
+
+
+def test_filter_by_recursive_path_like(make_service):
+    service, identity, paths = load_compartments(make_service, filter_by_compartment_recursive="A1")
+    assert paths == ["A / A1", "A / A1 / X"]
+
+
+def test_subtrees_match_the_tenancy_walk(make_service, capsys):
+    filters = {
+        'filter_by_compartment_path': "B,A / A1,A / A2",
+        'filter_by_compartment_recursive': "ocid1.compartment.oc1..a,ocid1.compartment.oc1..missing"
+    }
+
+    service, identity, paths = load_compartments(make_service, **filters)
+    tenancy_out = capsys.readouterr().out
+
+    for threads in (1, 4):
+        service, identity, subtree_paths = load_compartments(make_service, subtrees=True, threads_compartments=threads, **filters)
+        subtree_out = capsys.readouterr().out
+
+        assert subtree_paths == paths
+        assert not any(call[-1] is True for call in identity.calls)
+        for flag, value in (("-cpath", "A / A2"), ("-cpr", "ocid1.compartment.oc1..missing")):
+            message = "Compartment filter " + flag + " '" + value + "' not found"
+            assert message in tenancy_out and message in subtree_out
@@ -0,0 +1,63 @@
+##########################################################################
+# get calls by the get calls pool and by asyncio return the same results
+##########################################################################
+import oci
+import pytest
+
+import showocic
+from conftest import REGION
+
+IDS = ["ocid1.image.oc1..image" + str(i) for i in range(20)] + ["ocid1.image.oc1..missing", "ocid1.image.oc1..image0", None]
+
+
+def handler(method, path, body):
+    kind, item_id = path.split("/")[2:4]
+    if "missing" in item_id:
+        return 404, {'code': 'NotAuthorizedOrNotFound', 'message': 'not found ' + item_id}
+    if kind == "images":
+        return 200, {'id': item_id, 'displayName': 'image ' + item_id, 'operatingSystem': 'Oracle Linux', 'timeCreated': '2021-01-01T00:00:00.000Z'}
+    return 200, {'id': item_id, 'privateIp': '10.0.0.1', 'nsgIds': ['nsg1', 'nsg2'], 'isPrimary': True}
+
+
+def load_get_calls(service, endpoint, client_class, function_name):
+    service._ShowOCIService__set_region_context(REGION)
+    client = service._ShowOCIService__get_client(client_class, service_endpoint=endpoint)
+    calls = service._ShowOCIService__load_get_calls(getattr(client, function_name), IDS, retry_strategy=oci.retry.NoneRetryStrategy())
+
+    results = {}
+    for item_id, call in calls.items():
+        try:
+            results[item_id] = str(call.result(timeout=30))
+        except oci.exceptions.ServiceError as e:
+            results[item_id] = (e.status, e.code)
+    return results
+
+
+@pytest.mark.parametrize("client_class, function_name", [
+    (oci.core.ComputeClient, "get_image"),
+    (oci.core.VirtualNetworkClient, "get_vnic")
+])
+def test_threads_and_async_results_are_equal(make_service, stub_server, monkeypatch, client_class, function_name):
+    pytest.importorskip("aiohttp")
+    endpoint = stub_server(handler)
+
+    runs = []
+    run = showocic.ShowOCIAsyncCalls.run
+    monkeypatch.setattr(showocic.ShowOCIAsyncCalls, "run", lambda self, *args, **kwargs: runs.append(args[1]) or run(self, *args, **kwargs))
+
+    threads = load_get_calls(make_service(threads_compartments=4, async_calls=0), endpoint, client_class, function_name)
+    asynchronous = load_get_calls(make_service(threads_compartments=4, async_calls=8), endpoint, client_class, function_name)
+
+    assert len(runs) == 1 and len(runs[0]) == len(threads)
+    assert list(threads) == list(dict.fromkeys(item_id for item_id in IDS if item_id))
+    assert threads["ocid1.image.oc1..missing"] == (404, "NotAuthorizedOrNotFound")
+    assert asynchronous == threads
+
+
+def test_serial_results_are_equal_to_threads(make_service, stub_server):
+    endpoint = stub_server(handler)
+
+    serial = load_get_calls(make_service(threads_compartments=1, async_calls=0), endpoint, oci.core.ComputeClient, "get_image")
+    threads = load_get_calls(make_service(threads_compartments=4, async_calls=0), endpoint, oci.core.ComputeClient, "get_image")
+
+    assert serial == threads
@@ -0,0 +1,116 @@
+##########################################################################
+# discovery of the compartments of the resources by resource search (-search)
+##########################################################################
+import pytest
+
+from conftest import REGION
+
+COMPARTMENTS = [{'id': "ocid1.compartment.oc1..c" + str(i), 'name': "c" + str(i)} for i in range(1, 5)]
+
+# first page, second page by opc-next-page
+PAGES = {
+    None: [
+        {'resourceType': "Instance", 'compartmentId': "ocid1.compartment.oc1..c1", 'identifier': "ocid1.instance.oc1..i1"},
+        {'resourceType': "Vcn", 'compartmentId': "ocid1.compartment.oc1..c2", 'identifier': "ocid1.vcn.oc1..v1"}
+    ],
+    "page2": [
+        {'resourceType': "Instance", 'compartmentId': "ocid1.compartment.oc1..c3", 'identifier': "ocid1.instance.oc1..i2"},
+        {'resourceType': "Instance", 'compartmentId': "ocid1.compartment.oc1..c1", 'identifier': "ocid1.instance.oc1..i3"}
+    ]
+}
+
+
+class StubSearch(object):
+
+    def __init__(self, status=200):
+        self.status = status
+        self.requests = []
+
+    def __call__(self, method, path, body):
+        self.requests.append((method, path, body))
+        if self.status != 200:
+            return self.status, {'code': "NotAuthorizedOrNotFound", 'message': "search not available"}
+
+        page = "page2" if "page=page2" in path else None
+        headers = {'opc-next-page': "page2"} if page is None else {}
+        return 200, {'items': PAGES[page]}, headers
+
+
+def load_search(make_service, stub_server, search, **flags):
+    service = make_service(search=True, search_endpoint=stub_server(search), **flags)
+    service._ShowOCIService__set_region_context(REGION)
+    service._ShowOCIService__load_search_compartments(REGION)
+    return service
+
+
+def load_compartments(service, resource):
+    called = []
+
+    def function(compartment):
+        called.append(compartment['id'])
+        return [compartment['name']]
+
+    results = {}
+    for compartment, future in service._ShowOCIService__load_concurrent_calls(COMPARTMENTS, function, resource=resource):
+        results[compartment['id']] = future.result()
+    return sorted(called), results
+
+
+def test_search_compartments(make_service, stub_server):
+    search = StubSearch()
+    service = load_search(make_service, stub_server, search)
+
+    assert [request[0] for request in search.requests] == ["POST", "POST"]
+    assert all(request[1].startswith("/20180409/resources?") for request in search.requests)
+    assert search.requests[0][2]['type'] == "Structured"
+    assert "Instance" in search.requests[0][2]['query'] and "Vcn" in search.requests[0][2]['query']
+
+    assert service.search_compartments == {REGION: {
+        'instance': {"ocid1.compartment.oc1..c1", "ocid1.compartment.oc1..c3"},
+        'vcn': {"ocid1.compartment.oc1..c2"}
+    }}
+
+    is_search_skipped = service._ShowOCIService__is_search_skipped
+    assert not is_search_skipped(REGION, service.C_COMPUTE_INST, "ocid1.compartment.oc1..c1")
+    assert is_search_skipped(REGION, service.C_COMPUTE_INST, "ocid1.compartment.oc1..c2")
+    assert is_search_skipped(REGION, service.C_COMPUTE_VNIC_ATTACH, "ocid1.compartment.oc1..c4")
+    assert not is_search_skipped(REGION, service.C_NETWORK_VCN, "ocid1.compartment.oc1..c2")
+
+    # resource type with no resource found in any compartment
+    assert is_search_skipped(REGION, service.C_BLOCK_VOL, "ocid1.compartment.oc1..c1")
+
+    # resource not searched or other region
+    assert not is_search_skipped(REGION, "unknown", "ocid1.compartment.oc1..c2")
+    assert not is_search_skipped("us-phoenix-1", service.C_COMPUTE_INST, "ocid1.compartment.oc1..c2")
+
+
+@pytest.mark.parametrize("threads", [1, 4])
+def test_search_skips_compartments(make_service, stub_server, threads):
+    service = load_search(make_service, stub_server, StubSearch(), threads_compartments=threads)
+
+    called, results = load_compartments(service, service.C_COMPUTE_INST)
+    assert called == ["ocid1.compartment.oc1..c1", "ocid1.compartment.oc1..c3"]
+    assert results == {
+        "ocid1.compartment.oc1..c1": ["c1"],
+        "ocid1.compartment.oc1..c2": [],
+        "ocid1.compartment.oc1..c3": ["c3"],
+        "ocid1.compartment.oc1..c4": []
+    }
+
+    # without resource all the compartments are listed
+    called, results = load_compartments(service, None)
+    assert called == [c['id'] for c in COMPARTMENTS]
+
+
+@pytest.mark.parametrize("threads", [1, 4])
+def test_search_not_available_lists_all_compartments(make_service, stub_server, capsys, threads):
+    search = StubSearch(status=404)
+    service = load_search(make_service, stub_server, search, threads_compartments=threads)
+
+    assert len(search.requests) == 1
+    assert "not available, listing all compartments, NotAuthorizedOrNotFound" in capsys.readouterr().out
+    assert service.search_compartments == {}
+
+    called, results = load_compartments(service, service.C_COMPUTE_INST)
+    assert called == [c['id'] for c in COMPARTMENTS]
+    assert results == {c['id']: [c['name']] for c in COMPARTMENTS}
@@ -0,0 +1,65 @@
+##########################################################################
+# search of the data sections by the search index
+##########################################################################
+MODULE = "network"
+SECTION = "subnet"
+
+
+def subnet(subnet_id, vcn_id, name, nsg_ids=None):
+    return {'id': subnet_id, 'vcn_id': vcn_id, 'name': name, 'nsg_ids': nsg_ids}
+
+
+def test_search_by_fields(make_service):
+    service = make_service()
+    service.data[MODULE] = {SECTION: [subnet("s1", "v1", "a"), subnet("s2", "v1", "b"), subnet("s3", "v2", "a")]}
+
+    assert [e['id'] for e in service.search_multi_items(MODULE, SECTION, 'vcn_id', "v1")] == ["s1", "s2"]
+    assert [e['id'] for e in service.search_multi_items(MODULE, SECTION, 'vcn_id', "v1", 'name', "a")] == ["s1"]
+    assert service.search_unique_item(MODULE, SECTION, 'id', "s3")['vcn_id'] == "v2"
+    assert service.search_multi_items(MODULE, SECTION, 'vcn_id', "v3") == []
+    assert service.search_multi_items(MODULE, "vcn", 'id', "v1") == []
+
+    # missing field is None on all the items
+    assert service.search_multi_items(MODULE, SECTION, 'cidr_block', "10.0.0.0/24") == []
+
+
+def test_index_is_rebuilt_after_section_write(make_service):
+    service = make_service()
+    array = [subnet("s1", "v1", "a"), subnet("s2", "v1", "b")]
+    service.data[MODULE] = {SECTION: array}
+    assert len(service.search_multi_items(MODULE, SECTION, 'vcn_id', "v1")) == 2
+
+    # items added
+    array.append(subnet("s3", "v1", "c"))
+    assert len(service.search_multi_items(MODULE, SECTION, 'vcn_id', "v1")) == 3
+
+    # item replaced by the loader, same length, version bumped on write
+    array[0] = subnet("s1", "v2", "a")
+    service._ShowOCIService__set_data_changed([SECTION])
+    assert [e['id'] for e in service.search_multi_items(MODULE, SECTION, 'vcn_id', "v1")] == ["s2", "s3"]
+    assert [e['id'] for e in service.search_multi_items(MODULE, SECTION, 'vcn_id', "v2")] == ["s1"]
+
+    # section replaced
+    service.data[MODULE][SECTION] = [subnet("s4", "v1", "d")]
+    assert [e['id'] for e in service.search_multi_items(MODULE, SECTION, 'vcn_id', "v1")] == ["s4"]
+
+
+def test_version_is_kept_per_module(make_service):
+    service = make_service()
+    service.data[MODULE] = {SECTION: []}
+    service.data["compute"] = {"instance": []}
+    service._ShowOCIService__initialize_data_key("database", SECTION)
+    service._ShowOCIService__set_data_changed([SECTION])
+
+    assert service.data_versions[(MODULE, SECTION)] == 1
+    assert service.data_versions[("database", SECTION)] == 2
+    assert ("compute", SECTION) not in service.data_versions
+
+
+def test_unhashable_values_are_searched_one_by_one(make_service):
+    service = make_service()
+    service.data[MODULE] = {SECTION: [subnet("s1", "v1", "a", ["n1"]), subnet("s2", "v1", "b", ["n2"])]}
+
+    assert [e['id'] for e in service.search_multi_items(MODULE, SECTION, 'nsg_ids', ["n2"])] == ["s2"]
+    assert [e['id'] for e in service.search_multi_items(MODULE, SECTION, 'vcn_id', ["v1"])] == []
+    assert [e['id'] for e in service.search_multi_items(MODULE, SECTION, 'vcn_id', "v1")] == ["s1", "s2"]
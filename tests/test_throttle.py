@@ -0,0 +1,97 @@
+##########################################################################
+# adaptive concurrency (AIMD) of the endpoint throttle
+##########################################################################
+import time
+
+from showocic import ShowOCIThrottle
+
+ENDPOINT = "https://iaas.us-ashburn-1.oraclecloud.com"
+
+
+def limit(throttle):
+    return throttle.endpoints[ENDPOINT]['limit']
+
+
+def run_saturated(throttle, throttled=False):
+    starts = []
+    while True:
+        start_time = throttle.acquire(ENDPOINT, wait=False)
+        if start_time is None:
+            break
+        starts.append(start_time)
+    for start_time in starts:
+        throttle.release(ENDPOINT, start_time, throttled)
+    return len(starts)
+
+
+def test_initial_limit_is_capped():
+    assert run_saturated(ShowOCIThrottle(2)) == 2
+    assert run_saturated(ShowOCIThrottle(32)) == ShowOCIThrottle.initial_limit
+
+
+def test_increase_only_when_saturated():
+    throttle = ShowOCIThrottle(32)
+
+    # released below the limit, not increased
+    throttle.release(ENDPOINT, throttle.acquire(ENDPOINT))
+    assert limit(throttle) == 4.0
+
+    # 4 in flight, the first release is at the limit
+    assert run_saturated(throttle) == 4
+    assert limit(throttle) == 4.25
+
+    # about one more slot per round of saturated calls
+    for i in range(8):
+        run_saturated(throttle)
+    assert 5.0 <= limit(throttle) < 6.0
+    assert throttle.endpoints[ENDPOINT]['max_inflight'] == int(limit(throttle))
+
+
+def test_increase_is_capped_by_max_limit():
+    throttle = ShowOCIThrottle(6)
+    for i in range(100):
+        run_saturated(throttle)
+    assert limit(throttle) == 6.0
+    assert run_saturated(throttle) == 6
+
+
+def test_decrease_once_per_window():
+    throttle = ShowOCIThrottle(32)
+    for i in range(40):
+        run_saturated(throttle)
+    before = limit(throttle)
+    assert before >= 8
+
+    # all the calls in flight were throttled, the limit is halved once
+    run_saturated(throttle, throttled=True)
+    assert limit(throttle) == before * ShowOCIThrottle.decrease
+    assert throttle.endpoints[ENDPOINT]['throttled'] == int(before)
+
+    # calls started after the decrease decrease it again
+    time.sleep(0.01)
+    throttle.release(ENDPOINT, throttle.acquire(ENDPOINT), throttled=True)
+    assert limit(throttle) == before * ShowOCIThrottle.decrease * ShowOCIThrottle.decrease
+
+
+def test_decrease_keeps_one_slot():
+    throttle = ShowOCIThrottle(32)
+    for i in range(10):
+        time.sleep(0.01)
+        throttle.release(ENDPOINT, throttle.acquire(ENDPOINT), throttled=True)
+    assert limit(throttle) == 1.0
+    assert run_saturated(throttle) == 1
+
+
+def test_history_and_report():
+    throttle = ShowOCIThrottle(32)
+    for i in range(20):
+        run_saturated(throttle)
+    run_saturated(throttle, throttled=True)
+
+    history = throttle.endpoints[ENDPOINT]['history']
+    assert history[0][1] == 4
+    assert history[-1][1] == int(limit(throttle))
+
+    report = throttle.report()
+    assert report[0] == "iaas.us-ashburn-1.oraclecloud.com"
+    assert "TooManyRequests = " + str(throttle.endpoints[ENDPOINT]['throttled']) in report[1]